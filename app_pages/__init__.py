@@ -0,0 +1,124 @@
+"""Page registry: sidebar titles mapped to lazily imported page modules.
+
+Each page module is imported the first time one of its pages is opened,
+so plotly, the ML pages and chit planning cost nothing for roles that
+never see them.
+"""
+import ast
+import importlib
+import importlib.util
+import threading
+from collections import namedtuple
+
+from profiler import get_profiler
+
+ROLES = ['Manager', 'Sales Staff', 'Customer', 'Admin']
+
+MANAGEMENT = ('Manager', 'Admin')
+SHOP_FLOOR = ('Manager', 'Sales Staff', 'Admin')
+
+Page = namedtuple('Page', ['id', 'title', 'module', 'function', 'roles'])
+
+# Sidebar order; every role sees its pages in this order
+PAGES = [
+    Page('dashboard', '📊 Dashboard', 'app_pages.dashboard', 'dashboard_page', SHOP_FLOOR),
+    Page('customers', '👥 Customers', 'app_pages.customers', 'customers_page', SHOP_FLOOR),
+    Page('inventory', '📦 Inventory', 'app_pages.inventory', 'inventory_page', MANAGEMENT),
+    Page('tax', '💰 Tax & Compliance', 'app_pages.tax', 'tax_compliance_page', MANAGEMENT),
+    Page('campaigns', '📢 Campaigns', 'app_pages.campaigns', 'campaigns_page', MANAGEMENT),
+    Page('staff_management', '👨‍💼 Staff Management', 'app_pages.staff', 'staff_management_page', MANAGEMENT),
+    Page('sales_record', '💾 Sales Record', 'app_pages.staff', 'sales_record_page', ('Sales Staff',)),
+    Page('loyalty_program', '🎁 Loyalty Program', 'app_pages.staff', 'loyalty_program_page', ('Sales Staff',)),
+    Page('quick_actions', '⚡ Quick Actions', 'app_pages.quick_actions', 'quick_actions_page', SHOP_FLOOR),
+    Page('ai_assistant', '🤖 AI Assistant', 'app_pages.assistants', 'ai_assistant_page', SHOP_FLOOR),
+    Page('smart_commands', '💬 Smart Commands', 'app_pages.assistants', 'smart_commands_page', MANAGEMENT),
+    Page('chatbot', '💬 Chatbot', 'app_pages.assistants', 'chatbot_page', SHOP_FLOOR),
+    Page('integrated_chatbot', '🔎 Integrated Chatbot', 'app_pages.assistants', 'integrated_chatbot_with_data_page', ('Sales Staff', 'Admin')),
+    Page('ml_models', '🤖 ML Models', 'app_pages.ml_models', 'show_ml_models', MANAGEMENT),
+    Page('chit_management', '💎 Chit Management', 'app_pages.chits', 'show_chit_management', MANAGEMENT),
+    Page('advanced_settings', '⚙️ Advanced Settings', 'app_pages.settings', 'show_settings_v4', MANAGEMENT),
+    Page('settings', '⚙️ Settings', 'app_pages.settings', 'settings_page', ('Admin',)),
+    Page('staff_dashboard', '👨‍💼 Staff Dashboard', 'app_pages.staff', 'staff_dashboard_page', ('Sales Staff',)),
+    Page('my_dashboard', '💎 My Dashboard', 'app_pages.customer_portal', 'customer_dashboard_page', ('Customer',)),
+    Page('my_purchases', '🛍️ My Purchases', 'app_pages.customer_portal', 'my_purchases_page', ('Customer',)),
+    Page('my_chits', '💎 My Chits', 'app_pages.customer_portal', 'my_chits_page', ('Customer',)),
+    Page('offers_rewards', '🎁 Offers & Rewards', 'app_pages.customer_portal', 'offers_rewards_page', ('Customer',)),
+    Page('my_summary', '📊 My Summary', 'app_pages.customer_portal', 'my_summary_page', ('Customer',)),
+    Page('support_chat', '💬 Support Chat', 'app_pages.customer_portal', 'support_chat_page', ('Customer',)),
+]
+
+PAGES_BY_TITLE = {page.title: page for page in PAGES}
+ROLE_PAGES = {role: [page.title for page in PAGES if role in page.roles] for role in ROLES}
+
+_renderers = {}
+_lock = threading.Lock()
+_validated = False
+
+
+def get_accessible_pages(role):
+    """Get the sidebar titles a role may open, in sidebar order"""
+    return ROLE_PAGES.get(role, [])
+
+
+def get_page(title):
+    """Get a registered page by its sidebar title (None if unknown)"""
+    return PAGES_BY_TITLE.get(title)
+
+
+def load_page(page):
+    """Get a page's render function, importing its module on first use"""
+    renderer = _renderers.get(page.id)
+    if renderer is None:
+        with _lock:
+            renderer = _renderers.get(page.id)
+            if renderer is None:
+                with get_profiler().span(f"import {page.module}"):
+                    module = importlib.import_module(page.module)
+                renderer = _renderers[page.id] = getattr(module, page.function)
+    return renderer
+
+
+def validate_registry():
+    """Check every route points at a real function, without importing the page modules
+
+    Raises ValueError listing every problem, so a dangling route stops the
+    app at startup instead of when someone first clicks it.
+    """
+    global _validated
+    if _validated:
+        return
+    problems = []
+    seen_ids, seen_titles = set(), set()
+    defined = {}
+    for page in PAGES:
+        if page.id in seen_ids:
+            problems.append(f"duplicate page id {page.id!r}")
+        if page.title in seen_titles:
+            problems.append(f"duplicate page title {page.title!r}")
+        seen_ids.add(page.id)
+        seen_titles.add(page.title)
+
+        unknown = set(page.roles) - set(ROLES)
+        if unknown:
+            problems.append(f"{page.id}: unknown roles {sorted(unknown)}")
+
+        if page.module not in defined:
+            defined[page.module] = _defined_functions(page.module)
+        if defined[page.module] is None:
+            problems.append(f"{page.id}: module {page.module} not found")
+        elif page.function not in defined[page.module]:
+            problems.append(f"{page.id}: {page.module} has no function {page.function}()")
+
+    if problems:
+        raise ValueError("Invalid page registry:\n  " + "\n  ".join(problems))
+    _validated = True
+
+
+def _defined_functions(module):
+    """Get the top-level function names a module defines, read from its source"""
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None:
+        return None
+    with open(spec.origin, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=spec.origin)
+    return {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
@@ -0,0 +1,289 @@
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import CUSTOMER_DATA, CUSTOMER_PURCHASES, PENDING_PAYMENTS, load_customers
+from customer_search import get_customer_search
+from rollups import get_sales_rollups
+
+# -------------------------------
+# AI Assistant (v5)
+# -------------------------------
+def ai_assistant_page():
+    st.markdown("<h2 class='main-title'>🤖 AI Assistant</h2>", unsafe_allow_html=True)
+    st.markdown("<div class='success-box'><strong>🤖 Jewellery Shop AI Assistant</strong><br>Get instant insights, recommendations, and automated suggestions for your jewellery business!</div>", unsafe_allow_html=True)
+    tab1, tab2, tab3 = st.tabs(["💡 Insights", "📊 Recommendations", "🔍 Analytics"])
+    with tab1:
+        st.subheader("💡 AI Business Insights")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("✅ **Sales Trend Analysis**\n- Sales trending upward by 15% this month\n- Peak sales time: 2 PM - 5 PM\n- Best selling category: Gold (45%)\n\n💡 **Recommendation:** Stock more gold items during peak hours")
+        with col2:
+            st.markdown("👥 **Customer Insights**\n- 87% customers are repeat buyers\n- Average customer lifetime value: ₹2,50,000\n- Premium tier customers spend 4x more\n\n💡 **Recommendation:** Focus on premium customer retention")
+        st.divider()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("📦 **Inventory Optimization**\n- Platinum inventory critical (8 items)\n- Silver stock high (120 items)\n- Estimated stockout: 5 days for diamonds\n\n💡 **Recommendation:** Reorder platinum immediately")
+        with col2:
+            st.markdown("💰 **Profit Analysis**\n- Average profit margin: 28%\n- Peak profit items: Diamond (35% margin)\n- Low margin items: Silver (12% margin)\n\n💡 **Recommendation:** Push diamond sales for better margins")
+    with tab2:
+        st.subheader("📊 AI Recommendations")
+        recommendations = [
+            "🎯 Launch 'Diamond Premium' campaign - predicted ROI: 320%",
+            "👥 Create loyalty program for premium customers - estimated 25% increase in repeat purchases",
+            "📦 Implement dynamic pricing for high-demand items",
+            "🌍 Expand online presence - untapped market worth ₹50L+",
+            "⏰ Shift staff schedule to peak hours - 40% efficiency gain",
+            "💳 Introduce EMI option - predicted 18% sales increase",
+        ]
+        for i, rec in enumerate(recommendations, 1):
+            col1, col2 = st.columns([0.1, 0.9])
+            with col1:
+                st.markdown(f"**{i}.**")
+            with col2:
+                st.markdown(rec)
+    with tab3:
+        st.subheader("🔍 Advanced Analytics")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("**📈 Predictive Sales Forecast**")
+            forecast_data = pd.DataFrame({"Month": ["Dec 2025", "Jan 2026", "Feb 2026", "Mar 2026"], "Predicted Sales": [65, 72, 68, 85], "Confidence": ["92%", "88%", "85%", "80%"]})
+            st.dataframe(forecast_data, hide_index=True)
+        with col2:
+            st.markdown("**👥 Customer Segmentation**")
+            segment_data = pd.DataFrame({"Segment": ["Premium", "Gold", "Silver", "Standard"], "Count": [125, 320, 580, 225], "Value": ["₹2,50L", "₹1,60L", "₹87.5L", "₹22.5L"]})
+            st.dataframe(segment_data, hide_index=True)
+
+# -------------------------------
+# Smart Commands (v5)
+# -------------------------------
+def smart_commands_page():
+    st.markdown("<h2 class='main-title'>💬 Smart Commands</h2>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class='info-box'>
+    <strong>AI Command Center</strong><br>
+    Use natural language to query data or execute actions.<br>
+    Examples:
+    <ul>
+      <li><code>alert ram about pending</code></li>
+      <li><code>show customer rajesh</code></li>
+      <li><code>purchases for rajesh</code></li>
+      <li><code>pending payments</code></li>
+      <li><code>export customers</code></li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if "smart_chat" not in st.session_state:
+        st.session_state.smart_chat = []
+
+    # Show chat history
+    for msg in st.session_state.smart_chat:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
+
+    # Input
+    prompt = st.chat_input("Enter a command or question")
+
+    if not prompt:
+        return
+
+    # Save user message
+    st.session_state.smart_chat.append({"role": "user", "content": prompt})
+    q = prompt.lower()
+
+    # -----------------------------
+    # COMMAND PARSING
+    # -----------------------------
+    response = None
+
+    # ---- STAFF ALERTS ----
+    staff = {
+        "ram": "Ram Kumar",
+        "priya": "Priya Singh",
+        "amit": "Amit Verma",
+        "neha": "Neha Sharma"
+    }
+
+    if "alert" in q or "notify" in q:
+        for key, name in staff.items():
+            if key in q:
+                response = f"🔔 Alert sent to **{name}**"
+                break
+        if "all" in q:
+            response = "📢 Alert sent to **all staff members**"
+
+    # ---- CUSTOMER LOOKUP ----
+    elif "show customer" in q:
+        cust = CUSTOMER_DATA["customer"]
+        if cust["id"].lower() in q or cust["name"].lower().split()[0] in q:
+            response = "### 👤 Customer Details"
+            st.session_state.smart_chat.append({"role": "assistant", "content": response})
+            st.dataframe(pd.DataFrame([cust]), use_container_width=True)
+            return
+        else:
+            response = "❌ Customer not found"
+
+    # ---- PURCHASES ----
+    elif "purchase" in q:
+        response = "### 🧾 Purchase History"
+        st.session_state.smart_chat.append({"role": "assistant", "content": response})
+        st.dataframe(pd.DataFrame(CUSTOMER_PURCHASES), use_container_width=True)
+        return
+
+    # ---- PENDING PAYMENTS ----
+    elif "pending" in q or "due" in q:
+        response = "### ⚠️ Pending Payments"
+        st.session_state.smart_chat.append({"role": "assistant", "content": response})
+        st.dataframe(pd.DataFrame(PENDING_PAYMENTS), use_container_width=True)
+        return
+
+    # ---- EXPORT ----
+    elif "export" in q:
+        df = pd.DataFrame([CUSTOMER_DATA["customer"]])
+        csv = df.to_csv(index=False).encode("utf-8")
+        st.download_button(
+            "⬇️ Download customers.csv",
+            data=csv,
+            file_name="customers.csv",
+            mime="text/csv"
+        )
+        response = "📥 Customer data exported"
+
+    # ---- HELP ----
+    elif "help" in q:
+        response = """
+**Available Commands**
+- alert ram / notify all staff
+- show customer <name/id>
+- purchases for <name>
+- pending payments
+- export customers
+"""
+
+    else:
+        response = "🤖 I didn’t understand that. Type `help` to see commands."
+
+    # Save response
+    st.session_state.smart_chat.append({"role": "assistant", "content": response})
+
+    st.rerun()
+
+# -------------------------------
+# Chatbot (original v5)
+# -------------------------------
+def chatbot_page():
+    st.markdown("<h2 class='main-title'>💬 Smart Chatbot</h2>", unsafe_allow_html=True)
+    st.subheader("🎯 Quick Help Topics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("📦 Purchase Help", use_container_width=True, key="cb_purchase"):
+            st.session_state.chatbot_messages = [{"role": "assistant", "content": "📦 You have 4 purchases. Latest: Gold Ring (Dec 10, ₹15,000) ✅"}]
+            st.rerun()
+    with col2:
+        if st.button("💎 Chit Support", use_container_width=True, key="cb_chit"):
+            st.session_state.chatbot_messages = [{"role": "assistant", "content": "💎 Active chits: Gold 12-Month & Diamond Savings"}]
+            st.rerun()
+    with col3:
+        if st.button("🎁 Loyalty Points", use_container_width=True, key="cb_loyalty"):
+            st.session_state.chatbot_messages = [{"role": "assistant", "content": "🎁 Gold Tier - 890 points. 100 points = ₹50 discount!"}]
+            st.rerun()
+    st.divider()
+    if st.session_state.chatbot_messages:
+        for message in st.session_state.chatbot_messages:
+            with st.chat_message(message["role"]):
+                if message["role"] == "assistant":
+                    st.markdown(f"""<div class='ai-response'>{message['content']}</div>""", unsafe_allow_html=True)
+                else:
+                    st.markdown(message["content"])
+    if prompt := st.chat_input("Ask me anything!"):
+        st.session_state.chatbot_messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+        response = "How can I help you?"
+        if any(word in prompt.lower() for word in ["purchase", "buy"]):
+            response = "📦 Your purchases are delivered!"
+        elif any(word in prompt.lower() for word in ["chit", "payment"]):
+            response = "💎 Next payment due Dec 15"
+        elif any(word in prompt.lower() for word in ["loyalty", "points"]):
+            response = "🎁 Gold tier with 890 points!"
+        st.session_state.chatbot_messages.append({"role": "assistant", "content": response})
+        st.rerun()
+
+# -------------------------------
+# Integrated Chatbot (answers from shop data)
+# -------------------------------
+def integrated_chatbot_with_data_page():
+    st.markdown("<h2 class='main-title'>🔎 Integrated Chatbot</h2>", unsafe_allow_html=True)
+    st.markdown("""
+    <div class='info-box'>
+    <strong>Ask about live shop data</strong><br>
+    Examples:
+    <ul>
+      <li><code>find priya</code> or <code>customer 98765</code></li>
+      <li><code>pending dues</code></li>
+      <li><code>sales this month</code></li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if "integrated_chat" not in st.session_state:
+        st.session_state.integrated_chat = []
+
+    for msg in st.session_state.integrated_chat:
+        with st.chat_message(msg["role"]):
+            st.markdown(msg["content"])
+            if msg.get("table") is not None:
+                st.dataframe(pd.DataFrame(msg["table"]), use_container_width=True, hide_index=True)
+
+    prompt = st.chat_input("Ask about customers, dues or sales")
+    if not prompt:
+        return
+
+    st.session_state.integrated_chat.append({"role": "user", "content": prompt})
+    q = prompt.lower().strip()
+    table = None
+
+    if q.startswith(("find ", "customer ", "search ")):
+        query = prompt.split(maxsplit=1)[1]
+        customers_df = load_customers()
+        matches = customers_df.iloc[get_customer_search().ranked_rows(query, customers_df)[:5]]
+        if len(matches):
+            response = f"### 👤 Best matches for “{query}”"
+            table = matches[["name", "phone", "total_spent", "pending_amount", "tier"]].to_dict("records")
+        else:
+            response = f"❌ No customer matches “{query}”"
+
+    elif "pending" in q or "due" in q:
+        customers_df = load_customers()
+        pending_df = customers_df[customers_df["pending_amount"] > 0].nlargest(10, "pending_amount")
+        response = f"### ⚠️ Pending dues: ₹{int(customers_df['pending_amount'].sum()):,} across {int((customers_df['pending_amount'] > 0).sum())} customers"
+        table = pending_df[["name", "phone", "pending_amount", "last_visit"]].to_dict("records")
+
+    elif "sales" in q or "revenue" in q:
+        rollups = get_sales_rollups()
+        months = rollups.monthly_summary()
+        if months.empty:
+            response = "ℹ️ No sales recorded yet"
+        else:
+            latest = months.iloc[-1]
+            response = (
+                f"### 💰 Sales\n"
+                f"- {latest['month']}: ₹{int(latest['total_sales']):,} from {int(latest['total_transactions']):,} transactions\n"
+                f"- All time: ₹{int(rollups.totals()['total_sales']):,}"
+            )
+            table = months.tail(6)[["month", "total_sales", "total_transactions", "total_customers"]].to_dict("records")
+
+    elif "help" in q:
+        response = """
+**Available Questions**
+- find <name / phone / email>
+- pending dues
+- sales this month
+"""
+
+    else:
+        response = "🤖 I didn’t understand that. Type `help` to see what I can answer."
+
+    st.session_state.integrated_chat.append({"role": "assistant", "content": response, "table": table})
+    st.rerun()
@@ -0,0 +1,232 @@
+import pandas as pd
+import streamlit as st
+
+from audience import campaign_query, get_audience_index, offer_query
+from currency import format_rupee
+from data_store import get_store
+from dispatch import CHANNEL_LABELS, get_dispatcher, queue_messages
+from profiler import get_profiler
+from tables import paged_table
+
+# -------------------------------
+# Campaigns page (v5)
+# -------------------------------
+def campaigns_page():
+    st.markdown("<h2 class='main-title'>📢 Campaigns</h2>", unsafe_allow_html=True)
+
+    tab_create, tab_active, tab_reports = st.tabs(
+        ["Create Campaign", "Active Campaigns", "Campaign Reports"]
+    )
+
+    # ==========================
+    # CREATE CAMPAIGN
+    # ==========================
+    with tab_create:
+        st.subheader("Create New Campaign")
+
+        # Campaign basic info
+        campaign_name = st.text_input("Campaign Name", placeholder="e.g. Diwali 2025")
+
+        campaign_type = st.selectbox(
+            "Campaign Type",
+            ["Payment Reminder", "Festival Offer", "VIP Exclusive", "Clearance Sale"]
+        )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input("Start Date")
+        with col2:
+            end_date = st.date_input("End Date")
+
+        st.divider()
+
+        # Target audience
+        st.markdown("### Target Audience")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            target_vip = st.checkbox("Target VIP Customers", value=True)
+        with col2:
+            target_regular = st.checkbox("Target Regular Customers", value=True)
+        with col3:
+            target_dormant = st.checkbox("Target Dormant Customers")
+
+        st.divider()
+
+        # Message content
+        st.markdown("### Message Content")
+        message = st.text_area(
+            "Campaign Message",
+            height=120,
+            value="Hi {first_name}! 👋\n\nWe have an exciting offer for you: {discount}% off on purchases above {min_purchase}.\n\nCome visit us today!"
+        )
+        st.caption("Placeholders: {name}, {first_name}, {tier}, {pending_amount}, {discount}, {min_purchase}, {campaign}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            discount = st.slider("Discount Percentage", 0, 50, 10)
+        with col2:
+            min_purchase = st.number_input(
+                "Minimum Purchase Amount",
+                min_value=0,
+                step=1000,
+                value=10000
+            )
+
+        st.divider()
+
+        # Audience: exact recipients from the audience index's bitmaps
+        st.markdown("### Audience Preview")
+        segments = [label for label, chosen in [("VIP", target_vip), ("Regular", target_regular), ("Dormant", target_dormant)] if chosen]
+        with get_profiler().span("campaign audience"):
+            index = get_audience_index()
+            query = campaign_query(campaign_type, segments, min_purchase)
+            audience = index.select(query)
+            recipients = len(audience)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Recipients", f"{recipients:,}")
+        with col2:
+            st.metric("Share of Customers", f"{recipients / (index.size or 1):.0%}")
+
+        offers = get_store().get("offers")
+        if len(offers) > 0:
+            overlap = [len(audience & index.select(offer_query(applicable_to))) for applicable_to in offers["applicable_to"].tolist()]
+            overlap_df = pd.DataFrame({
+                "Campaign": offers["name"],
+                "Valid": offers["valid_from"].dt.strftime("%Y-%m-%d") + " – " + offers["valid_to"].dt.strftime("%Y-%m-%d"),
+                "Runs Alongside": (offers["valid_from"].dt.date <= end_date) & (offers["valid_to"].dt.date >= start_date),
+                "Also Targeted": overlap,
+                "Overlap": [f"{count / recipients:.0%}" if recipients else "-" for count in overlap],
+            })
+            st.caption("Recipients of this campaign who are also in each existing campaign's audience")
+            st.dataframe(overlap_df, use_container_width=True, hide_index=True)
+
+        with st.expander(f"👥 View recipients ({recipients:,})"):
+            paged_table(
+                index.features, ["name", "phone", "tier", "segment", "total_purchased", "pending_amount", "recency_days"],
+                key="campaign_recipients", rows=audience.positions(), currency=("total_purchased", "pending_amount"),
+                labels={"name": "Name", "phone": "Phone", "tier": "Tier", "segment": "Segment", "total_purchased": "Total Purchased",
+                        "pending_amount": "Pending", "recency_days": "Days Since Visit"},
+            )
+
+        st.divider()
+
+        # Channels
+        st.markdown("### Channel")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            ch_whatsapp = st.checkbox("WhatsApp", value=True)
+        with col2:
+            ch_email = st.checkbox("Email")
+        with col3:
+            ch_sms = st.checkbox("SMS")
+
+        st.divider()
+
+        # Launch
+        if st.button("🚀 Launch Campaign", use_container_width=True):
+            if not (ch_whatsapp or ch_email or ch_sms):
+                st.error("Please select at least one channel")
+            elif recipients == 0:
+                st.error("No customers match this audience")
+            else:
+                title = campaign_name or campaign_type
+                channels = [channel for channel, chosen in [("whatsapp", ch_whatsapp), ("email", ch_email), ("sms", ch_sms)] if chosen]
+                queue_messages(
+                    index.recipients(query), message, title, channels, subject=title,
+                    fields={"discount": discount, "min_purchase": format_rupee(min_purchase), "campaign": title},
+                )
+                st.info(
+                    f"""
+                    **Summary**
+                    - Campaign: {campaign_name or campaign_type}
+                    - Recipients: {recipients:,}
+                    - Discount: {discount}%
+                    - Min Purchase: {format_rupee(min_purchase)}
+                    - Channels: {', '.join([c for c, v in {
+                        'WhatsApp': ch_whatsapp,
+                        'Email': ch_email,
+                        'SMS': ch_sms
+                    }.items() if v])}
+                    """
+                )
+
+    # ==========================
+    # ACTIVE CAMPAIGNS
+    # ==========================
+    with tab_active:
+        st.subheader("Active Campaigns")
+
+        active_df = pd.DataFrame({
+            "Campaign": ["Diwali Sale", "VIP Reminder", "Wedding Season"],
+            "Type": ["Festival Offer", "Payment Reminder", "Seasonal"],
+            "Start Date": ["2025-10-15", "2025-12-01", "2025-11-20"],
+            "End Date": ["2025-11-15", "2025-12-31", "2026-03-31"],
+            "Discount": ["20%", "-", "15%"],
+            "Channel": ["WhatsApp", "WhatsApp + SMS", "Email"],
+            "Status": ["🟢 Active", "🟢 Active", "🟢 Active"]
+        })
+
+        st.dataframe(active_df, use_container_width=True, hide_index=True)
+
+        st.subheader("📤 Message Dispatch")
+        jobs = get_dispatcher().jobs()
+        if len(jobs) > 0:
+            jobs_df = pd.DataFrame({
+                "Campaign": jobs["name"],
+                "Channel": jobs["channel"].map(CHANNEL_LABELS) + jobs["simulated"].map({True: " (test)", False: ""}),
+                "Queued": jobs["created"],
+                "Sent": jobs["sent"],
+                "Failed": jobs["failed"],
+                "Remaining": jobs["remaining"],
+                "Progress": (jobs["sent"] + jobs["failed"]) / jobs["total"].clip(lower=1),
+                "Status": jobs["status"],
+                "Note": jobs["error"].fillna(""),
+            })
+            st.dataframe(
+                jobs_df, use_container_width=True, hide_index=True,
+                column_config={"Progress": st.column_config.ProgressColumn("Progress", min_value=0, max_value=1)},
+            )
+            waiting = jobs[jobs["status"] == "waiting"]
+            if len(waiting) > 0:
+                channels = ", ".join(sorted(waiting["channel"].map(CHANNEL_LABELS).unique()))
+                st.warning(
+                    f"⏸️ {len(waiting)} job(s) waiting for {channels}: the channel is not configured in this run of the app. "
+                    "Connect it again under Settings (connections made there last until a restart) or set its "
+                    "JEWELLERY_* environment variables, and these jobs start sending where they left off."
+                )
+            sending = jobs[jobs["status"].isin(["sending", "waiting"])]
+            if len(sending) > 0:
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    labels = dict(zip(sending["name"] + " · " + sending["channel"].map(CHANNEL_LABELS) + " · " + sending["created"], sending["id"]))
+                    job_label = st.selectbox("Job", list(labels), key="dispatch_cancel_job")
+                with col2:
+                    if st.button("⏹️ Cancel Job"):
+                        get_dispatcher().cancel(labels[job_label])
+                        st.success("✅ Job cancelled")
+            st.button("🔄 Refresh")
+        else:
+            st.info("ℹ️ No messages queued yet")
+
+    # ==========================
+    # CAMPAIGN REPORTS
+    # ==========================
+    with tab_reports:
+        st.subheader("Campaign Performance")
+
+        report_df = pd.DataFrame({
+            "Campaign": ["Diwali Sale", "VIP Reminder"],
+            "Sent": [1250, 320],
+            "Responses": [340, 190],
+            "Conversions": [180, 95],
+            "Revenue Generated": ["₹12,50,000", "₹6,80,000"]
+        })
+
+        st.dataframe(report_df, use_container_width=True, hide_index=True)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Revenue", "₹19,30,000")
+        with col2:
+            st.metric("Avg Conversion Rate", "28%")
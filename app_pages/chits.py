@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from charts import figure, plotly_chart
+from chit_ledger import get_chit_ledger
+from chit_simulation import SIMULATION_MONTHS, SIMULATION_RUNS, simulate_draws
+from currency import format_rupee, format_rupees
+from profiler import get_profiler
+from write_log import get_write_log
+
+UPCOMING_DAYS = 60
+STOCK_LABELS = {"premium": "Premium rings/necklaces", "regular": "Regular bangles/sets", "light": "Light earrings/pendants"}
+
+def _liability_figure(liability):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=liability["month"], y=liability["liability_p95"], fill=None, mode="lines", name="95th percentile"))
+    fig.add_trace(go.Scatter(x=liability["month"], y=liability["liability_p5"], fill="tonexty", mode="lines", name="5th percentile"))
+    fig.add_trace(go.Scatter(x=liability["month"], y=liability["liability_p50"], mode="lines", name="Median"))
+    fig.update_layout(yaxis_title="Net payout (₹)")
+    return fig
+
+# -------------------------------
+# Chit Fund Management page (v4 feature)
+# -------------------------------
+def show_chit_management():
+    st.markdown("<h2 class='main-title'>💎 Chit Fund Management</h2>", unsafe_allow_html=True)
+    with get_profiler().span("load chit ledger"):
+        ledger = get_chit_ledger(write_log=get_write_log())
+    # One binary-searched window serves both tabs
+    upcoming = ledger.upcoming(UPCOMING_DAYS)
+    tab1, tab2, tab3 = st.tabs(["Chit Schedule", "Pre-Order Planning", "Chit Ledger"])
+    with tab1:
+        st.subheader(f"Upcoming Chit Payouts (Next {UPCOMING_DAYS} Days)")
+        st.metric("Upcoming Payouts", len(upcoming))
+        if len(upcoming) > 0:
+            display_df = upcoming[["chit_name", "payout_date", "draw", "payout_amount", "expected_spending"]].copy()
+            display_df["payout_date"] = display_df["payout_date"].dt.date
+            display_df["payout_amount"] = format_rupees(display_df["payout_amount"])
+            display_df["expected_spending"] = format_rupees(display_df["expected_spending"])
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
+            total_expected = upcoming["expected_spending"].sum()
+            st.metric("Total Expected Orders", format_rupee(total_expected))
+        else:
+            st.info("ℹ️ No upcoming chit payouts")
+    with tab2:
+        st.subheader("🛍️ Pre-Order Recommendations")
+        if len(upcoming) > 0:
+            st.info(f"Pre-book inventory for {len(upcoming)} upcoming chit payouts")
+            buckets = ledger.spend_buckets(UPCOMING_DAYS)["expected_spending"]
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Premium Designs", format_rupee(buckets["premium"]))
+            with col2:
+                st.metric("Regular Designs", format_rupee(buckets["regular"]))
+            with col3:
+                st.metric("Light Designs", format_rupee(buckets["light"]))
+            if st.button("📋 Generate Pre-Order List"):
+                with st.spinner(f"Simulating {SIMULATION_RUNS:,} runs of the next {SIMULATION_MONTHS} months..."):
+                    with get_profiler().span("simulate chit draws"):
+                        st.session_state.chit_forecast = simulate_draws(ledger)
+            forecast = st.session_state.get("chit_forecast")
+            if forecast is not None:
+                demand = forecast.demand
+                st.success("✅ Pre-order list generated")
+                stock = "\n".join(
+                    f"- {STOCK_LABELS[tier]}: {int(np.ceil(demand.at[tier, 'pieces_p50']))}-{int(np.ceil(demand.at[tier, 'pieces_p95']))} pieces"
+                    for tier in ["premium", "regular", "light"]
+                )
+                st.markdown(f"**Recommended Stock** (median to 95th percentile, next {SIMULATION_MONTHS} months):\n{stock}")
+                demand_df = pd.DataFrame({
+                    "Designs": [STOCK_LABELS[tier] for tier in demand.index],
+                    "Spend (5th pct)": format_rupees(demand["spend_p5"]).tolist(),
+                    "Spend (median)": format_rupees(demand["spend_p50"]).tolist(),
+                    "Spend (95th pct)": format_rupees(demand["spend_p95"]).tolist(),
+                })
+                st.dataframe(demand_df, use_container_width=True, hide_index=True)
+
+                st.subheader("📉 Monthly Payout Liability")
+                liability = forecast.liability.reset_index()
+                plotly_chart(figure("chit_liability", lambda: _liability_figure(liability), liability))
+                st.metric("Worst-Month Net Payout (95th pct)", format_rupee(liability["liability_p95"].max()))
+                st.caption(f"{forecast.runs:,} runs · seed {forecast.seed} · payouts less installments collected")
+        else:
+            st.info(f"ℹ️ No upcoming chit payouts in next {UPCOMING_DAYS} days")
+    with tab3:
+        st.subheader("📒 Collections by Chit")
+        totals = ledger.totals()
+        ledger_df = pd.DataFrame({
+            "Chit": totals["name"],
+            "Schedule": totals["draw_schedule"],
+            "Members": totals["members"],
+            "Collected": format_rupees(totals["amount_paid"]),
+            "Remaining": format_rupees(totals["amount_remaining"]),
+        })
+        st.dataframe(ledger_df, use_container_width=True, hide_index=True)
+
+        st.subheader("💳 Post Installment")
+        chit_ids = dict(zip(totals["name"].tolist(), totals["id"].tolist()))
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            chit_id = chit_ids[st.selectbox("Chit", list(chit_ids), key="installment_chit")]
+        members = ledger.chit_members(chit_id)
+        with col2:
+            customer_id = st.selectbox("Member (customer ID)", members["customer_id"].tolist(), key="installment_member")
+        with col3:
+            amount = st.number_input("Amount (₹)", min_value=0, value=int(totals.loc[totals["id"] == chit_id, "monthly_payment"].iloc[0]), step=1000)
+        if st.button("💳 Post Installment") and customer_id is not None:
+            try:
+                ledger.post_installment(chit_id, customer_id, amount, write_log=get_write_log())
+            except ValueError as error:
+                st.error(f"❌ {error}")
+            else:
+                st.success(f"✅ Posted {format_rupee(amount)} for customer {customer_id}")
+        if customer_id is not None:
+            balance = ledger.balance(chit_id, customer_id)
+            st.caption(f"Paid {format_rupee(balance['amount_paid'])} · Remaining {format_rupee(balance['amount_remaining'])}")
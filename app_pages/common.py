@@ -0,0 +1,64 @@
+# Sample data and shop data loaders shared by several pages
+
+from audience import get_customer_overview
+from profiler import profiled
+
+# -------------------------------
+# LIVE MARKET DATA
+# -------------------------------
+TODAY_RATES = {
+    "gold": {"current": 7850, "previous": 7800, "change": 50, "change_percent": 0.64, "currency": "₹", "unit": "per gram"},
+    "silver": {"current": 95, "previous": 92, "change": 3, "change_percent": 3.26, "currency": "₹", "unit": "per gram"},
+}
+
+# -------------------------------
+# CUSTOMER DATA (single sample) - keep as-is
+# -------------------------------
+CUSTOMER_DATA = {
+    "customer": {
+        "name": "Rajesh Sharma",
+        "id": "CUST001",
+        "email": "rajesh.sharma@email.com",
+        "phone": "+91-98765-43210",
+        "joining_date": "2023-03-15",
+        "tier": "Gold",
+        "loyalty_points": 850,
+        "total_purchases": 12,
+        "total_spent": 500000,
+        "pending_amount": 45000,
+        "last_purchase": "2025-12-08",
+    }
+}
+
+CUSTOMER_PURCHASES = [
+    {"date": "2025-12-08", "item": "Gold Ring", "purity": "22K", "weight": "5.2g", "amount": 45000, "status": "Delivered"},
+    {"date": "2025-11-25", "item": "Silver Bracelet", "purity": "92.5%", "weight": "45g", "amount": 8500, "status": "Delivered"},
+    {"date": "2025-11-15", "item": "Gold Necklace", "purity": "18K", "weight": "12.5g", "amount": 85000, "status": "Delivered"},
+    {"date": "2025-10-30", "item": "Diamond Pendant", "purity": "Diamond", "weight": "0.5ct", "amount": 120000, "status": "Delivered"},
+    {"date": "2025-10-10", "item": "Gold Earrings", "purity": "22K", "weight": "3.5g", "amount": 28000, "status": "Delivered"},
+]
+
+PENDING_PAYMENTS = [
+    {"item": "Gold Bangles (Wedding Set)", "amount": 45000, "due_date": "2025-12-15", "status": "Pending Payment"},
+]
+
+CAMPAIGN_NOTIFICATIONS = [
+    {"title": "🎄 Christmas Special Offer", "discount": "20% OFF", "description": "Get 20% discount on all gold items", "valid": "Till Dec 31, 2025", "status": "Active"},
+    {"title": "💒 Wedding Season Sale", "discount": "15% OFF", "description": "Special discount on bridal collections", "valid": "Till Mar 31, 2026", "status": "Active"},
+    {"title": "✨ New Year New Look", "discount": "25% OFF", "description": "Exclusive offers on selected items", "valid": "Dec 25 - Jan 15", "status": "Upcoming"},
+    {"title": "🎁 Loyalty Rewards Program", "discount": "Extra Points", "description": "Earn 5X loyalty points on purchases", "valid": "Ongoing", "status": "Active"},
+]
+
+STAFF_MEMBERS = {
+    "ram": {"name": "Ram Kumar", "position": "Sales Executive", "pending": "₹15,000"},
+    "priya": {"name": "Priya Singh", "position": "Manager", "pending": "₹8,500"},
+    "amit": {"name": "Amit Verma", "position": "Sales Associate", "pending": "₹12,000"},
+    "neha": {"name": "Neha Sharma", "position": "Cashier", "pending": "₹5,500"},
+}
+
+# -------------------------------
+# Shop data (shared data store, cached per process)
+# -------------------------------
+@profiled("load customers")
+def load_customers():
+    return get_customer_overview()
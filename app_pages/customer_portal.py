@@ -0,0 +1,180 @@
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import CAMPAIGN_NOTIFICATIONS, CUSTOMER_DATA, CUSTOMER_PURCHASES, PENDING_PAYMENTS, TODAY_RATES
+
+# -------------------------------
+# Customer Dashboard (v5)
+# -------------------------------
+def customer_dashboard_page():
+    st.markdown("<h2 class='main-title'>💎 My Dashboard</h2>", unsafe_allow_html=True)
+    customer = CUSTOMER_DATA["customer"]
+    st.markdown(
+        f"""
+    <div class='info-box'>
+    <strong>👋 Welcome, {customer['name']}!</strong><br>
+    <strong>Member Since:</strong> {customer['joining_date']} | 
+    <strong>Status:</strong> {customer['tier']} Tier | 
+    <strong>Loyalty Points:</strong> ⭐ {customer['loyalty_points']}
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+    st.divider()
+
+    st.subheader("💰 Today's Live Market Rates")
+    col1, col2 = st.columns(2)
+    with col1:
+        gold = TODAY_RATES["gold"]
+        change_color = "🟢" if gold["change"] >= 0 else "🔴"
+        st.markdown(
+            f"""
+        <div class='gold-box'>
+            <h3>💛 GOLD</h3>
+            <h2>₹{gold['current']}/{gold['unit']}</h2>
+            <p>{change_color} {gold['currency']}{gold['change']} ({gold['change_percent']:.2f}%)</p>
+            <small>Previous: ₹{gold['previous']}</small><br>
+            <small>Last Updated: {datetime.now().strftime('%H:%M:%S')}</small>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+    with col2:
+        silver = TODAY_RATES["silver"]
+        change_color = "🟢" if silver["change"] >= 0 else "🔴"
+        st.markdown(
+            f"""
+        <div class='silver-box'>
+            <h3>🤍 SILVER</h3>
+            <h2>₹{silver['current']}/{silver['unit']}</h2>
+            <p>{change_color} {silver['currency']}{silver['change']} ({silver['change_percent']:.2f}%)</p>
+            <small>Previous: ₹{silver['previous']}</small><br>
+            <small>Last Updated: {datetime.now().strftime('%H:%M:%S')}</small>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+    st.divider()
+
+    st.subheader("📊 Your Account Summary")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("💰 Total Spent", f"₹{customer['total_spent']:,}", f"₹{customer['total_spent']//12:,.0f}/year")
+    with col2:
+        st.metric("🛍️ Purchases", f"{customer['total_purchases']}", f"Last: {customer['last_purchase']}")
+    with col3:
+        st.metric("⭐ Loyalty Points", f"{customer['loyalty_points']}", "100pts = ₹50")
+    with col4:
+        st.metric("💎 Your Tier", customer["tier"], "Premium Member")
+
+    st.divider()
+    st.subheader("🛍️ Your Purchase History")
+    purchases_df = pd.DataFrame(CUSTOMER_PURCHASES)
+    purchases_df = purchases_df[["date", "item", "purity", "weight", "amount", "status"]]
+    purchases_df.columns = ["Date", "Item", "Purity", "Weight", "Amount (₹)", "Status"]
+    st.dataframe(purchases_df, use_container_width=True, hide_index=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Purchases", f"{len(CUSTOMER_PURCHASES)}", "items")
+    with col2:
+        total_amount = sum([p["amount"] for p in CUSTOMER_PURCHASES])
+        st.metric("Total Amount", f"₹{total_amount:,}", "all purchases")
+    with col3:
+        avg_amount = total_amount // len(CUSTOMER_PURCHASES)
+        st.metric("Average Purchase", f"₹{avg_amount:,}", "per transaction")
+
+    st.divider()
+    st.subheader("⚠️ Pending Payments")
+    if PENDING_PAYMENTS:
+        for payment in PENDING_PAYMENTS:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.markdown(f"**Item:** {payment['item']}")
+            with col2:
+                st.markdown(f"**Amount:** ₹{payment['amount']:,}")
+            with col3:
+                st.markdown(f"**Due Date:** {payment['due_date']}")
+            with col4:
+                st.markdown(f"**Status:** 🔴 {payment['status']}")
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("💳 Pay Now", use_container_width=True, key=f"pay_{payment['item']}"):
+                    st.success(f"✅ Payment of ₹{payment['amount']:,} processed successfully!")
+            with col2:
+                if st.button("📅 Schedule Payment", use_container_width=True, key=f"schedule_{payment['item']}"):
+                    st.info("📅 Payment scheduled for " + payment["due_date"])
+            st.divider()
+    else:
+        st.success("✅ No pending payments! You're all caught up!")
+
+    st.divider()
+    st.subheader("🎯 Active Campaign Notifications")
+    st.markdown(
+        """
+    <div class='info-box'>
+    <strong>🎉 You have 4 active offers & campaigns!</strong><br>
+    Browse the latest deals tailored for Gold tier members like you.
+    </div>
+    """,
+        unsafe_allow_html=True,
+    )
+    for campaign in CAMPAIGN_NOTIFICATIONS:
+        st.markdown(
+            f"""
+        <div class='campaign-notification'>
+            <h4>{campaign['title']}</h4>
+            <strong style='color: #ffd700; font-size: 1.2rem;'>{campaign['discount']}</strong><br>
+            📝 {campaign['description']}<br>
+            ⏰ <small>Valid: {campaign['valid']}</small> | 
+            <strong style='color: #7cb342;'>✅ {campaign['status']}</strong>
+        </div>
+        """,
+            unsafe_allow_html=True,
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button(f"🔖 Learn More", use_container_width=True, key=f"learn_{campaign['title']}"):
+                st.info(f"📌 {campaign['title']}: {campaign['description']}")
+        with col2:
+            if st.button(f"🛍️ Shop Now", use_container_width=True, key=f"shop_{campaign['title']}"):
+                st.success("✅ Redirecting to shop... (in app)")
+        st.divider()
+
+# -------------------------------
+# Customer pages (v5)
+# -------------------------------
+def my_purchases_page():
+    st.markdown("<h2 class='main-title'>🛍️ My Purchases</h2>", unsafe_allow_html=True)
+    purchases_df = pd.DataFrame(CUSTOMER_PURCHASES)
+    st.dataframe(purchases_df, use_container_width=True, hide_index=True)
+
+def my_chits_page():
+    st.markdown("<h2 class='main-title'>💎 My Chits</h2>", unsafe_allow_html=True)
+    chits_df = pd.DataFrame({"Chit Name": ["Gold 12-Month", "Diamond Savings"], "Amount": ["₹1,00,000", "₹2,00,000"], "Status": ["✅ Active", "✅ Active"], "Next Payment": ["2026-01-15", "2026-02-15"]})
+    st.dataframe(chits_df, use_container_width=True, hide_index=True)
+
+def offers_rewards_page():
+    st.markdown("<h2 class='main-title'>🎁 Offers & Rewards</h2>", unsafe_allow_html=True)
+    st.info("🎉 **Active Offers:**\n- 15% Wedding Discount\n- 30% Clearance Sale\n- Free Maintenance")
+
+def my_summary_page():
+    st.markdown("<h2 class='main-title'>📊 My Summary</h2>", unsafe_allow_html=True)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("💰 Total Spent", "₹5,00,000", "Premium")
+    with col2:
+        st.metric("🛍️ Purchases", "12", "+2")
+    with col3:
+        st.metric("💎 Active Chits", "2", "₹3L")
+    with col4:
+        st.metric("⭐ Loyalty Tier", "Gold", "🏆")
+
+def support_chat_page():
+    st.markdown("<h2 class='main-title'>💬 Support Chat</h2>", unsafe_allow_html=True)
+    st.markdown("<div class='success-box'><strong>📞 24/7 Customer Support</strong><br>We're here to help!</div>", unsafe_allow_html=True)
+    if prompt := st.chat_input("How can we help?"):
+        st.chat_message("user").write(prompt)
+        st.chat_message("assistant").write("Thank you! We'll respond soon.")
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+import numpy as np
+import streamlit as st
+
+from app_pages.common import load_customers
+from currency import format_rupee
+from customer_search import get_customer_search
+from dispatch import queue_messages
+from tables import paged_table
+
+VIP_OFFER_MESSAGE = "Hi {first_name}! ✨ As one of our VIP customers you get first look at our new collection, with an exclusive offer. Visit us this week!"
+PAYMENT_REMINDER_MESSAGE = "Hi {first_name}, a gentle reminder that {pending_amount} is pending on your account. Please visit us or reply to arrange payment. Thank you!"
+
+# -------------------------------
+# Customers page (v5)
+# -------------------------------
+def customers_page():
+    st.markdown("<h2 class='main-title'>👥 Customers</h2>", unsafe_allow_html=True)
+
+    # -----------------------------
+    # Load customer data
+    # -----------------------------
+    customers_df = load_customers()
+
+    # -----------------------------
+    # Tabs (like your screenshot)
+    # -----------------------------
+    tab_all, tab_risk, tab_vip, tab_pending = st.tabs(
+        ["All Customers", "At Risk", "VIP Management", "Pending Customers"]
+    )
+
+    # -----------------------------
+    # Search & Filter Row
+    # -----------------------------
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        search = st.text_input("🔍 Search by name, phone, username or email", placeholder="Type name, phone or email...")
+
+    with col2:
+        segment_filter = st.selectbox("Filter by Segment", ["All", "VIP", "Regular", "Dormant"])
+
+    # -----------------------------
+    # Apply Filters (row positions / masks, nothing copied)
+    # -----------------------------
+    rows = None
+
+    if search:
+        # Ranked best match first; misspelt names still find their customer
+        rows = get_customer_search().ranked_rows(search, customers_df)
+
+    if segment_filter != "All":
+        in_segment = (customers_df["segment"] == segment_filter).to_numpy()
+        rows = np.flatnonzero(in_segment) if rows is None else rows[in_segment[rows]]
+
+    # -----------------------------
+    # KPI METRICS (Top Row)
+    # -----------------------------
+    pending = customers_df["pending_amount"].to_numpy()
+    spent = customers_df["total_spent"].to_numpy()
+    total_found = len(customers_df) if rows is None else len(rows)
+    total_pending = int(pending.sum(dtype=np.int64) if rows is None else pending[rows].sum(dtype=np.int64))
+    total_spent = int(spent.sum(dtype=np.int64) if rows is None else spent[rows].sum(dtype=np.int64))
+
+    k1, k2, k3 = st.columns(3)
+    with k1:
+        st.metric("Total Found", total_found)
+    with k2:
+        st.metric("Total Pending", format_rupee(total_pending))
+    with k3:
+        st.metric("Total Spent", format_rupee(total_spent))
+
+    st.divider()
+
+    # =============================
+    # TAB 1: ALL CUSTOMERS
+    # =============================
+    with tab_all:
+        paged_table(
+            customers_df,
+            ["name", "phone", "email", "total_spent", "pending_amount", "tier"],
+            key="customers_all",
+            rows=rows,
+            currency=["total_spent", "pending_amount"],
+            sort_by=None if search else "total_spent",
+            ascending=False,
+            unsorted="Best match" if search else None,
+        )
+
+    # =============================
+    # TAB 2: AT RISK (FIXED)
+    # =============================
+    with tab_risk:
+        days_since_visit = (np.datetime64(datetime.now()) - customers_df["last_visit"].to_numpy()) // np.timedelta64(1, "D")
+        risk_mask = (pending > 50000) | (days_since_visit > 120)
+
+        st.warning(f"⚠️ {int(risk_mask.sum())} customers at risk")
+
+        paged_table(
+            customers_df,
+            ["name", "phone", "pending_amount", "last_visit", "tier"],
+            key="customers_risk",
+            rows=risk_mask,
+            currency=["pending_amount"],
+            sort_by="pending_amount",
+            ascending=False,
+        )
+
+    # =============================
+    # TAB 3: VIP MANAGEMENT
+    # =============================
+    with tab_vip:
+        vip_mask = (customers_df["segment"] == "VIP").to_numpy()
+
+        st.success(f"⭐ VIP Customers: {int(vip_mask.sum())}")
+
+        paged_table(
+            customers_df,
+            ["name", "phone", "total_spent", "pending_amount", "last_visit"],
+            key="customers_vip",
+            rows=vip_mask,
+            currency=["total_spent", "pending_amount"],
+            sort_by="total_spent",
+            ascending=False,
+        )
+
+        if st.button("🎁 Send VIP Offer"):
+            queue_messages(customers_df[vip_mask], VIP_OFFER_MESSAGE, "VIP Offer")
+
+    # =============================
+    # TAB 4: PENDING CUSTOMERS
+    # =============================
+    with tab_pending:
+        pending_mask = pending > 0
+
+        st.info(f"💰 Customers with pending payments: {int(pending_mask.sum())}")
+
+        paged_table(
+            customers_df,
+            ["name", "phone", "pending_amount", "tier", "last_visit"],
+            key="customers_pending",
+            rows=pending_mask,
+            currency=["pending_amount"],
+            sort_by="pending_amount",
+            ascending=False,
+        )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("📩 Send Payment Reminder"):
+                queue_messages(customers_df[pending_mask], PAYMENT_REMINDER_MESSAGE, "Payment Reminder")
+        with col2:
+            if st.button("⬇️ Export Pending CSV"):
+                pending_df = customers_df[pending_mask]
+                csv = pending_df.to_csv(index=False).encode("utf-8")
+                st.download_button(
+                    "Download pending_customers.csv",
+                    data=csv,
+                    file_name="pending_customers.csv",
+                    mime="text/csv",
+                )
@@ -0,0 +1,46 @@
+import time
+
+import streamlit as st
+
+from charts import chart, plotly_chart, time_series_chart
+from dashboard_kpis import KPI_TTL_SECONDS, get_kpi_snapshot
+from profiler import get_profiler
+
+# -------------------------------
+# Dashboard page (v5)
+# -------------------------------
+def dashboard_page():
+    st.markdown("<h2 class='main-title'>📊 Dashboard</h2>", unsafe_allow_html=True)
+    with get_profiler().span("load KPI snapshot"):
+        snapshot = get_kpi_snapshot()
+    columns = st.columns(len(snapshot["tiles"]))
+    for column, tile in zip(columns, snapshot["tiles"]):
+        with column:
+            st.metric(tile["label"], tile["value"], tile["delta"], help=f"Computed in {tile['ms']:.1f} ms")
+    age = time.monotonic() - snapshot["built_at"]
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.caption(f"KPI snapshot built in {snapshot['build_ms']:.0f} ms, {age:.0f}s ago (refreshes every {KPI_TTL_SECONDS:.0f}s)")
+    with col2:
+        if st.button("🔄 Refresh KPIs", use_container_width=True):
+            get_kpi_snapshot(force=True)
+            st.rerun()
+    st.divider()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("📈 Sales Trend")
+        trend = snapshot["trend"]
+        with get_profiler().span("chart: sales trend"):
+            time_series_chart(
+                trend, "date", "sales", key="dashboard_trend_zoom",
+                title="Daily Sales Trend", labels={"date": "Date", "sales": "Sales (₹)"},
+            )
+    with col2:
+        st.subheader("💍 Product Category Distribution")
+        categories = snapshot["categories"]
+        with get_profiler().span("chart: category split"):
+            fig = chart("pie", values=list(categories.values()), names=list(categories), title="Product Sales by Category")
+        plotly_chart(fig)
+    st.divider()
+    st.subheader("📋 Recent Transactions")
+    st.dataframe(snapshot["recent"], use_container_width=True, hide_index=True)
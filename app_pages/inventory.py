@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from charts import chart, plotly_chart
+from profiler import get_profiler, profiled
+
+# -------------------------------
+# Mock data loaders (v4 features)
+# -------------------------------
+@profiled("load inventory")
+def load_mock_inventory(seed=42):
+    np.random.seed(seed)
+    products = [
+        ("Gold Ring - Traditional", "Rings", 22000, 35000),
+        ("Diamond Ring - Solitaire", "Rings", 50000, 85000),
+        ("Gold Bracelet - 22K", "Bracelets", 15000, 25000),
+        ("Diamond Necklace - 18K", "Necklaces", 30000, 55000),
+        ("Gold Earrings - Pair", "Earrings", 8000, 15000),
+        ("Silver Ring - Oxidized", "Rings", 2000, 5000),
+    ]
+    inventory = []
+    today = datetime.now().date()
+    for _ in range(30):
+        prod_idx = np.random.randint(0, len(products))
+        prod_name, category, cost, price = products[prod_idx]
+        stock_date = (datetime.now() - timedelta(days=int(np.random.randint(1, 180)))).date()
+        days_in_stock = (today - stock_date).days
+        inventory.append({
+            "id": len(inventory) + 1,
+            "product_name": prod_name,
+            "category": category,
+            "quantity": int(np.random.randint(1, 20)),
+            "cost_price": cost,
+            "selling_price": price,
+            "margin_percent": ((price - cost) / price) * 100,
+            "stock_date": stock_date,
+            "days_in_stock": days_in_stock,
+        })
+    return pd.DataFrame(inventory)
+
+# -------------------------------
+# Inventory page (v5)
+# -------------------------------
+def inventory_page():
+    st.markdown("<h2 class='main-title'>📦 Inventory</h2>", unsafe_allow_html=True)
+    inventory_df = pd.DataFrame({
+        "Item Code": ["GLD001", "SLV002", "DMD003", "PLT004", "GLD005"],
+        "Item Name": ["Gold Ring", "Silver Bracelet", "Diamond Pendant", "Platinum Ring", "Gold Necklace"],
+        "Category": ["Gold", "Silver", "Diamond", "Platinum", "Gold"],
+        "Quantity": [45, 120, 15, 8, 32],
+        "Unit Price": ["₹15,000", "₹2,000", "₹50,000", "₹75,000", "₹22,000"],
+        "Status": ["✅ In Stock", "✅ In Stock", "⚠️ Low Stock", "🔴 Critical", "✅ In Stock"],
+    })
+    st.subheader("Current Inventory")
+    st.dataframe(inventory_df, use_container_width=True, hide_index=True)
+    st.divider()
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("📊 Stock by Category")
+        stock_data = pd.DataFrame({"Category": ["Gold", "Silver", "Diamond", "Platinum"], "Items": [45, 120, 15, 8]})
+        with get_profiler().span("chart: stock by category"):
+            fig = chart("bar", stock_data, x="Category", y="Items", title="Items by Category", color="Category")
+        plotly_chart(fig)
+    with col2:
+        st.subheader("💰 Inventory Value by Category")
+        value_data = pd.DataFrame({"Category": ["Gold", "Silver", "Diamond", "Platinum"], "Value": [675000, 240000, 750000, 600000]})
+        with get_profiler().span("chart: inventory value"):
+            fig = chart("pie", value_data, values="Value", names="Category", title="Inventory Value")
+        plotly_chart(fig)
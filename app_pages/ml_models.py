@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import load_customers
+from charts import figure, plotly_chart
+from dispatch import queue_messages
+from profiler import get_profiler
+
+RETENTION_MESSAGE = "Hi {first_name}, we miss you! 💍 Here is a special offer on your next visit. Come see what's new."
+
+def _forecast_figure(forecast_df):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=forecast_df["date"], y=forecast_df["forecast"], mode="lines", name="Forecast"))
+    fig.add_trace(go.Scatter(x=forecast_df["date"], y=forecast_df["upper_bound"], fill=None, mode="lines", name="Upper Bound"))
+    fig.add_trace(go.Scatter(x=forecast_df["date"], y=forecast_df["lower_bound"], fill="tonexty", mode="lines", name="Lower Bound"))
+    return fig
+
+# -------------------------------
+# ML Models page (v4 feature)
+# -------------------------------
+def show_ml_models():
+    st.markdown("<h2 class='main-title'>🤖 ML Models</h2>", unsafe_allow_html=True)
+    customers_df = load_customers()
+    tab1, tab2, tab3 = st.tabs(["Churn Prediction", "Demand Forecast", "Dynamic Pricing"])
+    with tab1:
+        st.subheader("Customer Churn Risk Prediction")
+        today = datetime.now().date()
+        customers_df_copy = customers_df.copy()
+        customers_df_copy["recency_days"] = (pd.Timestamp(today) - customers_df_copy["last_visit"]).dt.days
+        customers_df_copy["churn_risk"] = (
+            (customers_df_copy["recency_days"] / 180 * 50)
+            + (customers_df_copy["pending_amount"] / (customers_df_copy["pending_amount"].max() or 1) * 30)
+            + np.random.normal(10, 5, len(customers_df_copy))
+        )
+        customers_df_copy["churn_risk"] = customers_df_copy["churn_risk"].clip(0, 100)
+        high_risk = customers_df_copy[customers_df_copy["churn_risk"] > 60].copy()
+        st.warning(f"🚨 {len(high_risk)} customers at HIGH risk of churn")
+        high_risk_display = high_risk[["name", "phone", "pending_amount", "last_visit"]].copy()
+        high_risk_display["churn_risk"] = high_risk["churn_risk"].apply(lambda x: f"{x:.1f}%")
+        st.dataframe(high_risk_display, use_container_width=True)
+        if st.button("📢 Send Retention Offers to High-Risk Customers"):
+            queue_messages(high_risk, RETENTION_MESSAGE, "Retention Offer")
+    with tab2:
+        st.subheader("60-Day Demand Forecast")
+        dates = pd.date_range(start=datetime.now().date(), periods=60)
+        forecast_values = np.random.normal(2.5, 0.8, 60) * 100000
+        forecast_values = np.maximum(forecast_values, 500000)
+        forecast_df = pd.DataFrame({"date": dates, "forecast": forecast_values, "upper_bound": forecast_values * 1.2, "lower_bound": forecast_values * 0.8})
+        with get_profiler().span("chart: demand forecast"):
+            fig = figure("demand_forecast", lambda: _forecast_figure(forecast_df), forecast_df)
+        plotly_chart(fig)
+        total_forecast = forecast_df["forecast"].sum()
+        st.metric("60-Day Total Forecast", f"₹{total_forecast:,.0f}")
+    with tab3:
+        st.subheader("💰 Dynamic Pricing Recommendations")
+        selected_customer = st.selectbox("Select Customer", customers_df["name"].values)
+        customer = customers_df[customers_df["name"] == selected_customer].iloc[0]
+        base_price = 45000
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Base Cost", f"₹{base_price * 0.4:,.0f}")
+        with col2:
+            st.metric("Standard Price", f"₹{base_price:,.0f}")
+        with col3:
+            if customer["segment"] == "VIP":
+                recommended = base_price * 1.08
+                margin = "+15%"
+            elif customer["segment"] == "Regular":
+                recommended = base_price * 0.95
+                margin = "+12%"
+            else:
+                recommended = base_price * 0.85
+                margin = "+10%"
+            st.metric("Recommended Price", f"₹{recommended:,.0f}", delta=margin)
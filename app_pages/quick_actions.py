@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import streamlit as st
+
+# -------------------------------
+# Quick Actions (v5)
+# -------------------------------
+def quick_actions_page():
+    st.markdown("<h2 class='main-title'>⚡ Quick Actions</h2>", unsafe_allow_html=True)
+    st.markdown("<div class='info-box'><strong>⚡ Common Tasks</strong><br>Quickly perform frequently used operations with one click!</div>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("📊 Generate Daily Report", use_container_width=True, key="quick_report"):
+            st.success("✅ Daily report generated!")
+            st.info(f"Report Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    with col2:
+        if st.button("💳 Process Pending Payments", use_container_width=True, key="quick_payment"):
+            st.success("✅ Processed 5 pending payments")
+            st.info("Total Amount: ₹41,000")
+    with col3:
+        if st.button("📦 Inventory Stock Check", use_container_width=True, key="quick_stock"):
+            st.success("✅ Stock check completed")
+            st.warning("⚠️ 2 items low on stock")
+    st.divider()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("👥 Export Customer List", use_container_width=True, key="quick_export"):
+            st.success("✅ Customer list exported as CSV")
+    with col2:
+        if st.button("📧 Send Marketing Email", use_container_width=True, key="quick_email"):
+            st.success("✅ Email campaign sent to 1,250 customers")
+    with col3:
+        if st.button("📞 Backup Data", use_container_width=True, key="quick_backup"):
+            st.success("✅ Data backup completed successfully")
+    st.divider()
+    st.subheader("📊 Quick Stats")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Today's Sales", "₹1,85,000", "+₹25,000")
+    with col2:
+        st.metric("New Customers", "12", "+3")
+    with col3:
+        st.metric("Pending Orders", "8", "-2")
+    with col4:
+        st.metric("Staff On Duty", "4/5", "80%")
@@ -0,0 +1,97 @@
+import streamlit as st
+
+from charts import get_chart_cache
+from data_store import get_backend, get_store, use_backend
+from dispatch import CHANNEL_LABELS, WHATSAPP_TEMPLATE_LANGUAGE, DispatchError, WhatsAppAdapter, get_dispatcher
+
+# -------------------------------
+# Advanced Settings (v4 feature, non-destructive)
+# -------------------------------
+def show_settings_v4():
+    st.markdown("<h2 class='main-title'>⚙️ Advanced Settings</h2>", unsafe_allow_html=True)
+    if st.session_state.get("user_role") not in ("Admin", "Manager"):
+        st.error("Only Admin or Manager can access advanced settings")
+        return
+    tab1, tab2, tab3 = st.tabs(["System", "WhatsApp", "Integrations"])
+    with tab1:
+        st.subheader("System Settings")
+        shop_name = st.text_input("Shop Name", value="Shree Jewels")
+        shop_email = st.text_input("Shop Email", value="contact@shreejewels.com")
+        shop_phone = st.text_input("Shop Phone", value="+91 98765 43210")
+        if st.button("💾 Save Settings (Advanced)"):
+            st.success("✅ Settings saved")
+        with st.expander("📦 Data Cache"):
+            cache_stats = get_store().stats()
+            st.dataframe(cache_stats, use_container_width=True, hide_index=True)
+            if st.button("🧮 Memory Report"):
+                st.dataframe(get_store().memory_report(), use_container_width=True, hide_index=True)
+            chart_stats = get_chart_cache().stats()
+            st.caption(
+                f"Chart cache: {chart_stats['entries']} figures, {chart_stats['bytes'] / 1024:,.0f} KB of "
+                f"{chart_stats['max_bytes'] / 1024 / 1024:,.0f} MB, {chart_stats['hits']} hits / {chart_stats['misses']} misses"
+            )
+            if st.button("🔄 Clear Data Cache"):
+                get_store().invalidate()
+                get_chart_cache().clear()
+                st.success("✅ Data cache cleared")
+    with tab2:
+        st.subheader("WhatsApp Integration")
+        phone_number_id = st.text_input("Phone Number ID", type="password", value="")
+        access_token = st.text_input("Access Token", type="password", value="")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            template_name = st.text_input("Approved Message Template", value="", placeholder="shop_update")
+        with col2:
+            template_language = st.text_input("Template Language", value=WHATSAPP_TEMPLATE_LANGUAGE)
+        st.caption(
+            "WhatsApp only delivers business-initiated messages as an approved template whose body is one "
+            "{{1}} parameter; campaign text is sent in it. Without a template, messages go as plain text and "
+            "only reach customers who messaged the shop in the last 24 hours; the rest fail. A connection made "
+            "here lasts until the app restarts; set JEWELLERY_WHATSAPP_PHONE_ID and JEWELLERY_WHATSAPP_TOKEN "
+            "to keep it across restarts."
+        )
+        if st.button("🧪 Test WhatsApp Connection"):
+            if phone_number_id and access_token:
+                adapter = WhatsAppAdapter(phone_number_id, access_token, template=template_name, language=template_language)
+                try:
+                    adapter.check()
+                except (DispatchError, OSError) as error:
+                    st.error(f"❌ WhatsApp API rejected the connection: {error}")
+                else:
+                    # Campaign and reminder messages now go out through these credentials
+                    get_dispatcher().configure(adapter)
+                    st.success("✅ WhatsApp API connected; messages will be sent from this number")
+                    if not template_name:
+                        st.warning("⚠️ No template set: only customers inside the 24-hour window will get messages")
+            else:
+                st.warning("⚠️ Please enter API credentials first")
+        configured = [CHANNEL_LABELS[channel] for channel in CHANNEL_LABELS if get_dispatcher().adapter(channel) is not None]
+        st.caption(f"Sending through: {', '.join(configured) if configured else 'test adapter only (no channel configured)'}")
+    with tab3:
+        st.subheader("Third-Party Integrations")
+        openai_key = st.text_input("OpenAI API Key (optional)", type="password", value="")
+        databases = {"CSV files": "csv", "SQLite": "sqlite", "PostgreSQL": None, "MySQL": None}
+        current = next(label for label, backend in databases.items() if backend == get_backend())
+        db_connection = st.selectbox("Database", list(databases), index=list(databases).index(current))
+        if st.button("💾 Save Integrations"):
+            if databases[db_connection] is None:
+                st.warning(f"⚠️ {db_connection} is not supported yet; still using {current}")
+            else:
+                use_backend(databases[db_connection])
+                st.success(f"✅ Integrations configured, data now served from {db_connection}")
+
+# -------------------------------
+# Original v5 Settings page left intact (named settings_page)
+# -------------------------------
+def settings_page():
+    st.markdown("<h2 class='main-title'>⚙️ Settings</h2>", unsafe_allow_html=True)
+    st.subheader("Account Settings")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.text_input("Full Name", value="Manager")
+        st.text_input("Email", value="manager@jewellery.com")
+    with col2:
+        st.text_input("Phone", value="+91-XXXXXXXXXX")
+        st.selectbox("Theme", ["Luxury Black & Silver ⭐ CURRENT", "Light Mode", "Other"], index=0)
+    if st.button("💾 Save Settings"):
+        st.success("✅ Settings saved!")
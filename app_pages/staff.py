@@ -0,0 +1,90 @@
+import pandas as pd
+import streamlit as st
+
+from app_pages.common import STAFF_MEMBERS
+
+# -------------------------------
+# Staff Management page (v5)
+# -------------------------------
+def staff_management_page():
+    st.markdown("<h2 class='main-title'>👨‍💼 Staff Management</h2>", unsafe_allow_html=True)
+    tab1, tab2 = st.tabs(["📊 Staff Directory", "💰 Pending Amounts"])
+    with tab1:
+        st.subheader("Staff Directory")
+        staff_df = pd.DataFrame({
+            "Name": ["Ram Kumar", "Priya Singh", "Amit Verma", "Neha Sharma", "Vikram Gupta"],
+            "Position": ["Sales Executive", "Manager", "Sales Associate", "Cashier", "Showroom Lead"],
+            "Department": ["Sales", "Management", "Sales", "Operations", "Sales"],
+            "Joining Date": ["2022-01-15", "2021-03-20", "2023-06-10", "2022-11-05", "2023-02-14"],
+            "Status": ["✅ Active", "✅ Active", "✅ Active", "✅ Active", "✅ Active"],
+        })
+        st.dataframe(staff_df, use_container_width=True, hide_index=True)
+    with tab2:
+        st.subheader("💸 Pending Commission/Amount")
+        pending_df = pd.DataFrame({
+            "Staff Name": ["Ram Kumar", "Priya Singh", "Amit Verma", "Neha Sharma"],
+            "Position": ["Sales Executive", "Manager", "Sales Associate", "Cashier"],
+            "Pending Amount": ["₹15,000", "₹8,500", "₹12,000", "₹5,500"],
+            "Due Date": ["2025-12-15", "2025-12-20", "2025-12-18", "2025-12-15"],
+            "Status": ["⏳ Pending", "⏳ Pending", "⏳ Pending", "⏳ Pending"],
+        })
+        st.dataframe(pending_df, use_container_width=True, hide_index=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("💳 Pay All Pending", use_container_width=True):
+                st.success("✅ All pending amounts paid!")
+        with col2:
+            if st.button("📧 Send Reminder", use_container_width=True):
+                st.info("✉️ Reminders sent to all staff!")
+
+# -------------------------------
+# Staff Dashboard (new)
+# -------------------------------
+def staff_dashboard_page():
+    st.markdown("<h2 class='main-title'>👨‍💼 Staff Dashboard</h2>", unsafe_allow_html=True)
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("📅 Today Sales (est.)", "₹1,85,000", "+12%")
+    with col2:
+        st.metric("🧾 Pending Orders", "8", "⏳")
+    with col3:
+        st.metric("📈 Target Progress", "72%", "₹7.2L / ₹10L")
+    with col4:
+        st.metric("👥 Customers Served", "24", "+3")
+    st.divider()
+    st.subheader("⚡ Quick Staff Actions")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("🔔 Show Pending Commissions", use_container_width=True):
+            pending_df = pd.DataFrame.from_records([{"Staff Name": v["name"], "Position": v["position"], "Pending Amount": v["pending"]} for k, v in STAFF_MEMBERS.items()])
+            st.dataframe(pending_df, use_container_width=True)
+    with col2:
+        if st.button("📦 Today's Shipments", use_container_width=True):
+            st.info("✅ All shipments processed: 12")
+    with col3:
+        if st.button("📥 Export Sales (CSV)", use_container_width=True):
+            sales_example = pd.DataFrame({"Date": ["2025-12-10", "2025-12-09"], "Item": ["Gold Ring", "Silver Bracelet"], "Amount": [45000, 8000]})
+            csv = sales_example.to_csv(index=False).encode("utf-8")
+            st.download_button("Download sales.csv", data=csv, file_name="sales_today.csv", mime="text/csv")
+    st.divider()
+    st.subheader("📋 Today's Tasks & Recent Sales")
+    sales_df = pd.DataFrame({"Date": ["2025-12-10", "2025-12-09", "2025-12-08"], "Item": ["Gold Ring", "Silver Bracelet", "Diamond Pendant"], "Amount": ["₹45,000", "₹8,000", "₹55,000"], "Status": ["Completed", "Completed", "Pending"]})
+    st.dataframe(sales_df, use_container_width=True)
+
+# -------------------------------
+# Staff pages (v5)
+# -------------------------------
+def sales_record_page():
+    st.markdown("<h2 class='main-title'>💾 Sales Record</h2>", unsafe_allow_html=True)
+    sales_df = pd.DataFrame({"Date": ["2025-12-10", "2025-12-09", "2025-12-08", "2025-12-07"], "Item": ["Gold Ring", "Silver Bracelet", "Diamond Pendant", "Gold Necklace"], "Amount": ["₹45,000", "₹8,000", "₹55,000", "₹32,000"], "Commission": ["₹2,250", "₹400", "₹2,750", "₹1,600"]})
+    st.dataframe(sales_df, use_container_width=True, hide_index=True)
+
+def loyalty_program_page():
+    st.markdown("<h2 class='main-title'>🎁 Loyalty Program</h2>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("💎 Your Tier", "Gold", "🏆")
+    with col2:
+        st.metric("⭐ Total Points", "890", "+150")
+    with col3:
+        st.metric("🎁 Redemptions", "5", "₹250")
@@ -0,0 +1,35 @@
+import pandas as pd
+import streamlit as st
+
+# -------------------------------
+# Tax & Compliance (v5)
+# -------------------------------
+def tax_compliance_page():
+    st.markdown("<h2 class='main-title'>💰 Tax & Compliance</h2>", unsafe_allow_html=True)
+    tab1, tab2, tab3 = st.tabs(["📊 Tax Summary", "📋 GST Details", "📑 Reports"])
+    with tab1:
+        st.subheader("Tax Overview")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📅 Current Period", "Q4 2025", "Oct-Dec")
+        with col2:
+            st.metric("💵 Taxable Income", "₹25,00,000", "+₹3,00,000")
+        with col3:
+            st.metric("🏦 Tax Liability", "₹3,75,000", "18%")
+        with col4:
+            st.metric("✅ Paid", "₹2,50,000", "67%")
+    with tab2:
+        st.subheader("GST Compliance")
+        gst_df = pd.DataFrame({
+            "Month": ["October", "November", "December"],
+            "Sales": ["₹15,00,000", "₹18,00,000", "₹22,00,000"],
+            "GST Rate": ["18%", "18%", "18%"],
+            "GST Amount": ["₹2,70,000", "₹3,24,000", "₹3,96,000"],
+            "Status": ["✅ Filed", "✅ Filed", "⏳ Pending"],
+        })
+        st.dataframe(gst_df, use_container_width=True, hide_index=True)
+    with tab3:
+        st.subheader("Generate Tax Reports")
+        report_type = st.selectbox("Select Report Type", ["Monthly Summary", "Quarterly Filing", "Annual Return"])
+        if st.button("📥 Generate Report"):
+            st.success(f"✅ {report_type} generated successfully!")
@@ -0,0 +1,204 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import _concat_rows, get_store
+
+ATTENDANCE_STATUSES = ['present', 'absent', 'leave', 'half_day']
+_STATUS_CODES = {status: code for code, status in enumerate(ATTENDANCE_STATUSES)}
+_NS_PER_DAY = 86_400 * 10**9
+
+
+class AttendancePartition:
+    """One month of attendance, sorted by staff_id, with running status counts
+
+    `counts` (per-staff status counts indexed by staff_id, as from a store's
+    attendance_counts()) seeds the counts instead of counting the rows.
+    """
+
+    def __init__(self, frame, counts=None):
+        self._frame = frame.sort_values(['staff_id', 'date'], kind='stable').reset_index(drop=True)
+        self._staff_ids = self._frame['staff_id'].to_numpy()
+        self._pending = []
+        self.version = 0
+
+        # Latest status per (staff_id, day), so a correction replaces the
+        # earlier mark instead of being counted twice. Corrections already
+        # compacted into attendance.csv are rows later in the file.
+        days = self._frame['date'].to_numpy(dtype='datetime64[ns]').view(np.int64) // _NS_PER_DAY
+        statuses = self._frame['status'].astype(object)
+        self._marked = dict(zip(zip(self._staff_ids.tolist(), days.tolist()), statuses.tolist()))
+
+        # Status counts live in a (staff x status) matrix so a write only has
+        # to bump two cells instead of re-counting the month.
+        if counts is not None:
+            counts = counts.reindex(columns=ATTENDANCE_STATUSES, fill_value=0)
+            self._count_rows = dict(zip(counts.index.tolist(), range(len(counts))))
+            self._counts = counts.to_numpy(dtype=np.int32)
+            return
+        latest = ~pd.DataFrame({'staff_id': self._staff_ids, 'day': days}).duplicated(keep='last').to_numpy()
+        codes = statuses.map(_STATUS_CODES)
+        known = codes.notna().to_numpy() & latest
+        staff, rows = np.unique(self._staff_ids[known], return_inverse=True)
+        self._count_rows = dict(zip(staff.tolist(), range(len(staff))))
+        self._counts = np.zeros((len(staff), len(ATTENDANCE_STATUSES)), dtype=np.int32)
+        np.add.at(self._counts, (rows, codes[known].to_numpy(dtype=np.int64)), 1)
+
+    def __len__(self):
+        return len(self._frame) + len(self._pending)
+
+    @property
+    def frame(self):
+        """Get every row of the month, sorted by staff_id and date"""
+        if self._pending:
+            pending = pd.DataFrame(self._pending, columns=self._frame.columns)
+            dtypes = {
+                column: dtype for column, dtype in self._frame.dtypes.items()
+                if not isinstance(dtype, pd.CategoricalDtype)
+            }
+            merged = _concat_rows(self._frame, pending.astype(dtypes))
+            self._frame = merged.sort_values(['staff_id', 'date'], kind='stable').reset_index(drop=True)
+            self._staff_ids = self._frame['staff_id'].to_numpy()
+            self._pending = []
+        return self._frame
+
+    def add(self, staff_id, date, status, remarks=None):
+        """Record one attendance mark and update the status counts"""
+        day = pd.Timestamp(date).normalize()
+        previous = self._marked.get((staff_id, day.value // _NS_PER_DAY))
+        row = self._count_rows.get(staff_id)
+        if row is None:
+            row = self._count_rows[staff_id] = len(self._counts)
+            self._counts = np.vstack([self._counts, np.zeros((1, len(ATTENDANCE_STATUSES)), dtype=np.int32)])
+
+        if previous in _STATUS_CODES:
+            self._counts[row, _STATUS_CODES[previous]] -= 1
+        if status in _STATUS_CODES:
+            self._counts[row, _STATUS_CODES[status]] += 1
+        self._marked[(staff_id, day.value // _NS_PER_DAY)] = status
+        self._pending.append({'staff_id': staff_id, 'date': day, 'status': status, 'remarks': remarks})
+        self.version += 1
+
+    def rows(self, staff_id):
+        """Get one staff member's rows for the month"""
+        frame = self.frame
+        start = np.searchsorted(self._staff_ids, staff_id, side='left')
+        stop = np.searchsorted(self._staff_ids, staff_id, side='right')
+        rows = frame.iloc[start:stop]
+        # A corrected day keeps only its latest mark
+        return rows.drop_duplicates(['date'], keep='last')
+
+    def summary(self, staff_id):
+        """Get one staff member's status counts as a dict"""
+        row = self._count_rows.get(staff_id)
+        if row is None:
+            return {status: 0 for status in ATTENDANCE_STATUSES}
+        return dict(zip(ATTENDANCE_STATUSES, self._counts[row].tolist()))
+
+    def status_counts(self):
+        """Get the status counts of every staff member, indexed by staff_id"""
+        return pd.DataFrame(self._counts, index=pd.Index(list(self._count_rows), name='staff_id'), columns=ATTENDANCE_STATUSES)
+
+
+class AttendanceStore:
+    """Attendance partitioned by (year, month) so monthly reads touch one partition"""
+
+    def __init__(self, attendance_df):
+        self.columns = list(attendance_df.columns)
+        self._empty = attendance_df.iloc[:0]
+        self._partitions = {}
+        self._lock = threading.RLock()
+        dates = attendance_df['date']
+        for (year, month), frame in attendance_df.groupby([dates.dt.year, dates.dt.month], sort=True):
+            self._partitions[(int(year), int(month))] = AttendancePartition(frame)
+
+    def months(self):
+        """Get the (year, month) keys that have attendance, oldest first"""
+        return sorted(self._partitions)
+
+    def partition(self, year, month):
+        """Get the partition for a month, creating an empty one if needed"""
+        key = (int(year), int(month))
+        with self._lock:
+            if key not in self._partitions:
+                self._partitions[key] = self._new_partition(*key)
+            return self._partitions[key]
+
+    def _new_partition(self, year, month):
+        return AttendancePartition(self._empty)
+
+    def mark(self, staff_id, date, status, remarks=None):
+        """Record attendance in the partition for its month"""
+        date = pd.Timestamp(date)
+        with self._lock:
+            self.partition(date.year, date.month).add(staff_id, date, status, remarks)
+
+    def month(self, year, month):
+        """Get every attendance row for one month"""
+        with self._lock:
+            return self.partition(year, month).frame
+
+    def staff_month(self, staff_id, year, month):
+        """Get one staff member's attendance for one month"""
+        with self._lock:
+            return self.partition(year, month).rows(staff_id)
+
+    def summary(self, staff_id, year, month):
+        """Get one staff member's status counts for one month"""
+        with self._lock:
+            return self.partition(year, month).summary(staff_id)
+
+    def status_counts(self, year, month):
+        """Get per-staff status counts for one month"""
+        with self._lock:
+            return self.partition(year, month).status_counts()
+
+    def replay(self, rows):
+        """Mark rows logged but not yet compacted into the table (a write log's pending('attendance'))
+
+        Marking is idempotent per staff and day, so a row that is both
+        here and in the table is still counted once.
+        """
+        with self._lock:
+            for row in rows:
+                self.mark(int(row['staff_id']), row['date'], row['status'], row.get('remarks'))
+        return self
+
+
+class SQLiteAttendanceStore(AttendanceStore):
+    """AttendanceStore over the SQLite backend, loading one month at a time
+
+    A month's rows come from a date-range query and its status counts from
+    the store's attendance_counts() aggregate, so payroll never pulls the
+    whole table into pandas.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._partitions = {}
+        self._lock = threading.RLock()
+
+    def months(self):
+        with self._lock:
+            return sorted(set(self.store.attendance_months()) | set(self._partitions))
+
+    def _new_partition(self, year, month):
+        return AttendancePartition(self.store.attendance_month(year, month), self.store.attendance_counts(year, month))
+
+
+def get_attendance_store(store=None, write_log=None):
+    """Get the partitioned attendance for the current attendance table, built once per process
+
+    With a `write_log`, marks it still holds are replayed into a fresh
+    build: after a compaction rewrites the table, rows logged since are
+    not in it yet.
+    """
+    store = store or get_store()
+
+    def replayed(attendance_store):
+        return attendance_store.replay(write_log.pending('attendance')) if write_log is not None else attendance_store
+
+    if getattr(store, 'supports_sql', False):
+        return store.derive('attendance_store', ['attendance'], lambda: replayed(SQLiteAttendanceStore(store)), lazy=True)
+    return store.derive('attendance_store', ['attendance'], lambda attendance: replayed(AttendanceStore(attendance)))
@@ -0,0 +1,300 @@
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from data_store import get_store
+
+# Customer segments, in code order. VIP is the Platinum tier, Dormant is
+# anyone else who has not visited for more than DORMANT_DAYS.
+SEGMENTS = ['VIP', 'Dormant', 'Regular']
+DORMANT_DAYS = 180
+
+# Threshold bitmaps kept per numeric feature (at quantile edges)
+RANGE_BINS = 32
+RANGE_FEATURES = ['total_purchased', 'pending_amount', 'recency_days']
+
+# offers.csv applicable_to values naming a product category, not a customer
+# tier: those offers ("Diwali Gold Special", applicable_to=gold) are for everyone
+PRODUCT_CATEGORIES = {'gold', 'silver', 'diamond', 'other'}
+
+# Compiled audiences kept per index; the cache is emptied when full
+AUDIENCE_CACHE_SIZE = 64
+
+# Bits set in each 16-bit value, for counting members
+_POPCOUNT_8 = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+_POPCOUNT = (_POPCOUNT_8[:, None] + _POPCOUNT_8[None, :]).ravel()
+
+AudienceQuery = namedtuple(
+    'AudienceQuery',
+    ['segments', 'tiers', 'min_purchase', 'min_pending', 'min_recency', 'max_recency'],
+    defaults=(None, None, None, None, None, None),
+)
+
+
+def segment_labels(tier, recency_days):
+    """Get each customer's segment (a SEGMENTS categorical) from their tier and days since last visit"""
+    codes = np.select([np.asarray(tier == 'Platinum'), np.asarray(recency_days) > DORMANT_DAYS], [0, 1], default=2)
+    return pd.Categorical.from_codes(codes, SEGMENTS)
+
+
+class Bitmap:
+    """A set of customer rows as packed little-endian 64-bit words
+
+    Intersections, unions and differences are one NumPy op over
+    size / 64 words, so combining criteria over a million customers
+    touches 125KB per operand.
+    """
+
+    __slots__ = ('words', 'size')
+
+    def __init__(self, words, size):
+        self.words = words
+        self.size = size
+
+    @classmethod
+    def empty(cls, size):
+        return cls(np.zeros(-(-size // 64), dtype='<u8'), size)
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Get the set of True positions in a boolean mask"""
+        mask = np.asarray(mask, dtype=bool)
+        packed = np.packbits(mask, bitorder='little')
+        padded = np.zeros(-(-len(mask) // 64) * 8, dtype=np.uint8)
+        padded[:len(packed)] = packed
+        return cls(padded.view('<u8'), len(mask))
+
+    @classmethod
+    def from_positions(cls, positions, size):
+        bitmap = cls.empty(size)
+        bitmap.add(positions)
+        return bitmap
+
+    def add(self, positions):
+        """Add row positions in place"""
+        positions = np.asarray(positions, dtype=np.uint64)
+        np.bitwise_or.at(self.words, positions >> np.uint64(6), np.left_shift(np.uint64(1), positions & np.uint64(63)))
+
+    def copy(self):
+        return Bitmap(self.words.copy(), self.size)
+
+    def __and__(self, other):
+        return Bitmap(self.words & other.words, self.size)
+
+    def __or__(self, other):
+        return Bitmap(self.words | other.words, self.size)
+
+    def __sub__(self, other):
+        return Bitmap(self.words & ~other.words, self.size)
+
+    def __invert__(self):
+        words = ~self.words
+        if self.size % 64:
+            # Bits past the last row stay clear
+            words[-1] &= np.uint64((1 << (self.size % 64)) - 1)
+        return Bitmap(words, self.size)
+
+    def __len__(self):
+        return int(_POPCOUNT[self.words.view(np.uint16)].sum(dtype=np.int64))
+
+    def positions(self):
+        """Get the member rows, ascending"""
+        return np.flatnonzero(np.unpackbits(self.words.view(np.uint8), bitorder='little')[:self.size])
+
+
+class RangeBitmaps:
+    """Exact `values >= threshold` sets from bitmaps kept at RANGE_BINS quantile edges
+
+    A threshold uses the bitmap of the nearest edge above it and adds the
+    rows between the threshold and that edge, a contiguous slice of the
+    rows in value order.
+    """
+
+    def __init__(self, values, bins=RANGE_BINS):
+        values = np.asarray(values)
+        n = len(values)
+        self._order = np.argsort(values, kind='stable')
+        self._sorted = values[self._order]
+        starts = np.linspace(0, n, bins + 1).astype(np.int64)[:-1] if n else np.zeros(0, dtype=np.int64)
+        # Edges sit at the first row of a value, so each edge is a whole `>= value` set
+        self._starts = np.unique(np.searchsorted(self._sorted, self._sorted[starts], side='left'))
+        self._bitmaps = []
+        mask = np.zeros(n, dtype=bool)
+        stop = n
+        for start in self._starts[::-1].tolist():
+            mask[self._order[start:stop]] = True
+            self._bitmaps.append(Bitmap.from_mask(mask))
+            stop = start
+        self._bitmaps.reverse()
+        self.size = n
+
+    def at_least(self, threshold):
+        lo = int(np.searchsorted(self._sorted, threshold, side='left'))
+        k = int(np.searchsorted(self._starts, lo, side='left'))
+        if k < len(self._starts):
+            bitmap, stop = self._bitmaps[k].copy(), int(self._starts[k])
+        else:
+            bitmap, stop = Bitmap.empty(self.size), self.size
+        bitmap.add(self._order[lo:stop])
+        return bitmap
+
+    def at_most(self, threshold):
+        """Get `values <= threshold`, for integer values"""
+        return ~self.at_least(threshold + 1)
+
+
+class AudienceIndex:
+    """Customer feature table with segment, tier and threshold bitmaps for campaign targeting
+
+    Built on the customer overview (build_customer_overview), so last
+    visits and segments are not worked out a second time.
+
+    A query is compiled into ANDs and ORs of the precomputed bitmaps, so its
+    exact recipients, their count and its overlap with other campaigns
+    come from word-wise set operations instead of masks over every column.
+    """
+
+    def __init__(self, overview, today=None):
+        today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+        recency = (np.datetime64(today.date(), 'D') - overview['last_visit'].to_numpy(dtype='datetime64[D]')).astype(np.int64)
+        self.features = pd.DataFrame({
+            'id': overview['id'].array,
+            'name': overview['name'].array,
+            'phone': overview['phone'].array,
+            'email': overview['email'].array,
+            'tier': overview['tier'].array,
+            'segment': overview['segment'].array,
+            'total_purchased': overview['total_spent'].to_numpy(),
+            'pending_amount': overview['pending_amount'].to_numpy(),
+            'recency_days': recency,
+        })
+        self.size = len(self.features)
+        self._lock = threading.Lock()
+        self._cache = {}
+
+        segment_codes = self.features['segment'].cat.codes.to_numpy()
+        self.segments = {label: Bitmap.from_mask(segment_codes == code) for code, label in enumerate(SEGMENTS)}
+        tier = pd.Categorical(self.features['tier'])
+        tier_codes = tier.codes
+        self.tiers = {str(label).lower(): Bitmap.from_mask(tier_codes == code) for code, label in enumerate(tier.categories)}
+        self.ranges = {name: RangeBitmaps(self.features[name].to_numpy()) for name in RANGE_FEATURES}
+
+    def _compile(self, query):
+        audience = ~Bitmap.empty(self.size)
+        if query.segments is not None:
+            chosen = Bitmap.empty(self.size)
+            for label in query.segments:
+                chosen = chosen | self.segments[label]
+            audience = audience & chosen
+        if query.tiers is not None:
+            chosen = Bitmap.empty(self.size)
+            for label in query.tiers:
+                chosen = chosen | self.tiers.get(label.lower(), Bitmap.empty(self.size))
+            audience = audience & chosen
+        if query.min_purchase:
+            audience = audience & self.ranges['total_purchased'].at_least(query.min_purchase)
+        if query.min_pending:
+            audience = audience & self.ranges['pending_amount'].at_least(query.min_pending)
+        if query.min_recency is not None:
+            audience = audience & self.ranges['recency_days'].at_least(query.min_recency)
+        if query.max_recency is not None:
+            audience = audience & self.ranges['recency_days'].at_most(query.max_recency)
+        return audience
+
+    def select(self, query):
+        """Get the audience bitmap of `query`, compiled once per distinct query"""
+        key = AudienceQuery(*(tuple(value) if isinstance(value, list) else value for value in query))
+        with self._lock:
+            audience = self._cache.get(key)
+        if audience is None:
+            audience = self._compile(key)
+            with self._lock:
+                if len(self._cache) >= AUDIENCE_CACHE_SIZE:
+                    self._cache.clear()
+                self._cache[key] = audience
+        return audience
+
+    def count(self, query):
+        return len(self.select(query))
+
+    def recipients(self, query):
+        """Get the feature rows of everyone `query` targets"""
+        return self.features.iloc[self.select(query).positions()]
+
+    def overlaps(self, queries):
+        """Get pairwise recipient counts between named queries (the diagonal is each audience's size)"""
+        names = list(queries)
+        audiences = [self.select(queries[name]) for name in names]
+        counts = np.array([[len(a & b) for b in audiences] for a in audiences], dtype=np.int64)
+        return pd.DataFrame(counts, index=names, columns=names)
+
+
+def campaign_query(campaign_type=None, segments=None, min_purchase=None):
+    """Compile the campaign form's selections into an AudienceQuery
+
+    Payment reminders only go to customers with something pending.
+    """
+    return AudienceQuery(
+        segments=tuple(segments) if segments is not None else None,
+        min_purchase=min_purchase or None,
+        min_pending=1 if campaign_type == 'Payment Reminder' else None,
+    )
+
+
+def offer_query(applicable_to):
+    """Get the audience of an offers.csv row from its applicable_to
+
+    A tier name (platinum, standard) targets that tier; 'all' and a product
+    category (gold, silver, diamond) target every customer.
+    """
+    applicable_to = str(applicable_to).lower()
+    if applicable_to == 'all' or applicable_to in PRODUCT_CATEGORIES:
+        return AudienceQuery()
+    return AudienceQuery(tiers=(applicable_to,))
+
+
+def build_customer_overview(customers, transactions, today=None):
+    """Get one row per customer with contact details, spend, last visit and segment"""
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    last_visit = transactions.groupby('customer_id')['date'].max()
+    overview = pd.DataFrame({
+        'id': customers['id'],
+        'name': customers['name'],
+        'phone': customers['mobile'],
+        'email': customers['email'],
+        'total_spent': customers['total_purchased'],
+        'last_visit': customers['id'].map(last_visit).fillna(customers['joined_date']),
+        'pending_amount': customers['pending_amount'],
+        'tier': customers['tier'],
+    })
+    days_since_visit = (today - overview['last_visit']).dt.days
+    # Categorical, so the Customers page's segment masks compare codes, not strings
+    overview['segment'] = segment_labels(overview['tier'], days_since_visit)
+    return overview
+
+
+def get_customer_overview(store=None, today=None):
+    """Get the customer overview for the current customer CSVs, built once per process and day
+
+    The day is the entry's variant, so yesterday's overview is replaced,
+    not kept alongside.
+    """
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    return (store or get_store()).derive(
+        'customer_overview', ['customers', 'transactions'],
+        lambda customers, transactions: build_customer_overview(customers, transactions, today),
+        variant=today.date(),
+    )
+
+
+def get_audience_index(store=None, today=None):
+    """Get the audience index for the current customer CSVs, built once per process and day"""
+    store = store or get_store()
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    return store.derive(
+        'audience_index', ['customers', 'transactions'],
+        lambda: AudienceIndex(get_customer_overview(store, today), today),
+        lazy=True, variant=today.date(),
+    )
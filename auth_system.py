@@ -2,33 +2,76 @@ import streamlit as st
 import pandas as pd
 import hashlib
 from datetime import datetime
+from data_store import get_store
+from customer_index import CustomerIndex, get_customer_index
+from customer_search import get_customer_search
+from write_log import get_write_log
+
+# customers.csv columns a new registration starts with
+NEW_CUSTOMER_DEFAULTS = {'tier': 'Standard', 'pending_amount': 0, 'total_purchased': 0, 'chit_amount': 0}
 
 class AuthenticationSystem:
-    def __init__(self, users_df, customers_df):
+    def __init__(self, users_df, customers_df, customer_index=None, customer_search=None, write_log=None):
         self.users_df = users_df
         self.customers_df = customers_df
+        self.customer_index = customer_index if customer_index is not None else CustomerIndex(customers_df)
+        self.customer_search = customer_search
+        self.write_log = write_log
+        self._users_by_name = dict(zip(users_df['username'].tolist(), range(len(users_df))))
+    
+    @classmethod
+    def from_store(cls, store=None):
+        """Build from the shared data store instead of loading CSVs again"""
+        store = store or get_store()
+        write_log = get_write_log()
+        return cls(
+            store.get('users'), store.get('customers'),
+            get_customer_index(store, write_log), get_customer_search(store, write_log), write_log,
+        )
     
     def register_customer(self, name, mobile, email, password):
         """Register a new customer"""
         # Check if mobile already exists
-        if mobile in self.customers_df['mobile'].values:
+        if self.customer_index.find_by_mobile(mobile) is not None:
             return False, "Mobile number already registered"
         
         # Hash password
         password_hash = hashlib.sha256(password.encode()).hexdigest()
         
+        # add() re-checks the mobile under the index lock, so two sessions
+        # registering the same number at once cannot both succeed
+        customer = {
+            'name': name,
+            'mobile': mobile,
+            'email': email,
+            'password_hash': password_hash,
+            'joined_date': datetime.now().strftime('%Y-%m-%d'),
+            **NEW_CUSTOMER_DEFAULTS,
+        }
+        position = self.customer_index.add(customer)
+        if position is None:
+            return False, "Mobile number already registered"
+        
+        # Logged so the customer survives a rebuild of the index and reaches customers.csv
+        if self.write_log is not None:
+            self.write_log.append('customers', customer)
+        
+        # add() gave the customer an id; make them findable in staff search too
+        if self.customer_search is not None:
+            self.customer_search.add(customer)
         return True, "Registration successful"
     
     def authenticate_user(self, username, password):
         """Authenticate user login"""
         password_hash = hashlib.sha256(password.encode()).hexdigest()
-        user = self.users_df[self.users_df['username'] == username]
+        position = self._users_by_name.get(username)
         
-        if user.empty:
+        if position is None:
             return False, None
         
-        if user.iloc[0]['password_hash'] == password_hash:
-            return True, user.iloc[0].to_dict()
+        user = self.users_df.iloc[position]
+        if user['password_hash'] == password_hash:
+            return True, user.to_dict()
         
         return False, None
 
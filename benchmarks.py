@@ -0,0 +1,1090 @@
+"""Performance benchmarks for the dashboard's data layer.
+
+Run ``python benchmarks.py --help`` to list the available benchmarks.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from app_pages import PAGES
+from audience import AUDIENCE_CACHE_SIZE, AudienceIndex, build_customer_overview, campaign_query, offer_query
+from bonus_system import BonusManagementSystem
+from charts import CHART_MAX_POINTS, ChartCache, _decimate, fingerprint
+from customer_index import CustomerIndex
+from customer_search import CustomerSearch
+from chit_ledger import SPEND_CACHE_SIZE, SPEND_EDGES, ChitLedger
+from chit_simulation import SIMULATION_MONTHS, _chit_inputs, simulate_draws
+from currency import format_rupees
+from data_store import DATA_DIR, TABLES, DataStore
+from dispatch import DispatchError, Dispatcher, FakeAdapter, render_messages
+from dashboard_kpis import build_kpi_snapshot
+from downsample import downsample
+from profiler import get_profiler
+from rollups import SalesRollups, make_sales_rollups
+from sqlite_store import SQLiteStore
+from staff_management import StaffManagementSystem
+from tables import table_page
+from write_log import WriteAheadLog
+
+# Startup (importing streamlit_app, i.e. everything the login page needs)
+# may not pull these in; pages and charts import them on first use.
+STARTUP_LAZY_MODULES = sorted({page.module for page in PAGES} | {'plotly.express', 'sqlite_store', 'bonus_system'})
+# Budget for the app's own imports, on top of what `import streamlit` costs
+IMPORT_BUDGET_MS = 50
+
+FIRST_NAMES = [
+    'Aarav', 'Priya', 'Rajesh', 'Sakshi', 'Neetu', 'Amit', 'Deepika', 'Vikram', 'Anjali', 'Rohit',
+    'Pooja', 'Arjun', 'Divya', 'Sanjay', 'Meera', 'Karthik', 'Lakshmi', 'Suresh', 'Kavya', 'Ritesh',
+]
+LAST_NAMES = [
+    'Patel', 'Sharma', 'Trivedi', 'Banerjee', 'Kumar', 'Singh', 'Nair', 'Reddy', 'Iyer', 'Gupta',
+    'Verma', 'Pillai', 'Joshi', 'Rao', 'Menon', 'Chatterjee', 'Mehta', 'Desai', 'Bhat', 'Das',
+]
+
+
+def scale_csvs(target_dir, scale):
+    """Write copies of the shop CSVs with every data row repeated `scale` times"""
+    for spec in TABLES.values():
+        with open(os.path.join(DATA_DIR, spec['file']), encoding='utf-8') as f:
+            header = f.readline()
+            body = f.read()
+        if body and not body.endswith('\n'):
+            body += '\n'
+        with open(os.path.join(target_dir, spec['file']), 'w', encoding='utf-8') as f:
+            f.write(header)
+            for _ in range(scale):
+                f.write(body)
+
+
+def synthetic_customers(n, seed=7):
+    """Build a customers frame shaped like customers.csv with `n` rows"""
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1, n + 1)
+    first = np.array(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), n)]
+    last = np.array(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), n)]
+    id_text = ids.astype(str).astype(object)
+    mobile = (9000000000 + rng.permutation(n)).astype(str).astype(object)
+    return pd.DataFrame({
+        'id': ids.astype('int32'),
+        'name': pd.array(first + ' ' + last, dtype=TABLES['customers']['dtype']['name']),
+        'mobile': pd.array(mobile, dtype=TABLES['customers']['dtype']['mobile']),
+        'email': pd.array(
+            pd.Series(first).str.lower() + '.' + pd.Series(last).str.lower() + id_text + '@example.com',
+            dtype=TABLES['customers']['dtype']['email'],
+        ),
+        'username': pd.array(pd.Series(first).str.upper() + '_' + id_text, dtype=TABLES['customers']['dtype']['username']),
+        'tier': pd.Categorical(rng.choice(['Platinum', 'Gold', 'Silver', 'Standard'], n, p=[0.15, 0.45, 0.25, 0.15])),
+        'joined_date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 365, n), unit='D'),
+        'pending_amount': rng.integers(0, 150000, n).astype('int32'),
+        'total_purchased': rng.integers(10000, 1000000, n).astype('int32'),
+        'chit_amount': rng.integers(0, 200000, n).astype('int32'),
+    })
+
+
+def synthetic_staff(n, seed=11):
+    """Build a staff frame shaped like staff.csv with `n` rows"""
+    rng = np.random.default_rng(seed)
+    dtype = TABLES['staff']['dtype']
+    ids = np.arange(1, n + 1)
+    first = np.array(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), n)]
+    last = np.array(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), n)]
+    return pd.DataFrame({
+        'staff_id': ids.astype(dtype['staff_id']),
+        'name': pd.array(first + ' ' + last, dtype=dtype['name']),
+        'floor': pd.Categorical(rng.choice(['Main Floor', 'First Floor', 'Second Floor'], n)),
+        'role': pd.Categorical(rng.choice(['Sales', 'Cashier', 'Customer Service', 'Manager'], n)),
+        'hire_date': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 600, n), unit='D'),
+        'salary_per_day': rng.choice([800.0, 1000.0, 1200.0, 1500.0], n).astype(dtype['salary_per_day']),
+        'status': pd.Categorical(['active'] * n),
+    })
+
+
+def synthetic_attendance(staff_ids, start='2025-10-01', days=60, seed=13):
+    """Build one attendance row per staff member per day, shaped like attendance.csv"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start, periods=days, freq='D')
+    n = len(staff_ids) * days
+    return pd.DataFrame({
+        'staff_id': np.repeat(np.asarray(staff_ids), days),
+        'date': np.tile(dates.to_numpy(), len(staff_ids)),
+        'status': pd.Categorical(
+            rng.choice(['present', 'absent', 'leave', 'half_day'], n, p=[0.8, 0.08, 0.07, 0.05]),
+        ),
+        'remarks': pd.array([None] * n, dtype=TABLES['attendance']['dtype']['remarks']),
+    })
+
+
+def synthetic_sales(start='2025-10-01', days=60, seed=17):
+    """Build shop-wide daily sales shaped like sales.csv"""
+    rng = np.random.default_rng(seed)
+    daily = rng.integers(100000, 5000000, days)
+    shares = rng.dirichlet([5, 3, 2, 1], days)
+    split = (daily[:, None] * shares).astype('int64')
+    return pd.DataFrame({
+        'date': pd.date_range(start, periods=days, freq='D'),
+        'daily_sales': daily.astype('int32'),
+        'gold_sales': split[:, 0].astype('int32'),
+        'silver_sales': split[:, 1].astype('int32'),
+        'diamond_sales': split[:, 2].astype('int32'),
+        'other_sales': (daily - split[:, :3].sum(axis=1)).astype('int32'),
+        'staff_count': np.full(days, 5, dtype='uint16'),
+    })
+
+
+def synthetic_transactions(n, customers=100_000, days=730, seed=19):
+    """Build a transactions frame shaped like transactions.csv with `n` rows, in date order"""
+    rng = np.random.default_rng(seed)
+    dtype = TABLES['transactions']['dtype']
+    offsets = np.sort(rng.integers(0, days, n))
+    return pd.DataFrame({
+        'id': np.arange(1, n + 1, dtype=dtype['id']),
+        'customer_id': rng.integers(1, customers + 1, n).astype(dtype['customer_id']),
+        'date': pd.Timestamp('2024-01-01') + pd.to_timedelta(offsets, unit='D'),
+        'amount': rng.integers(1000, 500000, n).astype(dtype['amount']),
+        'category': pd.Categorical.from_codes(rng.integers(0, 4, n), ['diamond', 'gold', 'other', 'silver']),
+        'type': pd.Categorical.from_codes(rng.integers(0, 3, n), ['adjustment', 'payment', 'sale']),
+        'status': pd.Categorical.from_codes(rng.integers(0, 2, n), ['completed', 'pending']),
+    })
+
+
+class FrameStore:
+    """Minimal in-memory stand-in for DataStore, for benchmarks over synthetic frames"""
+
+    def __init__(self, **frames):
+        self.frames = frames
+
+    def get(self, name):
+        return self.frames[name].copy(deep=False)
+
+
+def _time_per_call(func, args_list):
+    started = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - started) / len(args_list)
+
+
+def bench_customer_index(n=1_000_000, lookups=1000):
+    """Compare indexed customer lookups and (ranked, uncached) search against DataFrame scans"""
+    customers = synthetic_customers(n)
+    rng = np.random.default_rng(1)
+    sample = customers.iloc[rng.integers(0, n, lookups)]
+
+    started = time.perf_counter()
+    index = CustomerIndex(customers)
+    print(f"build: {time.perf_counter() - started:.2f}s for {n:,} customers")
+    started = time.perf_counter()
+    engine = CustomerSearch(customers)
+    print(f"search build: {time.perf_counter() - started:.2f}s")
+
+    def search(query):
+        engine.clear_cache()
+        return engine.search(query, page_size=50)
+
+    mobiles = [(m,) for m in sample['mobile']]
+    usernames = [(u,) for u in sample['username']]
+    scan_mobiles = mobiles[:20]
+    print(f"{'operation':<28} {'indexed':>12} {'scan':>12}")
+    rows = [
+        ('mobile lookup', _time_per_call(index.find_by_mobile, mobiles),
+         _time_per_call(lambda m: m in customers['mobile'].values, scan_mobiles)),
+        ('username lookup', _time_per_call(index.find_by_username, usernames),
+         _time_per_call(lambda u: customers[customers['username'] == u], usernames[:20])),
+        ('email lookup', _time_per_call(index.find_by_email, [(e,) for e in sample['email']]), None),
+        ('id lookup', _time_per_call(index.get, [(int(i),) for i in sample['id']]), None),
+    ]
+    for query in ('ri', 'kavya', 'patel', 'menon', '9000012', 'kavya mehta'):
+        search_time = _time_per_call(search, [(query,)] * 5)
+        scan_time = _time_per_call(
+            lambda q: customers[customers['name'].str.contains(q, case=False) | customers['mobile'].str.contains(q)],
+            [(query,)] * 2,
+        )
+        rows.append((f"search '{query}'", search_time, scan_time))
+
+    for label, indexed, scan in rows:
+        scan_text = f"{scan * 1e3:>10.3f}ms" if scan is not None else f"{'-':>12}"
+        print(f"{label:<28} {indexed * 1e3:>10.3f}ms {scan_text}")
+
+
+def _misspell(word, rng):
+    """Drop, double or swap one letter of a word"""
+    i = int(rng.integers(1, len(word) - 1))
+    kind = rng.integers(0, 3)
+    if kind == 0:
+        return word[:i] + word[i + 1:]
+    if kind == 1:
+        return word[:i] + word[i] + word[i:]
+    return word[:i - 1] + word[i] + word[i - 1] + word[i + 1:]
+
+
+def bench_customer_search(n=500_000, queries=300):
+    """Measure p50/p99 latency of ranked customer search, uncached and cached"""
+    customers = synthetic_customers(n)
+    started = time.perf_counter()
+    engine = CustomerSearch(customers)
+    print(f"build: {time.perf_counter() - started:.2f}s for {n:,} customers")
+
+    rng = np.random.default_rng(3)
+    sample = customers.iloc[rng.integers(0, n, queries)]
+    mixes = {
+        'name prefix': [name.split()[0][:int(rng.integers(2, 6))] for name in sample['name']],
+        'full name': list(sample['name']),
+        'surname': [name.split()[1] for name in sample['name']],
+        'phone digits': [mobile[-int(rng.integers(4, 8)):] for mobile in sample['mobile']],
+        'username': list(sample['username']),
+        'email part': [email.split('@')[0][:8] for email in sample['email']],
+        'misspelt': [_misspell(name.split()[0].lower(), rng) for name in sample['name']],
+    }
+
+    print(f"{'query mix':<14} {'p50':>9} {'p99':>9} {'cached p99':>11} {'avg hits':>9}")
+    for label, mix in mixes.items():
+        engine.clear_cache()
+        latencies, hits = [], []
+        for query in mix:
+            started = time.perf_counter()
+            result = engine.search(query, page=1, page_size=20)
+            latencies.append(time.perf_counter() - started)
+            hits.append(result['total'])
+        cached = []
+        for query in mix:
+            started = time.perf_counter()
+            engine.search(query, page=2, page_size=20)
+            cached.append(time.perf_counter() - started)
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+        print(f"{label:<14} {p50:>7.2f}ms {p99:>7.2f}ms {np.percentile(cached, 99) * 1e3:>9.3f}ms {np.mean(hits):>9.0f}")
+
+
+def bench_bonus(staff=5000, days=60):
+    """Compare the vectorized bonus run against a per-row loop over the same sales"""
+    staff_df = synthetic_staff(staff)
+    bonus_mgmt = BonusManagementSystem(
+        synthetic_sales(days=days), staff_df, synthetic_attendance(staff_df['staff_id'], days=days),
+    )
+
+    started = time.perf_counter()
+    staff_sales = bonus_mgmt.get_staff_sales()
+    attributed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    bonuses = bonus_mgmt.compute_bonuses(staff_sales)
+    vectorized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    looped = [bonus_mgmt.calculate_bonus(sales) for sales in staff_sales.tolist()]
+    loop = time.perf_counter() - started
+
+    assert np.allclose(bonuses['bonus'].to_numpy(), looped)
+    print(f"{staff:,} staff x {days} days of attendance")
+    print(f"{'attribute sales':<18} {attributed * 1e3:>9.2f}ms")
+    print(f"{'vectorized bonus':<18} {vectorized * 1e3:>9.2f}ms")
+    print(f"{'per-row bonus':<18} {loop * 1e3:>9.2f}ms")
+
+
+def bench_payroll(staff=5000, days=60):
+    """Time a whole-month payroll run and the per-staff lookups that follow it"""
+    staff_df = synthetic_staff(staff)
+    attendance = synthetic_attendance(staff_df['staff_id'], days=days)
+
+    started = time.perf_counter()
+    staff_mgmt = StaffManagementSystem(staff_df, attendance)
+    partitioned = time.perf_counter() - started
+
+    started = time.perf_counter()
+    payroll = staff_mgmt.run_payroll(2025, 10)
+    elapsed = time.perf_counter() - started
+
+    marks = [(int(i), '2025-10-15', 'absent', None) for i in staff_df['staff_id'][:1000]]
+    mark = _time_per_call(staff_mgmt.mark_attendance, marks)
+    summary = _time_per_call(staff_mgmt.get_attendance_summary, [(int(i), '2025-10') for i in staff_df['staff_id'][:1000]])
+    lookup = _time_per_call(staff_mgmt.calculate_salary, [(int(i), 2025, 10) for i in staff_df['staff_id'][:1000]])
+
+    print(f"{staff:,} staff x {days} days of attendance, payroll for 2025-10")
+    print(f"{'partition by month':<18} {partitioned * 1e3:>9.2f}ms")
+    print(f"{'run_payroll':<18} {elapsed * 1e3:>9.2f}ms  ({len(payroll):,} rows, net ₹{payroll['net_salary'].sum():,.0f})")
+    print(f"{'mark_attendance':<18} {mark * 1e3:>9.3f}ms per mark")
+    print(f"{'monthly summary':<18} {summary * 1e3:>9.3f}ms per staff member")
+    print(f"{'calculate_salary':<18} {lookup * 1e3:>9.3f}ms per staff member (after marks)")
+
+
+def _concurrent_marks(log, writers, writes):
+    """Have `writers` threads each log `writes` attendance rows at once"""
+    start = threading.Barrier(writers + 1)
+
+    def writer(staff_id):
+        start.wait()
+        for day in range(writes):
+            log.append('attendance', {
+                'staff_id': staff_id,
+                'date': (pd.Timestamp('2026-01-01') + pd.Timedelta(days=day)).strftime('%Y-%m-%d'),
+                'status': 'present',
+                'remarks': None,
+            })
+
+    threads = [threading.Thread(target=writer, args=(1000 + i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started
+
+
+def bench_write_log(writers=50, writes=100):
+    """Measure write-ahead log throughput with many concurrent writers, with and without group commit"""
+    print(f"{writers} concurrent writers x {writes} attendance marks each")
+    print(f"{'mode':<14} {'writes/s':>10} {'fsyncs':>8} {'compact':>9} {'rows ok':>8}")
+    for label, group_commit in (('group commit', True), ('fsync each', False)):
+        with tempfile.TemporaryDirectory() as data_dir:
+            scale_csvs(data_dir, 1)
+            store = DataStore(data_dir)
+            before = len(store.get('attendance'))
+            log = WriteAheadLog(os.path.join(data_dir, '.wal'), store, compact_every=10**9, group_commit=group_commit)
+            elapsed = _concurrent_marks(log, writers, writes)
+            batches = log.stats()['batches']
+
+            started = time.perf_counter()
+            log.close()
+            compact = time.perf_counter() - started
+            rows_ok = len(store.get('attendance')) - before == writers * writes
+            print(
+                f"{label:<14} {writers * writes / elapsed:>10,.0f} {batches:>8,} "
+                f"{compact * 1e3:>7.1f}ms {str(rows_ok):>8}"
+            )
+
+
+def bench_sqlite(scale=1000):
+    """Compare SQL pushdown on the SQLite backend against pandas over the CSV store"""
+    with tempfile.TemporaryDirectory() as data_dir:
+        scale_csvs(data_dir, scale)
+        started = time.perf_counter()
+        sqlite_store = SQLiteStore(os.path.join(data_dir, 'jewellery.db'), data_dir)
+        print(f"import at {scale}x: {time.perf_counter() - started:.2f}s")
+        csv_store = DataStore(data_dir)
+
+        mobile = str(csv_store.get('customers')['mobile'].iloc[-1])
+        month = (2025, 11)
+        print(f"{'operation':<22} {'csv+pandas':>12} {'sqlite':>12}")
+        rows = [
+            ('monthly summary (cold)', lambda: csv_store.monthly_summary(), sqlite_store.monthly_summary),
+            ('monthly summary (warm)', lambda: csv_store.monthly_summary(), sqlite_store.monthly_summary),
+            ('attendance counts', lambda: csv_store.attendance_counts(*month), lambda: sqlite_store.attendance_counts(*month)),
+            ('sales rollups', lambda: SalesRollups(csv_store).refresh(), lambda: make_sales_rollups(sqlite_store).refresh()),
+            (
+                'customer by mobile',
+                lambda: csv_store.get('customers').loc[lambda frame: frame['mobile'] == mobile],
+                lambda: sqlite_store.query('SELECT * FROM customers WHERE mobile = ?', (mobile,)),
+            ),
+        ]
+        for label, pandas_call, sql_call in rows:
+            pandas_time = _time_per_call(pandas_call, [()])
+            sql_time = _time_per_call(sql_call, [()])
+            print(f"{label:<22} {pandas_time * 1e3:>10.2f}ms {sql_time * 1e3:>10.2f}ms")
+        sqlite_store.close()
+
+
+def bench_rollups(n=10_000_000, append=1000):
+    """Time the initial rollup build, an incremental refresh and constant-time KPI reads"""
+    transactions = synthetic_transactions(n)
+    sales = synthetic_sales(start='2024-01-01', days=730)
+    store = FrameStore(transactions=transactions.iloc[:n - append], sales=sales)
+    rollups = SalesRollups(store)
+
+    started = time.perf_counter()
+    rollups.refresh()
+    build = time.perf_counter() - started
+
+    store.frames['transactions'] = transactions
+    started = time.perf_counter()
+    rollups.refresh()
+    incremental = time.perf_counter() - started
+
+    idle = _time_per_call(rollups.refresh, [()] * 20)
+    month = _time_per_call(rollups.month, [('2025-06',)] * 1000)
+    day = _time_per_call(rollups.day, [('2025-06-15',)] * 1000)
+    full_scan = _time_per_call(lambda: transactions[transactions['type'] == 'sale']['amount'].astype('int64').sum(), [()] * 3)
+
+    print(f"{n:,} transactions")
+    print(f"{'initial build':<24} {build * 1e3:>10.1f}ms")
+    print(f"{f'refresh (+{append:,} rows)':<24} {incremental * 1e3:>10.2f}ms")
+    print(f"{'refresh (no new rows)':<24} {idle * 1e3:>10.2f}ms")
+    print(f"{'month lookup':<24} {month * 1e3:>10.4f}ms")
+    print(f"{'day lookup':<24} {day * 1e3:>10.4f}ms")
+    print(f"{'full-scan total (ref)':<24} {full_scan * 1e3:>10.1f}ms")
+
+
+def bench_dashboard(n=10_000_000, customers=1_000_000, append=1000):
+    """Time the dashboard's KPI snapshot: first build, TTL rebuild after new rows, and the cached rerun path"""
+    import plotly.express as px
+
+    rng = np.random.default_rng(23)
+    transactions = synthetic_transactions(n, customers=customers)
+    chit_members = pd.DataFrame({
+        'chit_id': rng.integers(1, 500, customers // 10).astype('uint16'),
+        'customer_id': rng.integers(1, customers + 1, customers // 10).astype('int32'),
+        'joined_date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 365, customers // 10), unit='D'),
+        'status': pd.Categorical(rng.choice(['active', 'inactive'], customers // 10, p=[0.8, 0.2])),
+    })
+    store = FrameStore(
+        transactions=transactions.iloc[:n - append], sales=synthetic_sales(start='2024-01-01', days=730),
+        customers=synthetic_customers(customers), chit_members=chit_members,
+    )
+    rollups = SalesRollups(store)
+
+    started = time.perf_counter()
+    snapshot = build_kpi_snapshot(store, rollups)
+    cold = time.perf_counter() - started
+
+    store.frames['transactions'] = transactions
+    started = time.perf_counter()
+    snapshot = build_kpi_snapshot(store, rollups)
+    rebuild = time.perf_counter() - started
+
+    def rerun():
+        # What a dashboard rerun does with a fresh snapshot: read it and build the two figures
+        trend, categories = snapshot['trend'], snapshot['categories']
+        px.line(x=trend['date'], y=trend['sales'])
+        px.pie(values=list(categories.values()), names=list(categories))
+
+    rerun()
+    cached = _time_per_call(rerun, [()] * 10)
+
+    print(f"{n:,} transactions, {customers:,} customers")
+    print(f"{'first build':<26} {cold * 1e3:>9.1f}ms")
+    print(f"{f'TTL rebuild (+{append:,} rows)':<26} {rebuild * 1e3:>9.1f}ms")
+    for tile in snapshot['tiles']:
+        print(f"  {tile['key']:<24} {tile['ms']:>9.2f}ms")
+    for name, ms in snapshot['timings'].items():
+        print(f"  {name:<24} {ms:>9.2f}ms")
+    print(f"{'rerun with cached KPIs':<26} {cached * 1e3:>9.1f}ms")
+
+
+def bench_pages(runs=5, roles=('Admin', 'Manager', 'Sales Staff', 'Customer')):
+    """Rerun every page for each role through Streamlit's test harness and rank pages by p95"""
+    from streamlit.testing.v1 import AppTest
+
+    profiler = get_profiler()
+    with tempfile.TemporaryDirectory() as tmp:
+        profiler.log_path = os.path.join(tmp, 'reruns.jsonl')
+        app = os.path.join(DATA_DIR, 'streamlit_app.py')
+        for role in roles:
+            at = AppTest.from_file(app, default_timeout=120)
+            at.session_state['authenticated'] = True
+            at.session_state['user_role'] = role
+            at.session_state['username'] = role.lower()
+            at.session_state['chatbot_messages'] = []
+            at.run()
+            for page in at.sidebar.radio[0].options:
+                for _ in range(runs):
+                    at.sidebar.radio[0].set_value(page)
+                    at.run()
+        profiler.close()
+        profiler.log_path = None
+
+    print(f"{runs} reruns per page per role")
+    print(f"{'page':<28} {'reruns':>7} {'p50':>9} {'p95':>9} {'page p95':>9}  slowest span")
+    for row in profiler.summary():
+        print(
+            f"{row['page']:<28} {row['reruns']:>7} {row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms "
+            f"{row['page_p95_ms']:>7.1f}ms  {row['slowest_span']}"
+        )
+
+
+def bench_charts(points=(730, 100_000), charts=200, cap_mb=8):
+    """Compare rebuilding a plotly line chart every rerun with the fingerprint-keyed chart cache"""
+    import plotly.express as px
+    import plotly.tools
+    import plotly.utils
+
+    rng = np.random.default_rng(29)
+    print(f"{'points':>8} {'rebuild':>10} {'cache miss':>11} {'cache hit':>10} {'fingerprint':>12}")
+    for n in points:
+        trend = pd.DataFrame({'date': pd.date_range('2020-01-01', periods=n, freq='h'), 'sales': rng.integers(0, 100_000, n)})
+
+        def rebuild():
+            # What every rerun used to do: build, restyle, then st.plotly_chart validates and serialises
+            fig = px.line(trend, x='date', y='sales', title='Daily Sales Trend')
+            fig.update_layout(paper_bgcolor='#0f0f0f', plot_bgcolor='#1a1a1a', font=dict(color='#e8e8e8'))
+            json.dumps(plotly.tools.return_figure_from_figure_or_data(fig, True), cls=plotly.utils.PlotlyJSONEncoder)
+
+        rebuilt = _time_per_call(rebuild, [()] * 5)
+        cache = ChartCache()
+        cache.get('warm-up', lambda: px.line(x=[0, 1], y=[0, 1]))
+        started = time.perf_counter()
+        cache.get(fingerprint('line', trend), lambda: px.line(trend, x='date', y='sales', title='Daily Sales Trend'))
+        miss = time.perf_counter() - started
+        hit = _time_per_call(lambda: cache.get(fingerprint('line', trend), None), [()] * 50)
+        hashed = _time_per_call(lambda: fingerprint('line', trend), [()] * 50)
+        print(f"{n:>8,} {rebuilt * 1e3:>8.2f}ms {miss * 1e3:>9.2f}ms {hit * 1e3:>8.3f}ms {hashed * 1e3:>10.3f}ms")
+
+    # Memory cap: keep building (and drawing) distinct charts and watch LRU
+    # eviction hold the size, rebuilt figures included
+    cache = ChartCache(max_bytes=cap_mb * 1024 * 1024)
+    for i in range(charts):
+        values = rng.integers(0, 100_000, 20_000)
+        cache.figure(cache.get(fingerprint('bar', i), lambda: px.bar(x=np.arange(len(values)), y=values)))
+    stats = cache.stats()
+    print(
+        f"{charts} distinct charts into a {cap_mb}MB cache: {stats['entries']} kept, "
+        f"{stats['bytes'] / 1024 / 1024:.1f}MB, {stats['evictions']} evicted"
+    )
+
+
+def bench_downsample(points=(1_000, 100_000, 1_000_000, 10_000_000), max_points=CHART_MAX_POINTS):
+    """Compare plotting every point with LTTB / min-max downsampling: build time and payload size"""
+    import plotly.express as px
+
+    rng = np.random.default_rng(31)
+    px.line(x=[0, 1], y=[0, 1]).to_json()
+    print(f"{'points':>11} {'lttb':>9} {'minmax':>9} {'full build':>11} {'full payload':>13} {'sampled build':>14} {'payload':>9}")
+    for n in points:
+        dates = pd.date_range('2000-01-01', periods=n, freq='min')
+        sales = np.cumsum(rng.normal(0, 1_000, n)) + 100_000
+        trend = pd.DataFrame({'date': dates, 'sales': sales})
+
+        lttb = _time_per_call(lambda: downsample(dates, sales, max_points, method='lttb'), [()] * 3)
+        minmax = _time_per_call(lambda: downsample(dates, sales, max_points, method='minmax'), [()] * 3)
+
+        # Plotting every point of 10M rows takes minutes and gigabytes, so stop at 1M
+        full = f"{'(skipped)':>11} {'(skipped)':>13}"
+        if n <= 1_000_000:
+            started = time.perf_counter()
+            payload = px.line(trend, x='date', y='sales').to_json()
+            full = f"{(time.perf_counter() - started) * 1000:>9.0f}ms {len(payload) / 1024 / 1024:>11.1f}MB"
+
+        started = time.perf_counter()
+        sampled, spec = _decimate(trend, {'x': 'date', 'y': 'sales'}, max_points)
+        payload = px.line(sampled, **spec).to_json()
+        sampled_ms = (time.perf_counter() - started) * 1000
+
+        print(
+            f"{n:>11,} {lttb * 1e3:>7.1f}ms {minmax * 1e3:>7.1f}ms {full} "
+            f"{sampled_ms:>12.1f}ms {len(payload) / 1024:>7.0f}KB"
+        )
+
+
+def bench_tables(customers=1_000_000, transactions=5_000_000, runs=5):
+    """Compare the Customers page's four full tabs with paged tables over the same masks"""
+    from streamlit.type_util import data_frame_to_bytes
+
+    overview = build_customer_overview(synthetic_customers(customers), synthetic_transactions(transactions, customers=customers))
+    tabs = {
+        'all': (None, ['name', 'phone', 'email', 'total_spent', 'pending_amount', 'tier'], 'total_spent'),
+        'at risk': ('risk', ['name', 'phone', 'pending_amount', 'last_visit', 'tier'], 'pending_amount'),
+        'vip': ('vip', ['name', 'phone', 'total_spent', 'pending_amount', 'last_visit'], 'total_spent'),
+        'pending': ('pending', ['name', 'phone', 'pending_amount', 'tier', 'last_visit'], 'pending_amount'),
+    }
+
+    def masks():
+        days_since_visit = (np.datetime64(pd.Timestamp.now()) - overview['last_visit'].to_numpy()) // np.timedelta64(1, 'D')
+        pending = overview['pending_amount'].to_numpy()
+        return {
+            None: None,
+            'risk': (pending > 50000) | (days_since_visit > 120),
+            'vip': (overview['segment'] == 'VIP').to_numpy(),
+            'pending': pending > 0,
+        }
+
+    def full_tabs():
+        # What every rerun used to do: copy each tab's rows, format every amount, send it all
+        frame = overview.copy()
+        frame['days_since_visit'] = (pd.Timestamp.now() - frame['last_visit']).dt.days
+        subsets = {
+            'all': frame, 'at risk': frame[(frame['pending_amount'] > 50000) | (frame['days_since_visit'] > 120)].copy(),
+            'vip': frame[frame['segment'] == 'VIP'].copy(), 'pending': frame[frame['pending_amount'] > 0].copy(),
+        }
+        sent = 0
+        for name, (_, columns, _) in tabs.items():
+            shown = subsets[name][columns].copy()
+            if name == 'all':
+                shown['total_spent'] = shown['total_spent'].apply(lambda x: f"₹{x:,.0f}")
+                shown['pending_amount'] = shown['pending_amount'].apply(lambda x: f"₹{x:,.0f}")
+            sent += len(data_frame_to_bytes(shown))
+        return sent
+
+    def paged_tabs(page=0):
+        sent = 0
+        rows = masks()
+        for mask, columns, sort_by in tabs.values():
+            shown = table_page(overview, rows[mask], sort_by, False, page)[columns]
+            for column in ('total_spent', 'pending_amount'):
+                if column in shown:
+                    shown = shown.assign(**{column: format_rupees(shown[column].tolist())})
+            sent += len(data_frame_to_bytes(shown))
+        return sent
+
+    print(f"{customers:,} customers, four tabs per rerun, {runs} runs")
+    started = time.perf_counter()
+    full_bytes = full_tabs()
+    full = time.perf_counter() - started
+    print(f"{'full tabs':<24} {full * 1e3:>9.1f}ms {full_bytes / 1024 / 1024:>9.1f}MB sent")
+    for page in (0, 100):
+        paged_bytes = paged_tabs(page)
+        paged = _time_per_call(paged_tabs, [(page,)] * runs)
+        print(f"{f'paged, page {page + 1}':<24} {paged * 1e3:>9.1f}ms {paged_bytes / 1024:>9.1f}KB sent")
+    by_name = _time_per_call(lambda: table_page(overview, None, 'name', True, 0), [()] * runs)
+    print(f"{'sort 1 page by name':<24} {by_name * 1e3:>9.1f}ms")
+
+
+def _lakh_grouped(amount):
+    """Format one amount with Indian grouping the per-row way, as a reference"""
+    digits = f"{abs(amount):.0f}"
+    head, tail = digits[:-3], digits[-3:]
+    groups = []
+    while len(head) > 2:
+        groups.insert(0, head[-2:])
+        head = head[:-2]
+    grouped = ','.join(([head] if head else []) + groups + [tail])
+    return f"{'-' if amount < 0 else ''}₹{grouped}"
+
+
+def bench_currency(n=1_000_000, runs=3):
+    """Compare per-row f-string currency formatting with the vectorized Indian formatter"""
+    rng = np.random.default_rng(37)
+    amounts = pd.Series(rng.integers(0, 50_000_000, n).astype('int32'))
+    expected = amounts.head(10_000).map(_lakh_grouped).tolist()
+    if format_rupees(amounts.head(10_000)).tolist() != expected:
+        raise AssertionError('format_rupees disagrees with per-row lakh grouping')
+
+    western = _time_per_call(lambda: amounts.apply(lambda x: f"₹{x:,.0f}"), [()] * runs)
+    lakh = _time_per_call(lambda: amounts.map(_lakh_grouped), [()] * runs)
+    vectorized = _time_per_call(lambda: format_rupees(amounts), [()] * runs)
+    print(f"{n:,} amounts, {runs} runs; sample: {format_rupees(amounts.head(3)).tolist()}")
+    print(f"{'apply f-string (₹4,500,000)':<32} {western * 1e3:>8.1f}ms")
+    print(f"{'per-row lakh grouping':<32} {lakh * 1e3:>8.1f}ms")
+    print(f"{'format_rupees (₹45,00,000)':<32} {vectorized * 1e3:>8.1f}ms  {western / vectorized:.1f}x")
+
+
+def synthetic_chits(chits, members_per_chit=40, seed=41):
+    """Build chits and chit_members frames shaped like the chit CSVs"""
+    rng = np.random.default_rng(seed)
+    amounts = rng.choice([500_000, 1_000_000, 1_500_000, 2_000_000, 3_000_000], chits)
+    months = rng.choice([12, 24, 36], chits)
+    start = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 730, chits), unit='D')
+    chit_frame = pd.DataFrame({
+        'id': np.arange(1, chits + 1, dtype=np.int64),
+        'name': [f"Chit {i}" for i in range(1, chits + 1)],
+        'amount': amounts.astype('int32'),
+        'monthly_payment': (amounts // months).astype('int32'),
+        'members': np.full(chits, members_per_chit, dtype='uint16'),
+        'start_date': start,
+        'end_date': start + pd.to_timedelta(months * 30, unit='D'),
+        'draw_schedule': pd.Categorical(rng.choice(['Monthly', 'Bi-monthly', 'Quarterly'], chits)),
+    })
+    n = chits * members_per_chit
+    paid = rng.integers(0, 1_000_000, n)
+    members = pd.DataFrame({
+        'chit_id': np.repeat(chit_frame['id'].to_numpy(), members_per_chit),
+        'customer_id': rng.permutation(n).astype('int32') + 1,
+        'joined_date': pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 365, n), unit='D'),
+        'amount_paid': paid.astype('int32'),
+        'amount_remaining': (np.repeat(amounts, members_per_chit) - paid).clip(0).astype('int32'),
+        'draw_number': rng.integers(1, 12, n).astype('uint16'),
+        'status': pd.Categorical(rng.choice(['active', 'inactive'], n, p=[0.8, 0.2])),
+    })
+    return chit_frame, members
+
+
+def bench_chits(chits=2_000, members_per_chit=40, queries=200):
+    """Build the chit ledger, then time payout-window queries against the old full-frame mask"""
+    chit_frame, members = synthetic_chits(chits, members_per_chit)
+    started = time.perf_counter()
+    ledger = ChitLedger(chit_frame, members)
+    build = time.perf_counter() - started
+    calendar = ledger.calendar
+
+    today = pd.Timestamp('2026-01-15')
+    days = [today + pd.Timedelta(days=int(offset)) for offset in np.random.default_rng(43).integers(0, 365, queries)]
+
+    def masked(day):
+        return calendar[(calendar['payout_date'] >= day) & (calendar['payout_date'] <= day + pd.Timedelta(days=60))]
+
+    if not all(masked(day).equals(ledger.upcoming(60, day)) for day in days[:10]):
+        raise AssertionError('ledger window disagrees with the mask')
+    mask = _time_per_call(masked, [(day,) for day in days])
+    indexed = _time_per_call(lambda day: ledger.upcoming(60, day), [(day,) for day in days])
+    keys = members[['chit_id', 'customer_id']].to_numpy()[np.random.default_rng(47).integers(0, len(members), queries)]
+
+    def masked_buckets(day):
+        # What the pre-order tab used to do: mask the window, then mask it three more times
+        upcoming = masked(day)
+        spend = upcoming['expected_spending']
+        return [
+            upcoming[spend < 50000]['expected_spending'].sum(),
+            upcoming[(spend >= 50000) & (spend <= 100000)]['expected_spending'].sum(),
+            upcoming[spend > 100000]['expected_spending'].sum(),
+        ]
+
+    if not all(np.allclose(masked_buckets(day), ledger.spend_buckets(60, day)['expected_spending']) for day in days[:10]):
+        raise AssertionError('spend buckets disagree with the masks')
+    bucket_mask = _time_per_call(masked_buckets, [(day,) for day in days])
+    ledger._spend_cache.clear()
+    bucket_cold = _time_per_call(lambda day: ledger.spend_buckets(60, day), [(day,) for day in days])
+    # The cache keeps SPEND_CACHE_SIZE as-of days, so rerun within that many
+    recent = [(day,) for day in days[:SPEND_CACHE_SIZE // 2]]
+    ledger._spend_cache.clear()
+    _time_per_call(lambda day: ledger.spend_buckets(60, day), recent)
+    bucket_cached = _time_per_call(lambda day: ledger.spend_buckets(60, day), recent)
+    post = _time_per_call(lambda chit_id, customer_id: ledger.post_installment(chit_id, customer_id, 1000), keys.tolist())
+    lookup = _time_per_call(lambda customer_id: ledger.customer_chits(customer_id), [(key[1],) for key in keys])
+
+    print(f"{chits:,} chits, {len(members):,} members, {len(calendar):,} scheduled payouts")
+    print(f"{'ledger build':<28} {build * 1e3:>9.1f}ms")
+    print(f"{'60-day window, mask':<28} {mask * 1e3:>9.3f}ms")
+    print(f"{'60-day window, index':<28} {indexed * 1e3:>9.3f}ms")
+    print(f"{'spend buckets, 4 masks':<28} {bucket_mask * 1e3:>9.3f}ms")
+    print(f"{'spend buckets, digitize':<28} {bucket_cold * 1e3:>9.3f}ms")
+    print(f"{'spend buckets, cached':<28} {bucket_cached * 1e3:>9.3f}ms")
+    print(f"{'post installment':<28} {post * 1e6:>9.1f}us")
+    print(f"{'customer chits lookup':<28} {lookup * 1e3:>9.3f}ms")
+
+
+def bench_simulate(chits=100, runs=10_000, workers=4, loop_runs=20):
+    """Monte Carlo chit draws: vectorized per chit vs a per-run loop, in process and across a pool"""
+    chit_frame, members = synthetic_chits(chits)
+    ledger = ChitLedger(chit_frame, members)
+    today = pd.Timestamp('2026-01-15')
+    inputs = _chit_inputs(ledger, SIMULATION_MONTHS, today)
+
+    def looped(n):
+        # One run at a time, one draw and one member-month at a time
+        rng = np.random.default_rng(5)
+        for _ in range(n):
+            rate = rng.beta(2, 38)
+            for _, draw_month, pots, dues, payers in inputs:
+                for pot in pots:
+                    pot * (1 - rng.uniform(0, 0.3))
+                    if rng.random() < 0.7:
+                        np.digitize(pot * rng.lognormal(-3, 0.6), SPEND_EDGES)
+                for due, count in zip(dues, payers):
+                    sum(due / count for _ in range(count) if rng.random() >= rate)
+
+    loop = _time_per_call(looped, [(loop_runs,)]) / loop_runs * runs
+    vectorized = _time_per_call(lambda: simulate_draws(ledger, runs, seed=11, workers=0, today=today), [()])
+    pooled = _time_per_call(lambda: simulate_draws(ledger, runs, seed=11, workers=workers, today=today), [()])
+    first = simulate_draws(ledger, runs, seed=11, workers=0, today=today)
+    again = simulate_draws(ledger, runs, seed=11, workers=workers, today=today)
+    if not (np.allclose(first.liability, again.liability) and np.allclose(first.demand, again.demand)):
+        raise AssertionError('pooled simulation disagrees with the in-process one')
+
+    print(f"{chits:,} chits, {len(members):,} members, {runs:,} runs x {SIMULATION_MONTHS} months")
+    print(f"{'per-run loop (extrapolated)':<30} {loop:>9.2f}s")
+    print(f"{'vectorized, in process':<30} {vectorized:>9.2f}s")
+    print(f"{f'vectorized, {workers} workers':<30} {pooled:>9.2f}s")
+    print(f"{'same seed, same bands':<30} {'yes':>10}")
+
+
+def bench_audience(customers=1_000_000, transactions=5_000_000, queries=50):
+    """Campaign audiences: pandas masks over the feature table vs compiled bitmaps, with overlap preview"""
+    customer_frame = synthetic_customers(customers)
+    transaction_frame = synthetic_transactions(transactions, customers=customers)
+    started = time.perf_counter()
+    index = AudienceIndex(build_customer_overview(customer_frame, transaction_frame, '2026-01-15'), '2026-01-15')
+    build = time.perf_counter() - started
+    features = index.features
+
+    rng = np.random.default_rng(53)
+    combos = [('VIP',), ('Regular',), ('Dormant',), ('VIP', 'Regular'), ('Regular', 'Dormant'), ('VIP', 'Regular', 'Dormant')]
+    types = ['Payment Reminder', 'Festival Offer', 'VIP Exclusive']
+    query_args = [
+        (types[int(rng.integers(0, len(types)))], combos[int(rng.integers(0, len(combos)))], int(rng.integers(0, 50)) * 10_000)
+        for _ in range(queries)
+    ]
+
+    def masked(campaign_type, segments, min_purchase):
+        # What targeting would cost as masks: compare every column on every query
+        mask = features['segment'].isin(segments).to_numpy() & (features['total_purchased'].to_numpy() >= min_purchase)
+        if campaign_type == 'Payment Reminder':
+            mask &= features['pending_amount'].to_numpy() > 0
+        return np.flatnonzero(mask)
+
+    def compiled(campaign_type, segments, min_purchase):
+        return index._compile(campaign_query(campaign_type, segments, min_purchase)).positions()
+
+    for args in query_args[:10]:
+        if not np.array_equal(masked(*args), compiled(*args)):
+            raise AssertionError('bitmap audience disagrees with the masks')
+    mask = _time_per_call(lambda *args: len(masked(*args)), query_args)
+    count = _time_per_call(lambda *args: len(index._compile(campaign_query(*args))), query_args)
+    positions = _time_per_call(compiled, query_args)
+    # The cache keeps AUDIENCE_CACHE_SIZE audiences, so rerun within that many
+    recent = query_args[:AUDIENCE_CACHE_SIZE // 2]
+    _time_per_call(lambda *args: index.select(campaign_query(*args)), recent)
+    cached = _time_per_call(lambda *args: len(index.select(campaign_query(*args))), recent)
+
+    campaigns = {f'campaign {i}': campaign_query(*args) for i, args in enumerate(query_args[:5])}
+    campaigns.update({tier: offer_query(tier) for tier in ['platinum', 'standard', 'all']})
+    overlap = _time_per_call(lambda: index.overlaps(campaigns), [()] * 5)
+    sets = [index.select(query).positions() for query in campaigns.values()]
+    overlap_sorted = _time_per_call(lambda: [[len(np.intersect1d(a, b, assume_unique=True)) for b in sets] for a in sets], [()])
+
+    print(f"{customers:,} customers, {queries} audience queries")
+    print(f"{'index build':<32} {build * 1e3:>9.1f}ms")
+    print(f"{'audience, masks':<32} {mask * 1e3:>9.2f}ms")
+    print(f"{'audience count, bitmaps':<32} {count * 1e3:>9.2f}ms")
+    print(f"{'audience rows, bitmaps':<32} {positions * 1e3:>9.2f}ms")
+    print(f"{'audience count, cached':<32} {cached * 1e3:>9.3f}ms")
+    print(f"{f'overlaps of {len(campaigns)}, intersect1d':<32} {overlap_sorted * 1e3:>9.1f}ms")
+    print(f"{f'overlaps of {len(campaigns)}, bitmaps':<32} {overlap * 1e3:>9.1f}ms")
+
+
+def bench_dispatch(recipients=100_000, latency=0.005, rate=5_000):
+    """Outbound messages: a blocking per-message loop vs the batched, rate-limited dispatcher, with a restart"""
+    import asyncio
+
+    frame = synthetic_customers(recipients).rename(columns={'mobile': 'phone'})
+    template = 'Hi {first_name}, {pending_amount} is pending. {discount}% off this week!'
+    adapters = [FakeAdapter('whatsapp', latency=latency, failure_rate=0.01, seed=seed) for seed in (1, 2)]
+
+    async def blocking(count):
+        # What a button would do inline: render and send one message at a time
+        for message in render_messages(template, frame.head(count), {'discount': 10}):
+            try:
+                await adapters[0].send(message)
+            except DispatchError:
+                pass
+
+    started = time.perf_counter()
+    asyncio.run(blocking(200))
+    loop = (time.perf_counter() - started) / 200 * recipients
+    adapters[0].sent.clear()
+
+    with tempfile.TemporaryDirectory() as dispatch_dir:
+        dispatcher = Dispatcher(dispatch_dir, adapters={'whatsapp': adapters[0]}, limits={'whatsapp': (rate, rate // 10)})
+        started = time.perf_counter()
+        job_id = dispatcher.submit(frame, 'whatsapp', template, 'bench', fields={'discount': 10})
+        submit = time.perf_counter() - started
+        while dispatcher.status(job_id)['sent'] < recipients // 2:
+            time.sleep(0.01)
+        dispatcher.close()
+
+        # A restart: a new dispatcher picks the job up from its progress log
+        dispatcher = Dispatcher(dispatch_dir, adapters={'whatsapp': adapters[1]}, limits={'whatsapp': (rate, rate // 10)})
+        status = dispatcher.wait(job_id)
+        total = time.perf_counter() - started
+        dispatcher.close()
+
+    delivered = {message['customer_id'] for adapter in adapters for message in adapter.sent}
+    if len(delivered) + status['failed'] < recipients:
+        raise AssertionError('messages lost across the restart')
+    resent = sum(len(adapter.sent) for adapter in adapters) - len(delivered)
+
+    print(f"{recipients:,} recipients, {latency * 1e3:.0f}ms per send, limit {rate:,}/s, restart half-way")
+    print(f"{'blocking loop (extrapolated)':<30} {loop:>9.1f}s")
+    print(f"{'submit (what the rerun waits)':<30} {submit * 1e3:>9.1f}ms")
+    print(f"{'dispatched, incl. restart':<30} {total:>9.1f}s  ({recipients / total:,.0f} msgs/s)")
+    print(f"{'sent / failed after retries':<30} {status['sent']:>9,} / {status['failed']:,}")
+    print(f"{'re-sent after restart':<30} {resent:>9,}")
+
+
+def resident_kb():
+    """Get this process's current resident set size in KiB"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _cold_start(data_dir, snapshot_dir):
+    """Load every table once in this (fresh) process and report time and memory"""
+    started = time.perf_counter()
+    store = DataStore(data_dir, snapshot_dir=snapshot_dir or None)
+    frame_bytes = 0
+    for name in TABLES:
+        frame_bytes += int(store.get(name).memory_usage(deep=True).sum())
+    elapsed = time.perf_counter() - started
+    print(json.dumps({'seconds': elapsed, 'frame_bytes': frame_bytes, 'rss_kb': resident_kb()}))
+
+
+def _run_cold_start(data_dir, snapshot_dir=''):
+    output = subprocess.run(
+        [sys.executable, __file__, '_cold-start', data_dir, snapshot_dir],
+        check=True, capture_output=True, text=True, cwd=DATA_DIR,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def bench_cold_start(scales=(1, 100, 1000)):
+    """Compare cold start from CSV against cold start from Feather snapshots"""
+    print(f"{'scale':>6} {'path':>9} {'seconds':>9} {'frames MB':>10} {'RSS MB':>8}")
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as data_dir:
+            scale_csvs(data_dir, scale)
+            snapshot_dir = os.path.join(data_dir, '.snapshots')
+            DataStore(data_dir, snapshot_dir=snapshot_dir).build_snapshots()
+
+            for path, snapshots in (('csv', ''), ('snapshot', snapshot_dir)):
+                result = _run_cold_start(data_dir, snapshots)
+                print(
+                    f"{scale:>6} {path:>9} {result['seconds']:>9.3f} "
+                    f"{result['frame_bytes'] / 1e6:>10.1f} {result['rss_kb'] / 1024:>8.1f}"
+                )
+
+
+def _import_times(statement):
+    """Run `statement` under -X importtime in a fresh interpreter; get {module: (self_us, cumulative_us)}"""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        check=True, capture_output=True, text=True, cwd=DATA_DIR,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line.split(':', 1)[1].split('|')
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def bench_import_time(runs=5, budget_ms=IMPORT_BUDGET_MS, check=False):
+    """Report the app's startup import cost over streamlit's own; with check, fail on a regression"""
+    own_ms, streamlit_ms, own = [], [], {}
+    for _ in range(runs):
+        baseline = _import_times('import streamlit')
+        app = _import_times('import streamlit_app')
+        own = {module: times for module, times in app.items() if module not in baseline}
+        own_ms.append(sum(self_us for self_us, _ in own.values()) / 1000)
+        streamlit_ms.append(baseline['streamlit'][1] / 1000)
+
+    print(f"streamlit itself       {np.median(streamlit_ms):>8.1f}ms (median of {runs})")
+    print(f"app's own imports      {np.median(own_ms):>8.1f}ms, {len(own)} modules (budget {budget_ms}ms)")
+    for module, (self_us, cumulative_us) in sorted(own.items(), key=lambda item: -item[1][0])[:10]:
+        print(f"  {module:<30} self {self_us / 1000:>7.1f}ms  cumulative {cumulative_us / 1000:>7.1f}ms")
+
+    problems = [f"{module} is imported at startup" for module in STARTUP_LAZY_MODULES if module in own]
+    if budget_ms and np.median(own_ms) > budget_ms:
+        problems.append(f"app imports take {np.median(own_ms):.1f}ms, over the {budget_ms}ms budget")
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    if check and problems:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    cold_start = commands.add_parser('cold-start', help='CSV vs snapshot cold start at 1x/100x/1000x')
+    cold_start.add_argument('--scales', type=int, nargs='+', default=[1, 100, 1000])
+
+    customer_index = commands.add_parser('customer-index', help='Indexed customer lookups vs scans')
+    customer_index.add_argument('--customers', type=int, default=1_000_000)
+
+    customer_search = commands.add_parser('customer-search', help='Ranked search latency percentiles')
+    customer_search.add_argument('--customers', type=int, default=500_000)
+
+    bonus = commands.add_parser('bonus', help='Vectorized bonus run vs per-row loop')
+    bonus.add_argument('--staff', type=int, default=5000)
+
+    payroll = commands.add_parser('payroll', help='Month partitioning, attendance marks and payroll run')
+    payroll.add_argument('--staff', type=int, default=5000)
+
+    write_log = commands.add_parser('write-log', help='Concurrent write throughput through the write-ahead log')
+    write_log.add_argument('--writers', type=int, default=50)
+    write_log.add_argument('--writes', type=int, default=100)
+
+    sqlite = commands.add_parser('sqlite', help='SQL pushdown vs pandas over the CSVs')
+    sqlite.add_argument('--scale', type=int, default=1000)
+
+    rollups = commands.add_parser('rollups', help='Incremental sales rollups and KPI lookups')
+    rollups.add_argument('--transactions', type=int, default=10_000_000)
+
+    dashboard = commands.add_parser('dashboard', help='Dashboard KPI snapshot build and cached rerun')
+    dashboard.add_argument('--transactions', type=int, default=10_000_000)
+
+    pages = commands.add_parser('pages', help='Per-page rerun p50/p95 from the rerun profiler')
+    pages.add_argument('--runs', type=int, default=5)
+
+    import_time = commands.add_parser('import-time', help='Startup import cost (python -X importtime) with a regression check')
+    import_time.add_argument('--runs', type=int, default=5)
+    import_time.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS, help='0 checks lazy imports only, not timing')
+    import_time.add_argument('--check', action='store_true', help='Exit non-zero on a lazy module imported at startup or an over-budget import time')
+
+    commands.add_parser('charts', help='Rebuilt vs cached plotly figures, and LRU memory cap')
+
+    tables = commands.add_parser('tables', help='Customers page: full tabs vs paged, server-sorted tables')
+    tables.add_argument('--customers', type=int, default=1_000_000)
+
+    currency = commands.add_parser('currency', help='Per-row vs vectorized rupee formatting with lakh grouping')
+    currency.add_argument('--rows', type=int, default=1_000_000)
+
+    chits_parser = commands.add_parser('chits', help='Chit ledger build, payout windows and installment posting')
+    chits_parser.add_argument('--chits', type=int, default=2_000)
+
+    dispatch = commands.add_parser('dispatch', help='Outbound messages: blocking loop vs batched, rate-limited dispatcher with a restart')
+    dispatch.add_argument('--recipients', type=int, default=100_000)
+    dispatch.add_argument('--rate', type=int, default=5_000)
+
+    audience = commands.add_parser('audience', help='Campaign audiences: masks vs compiled bitmaps, and overlap preview')
+    audience.add_argument('--customers', type=int, default=1_000_000)
+
+    simulate = commands.add_parser('simulate', help='Monte Carlo chit draws: per-run loop vs vectorized, in process and pooled')
+    simulate.add_argument('--chits', type=int, default=100)
+    simulate.add_argument('--runs', type=int, default=10_000)
+    simulate.add_argument('--workers', type=int, default=4)
+
+    downsample_parser = commands.add_parser('downsample', help='LTTB/min-max downsampling vs plotting every point')
+    downsample_parser.add_argument('--max-points', type=int, default=CHART_MAX_POINTS)
+
+    internal = commands.add_parser('_cold-start')
+    internal.add_argument('data_dir')
+    internal.add_argument('snapshot_dir')
+
+    args = parser.parse_args()
+    if args.command == 'cold-start':
+        bench_cold_start(args.scales)
+    elif args.command == 'customer-index':
+        bench_customer_index(args.customers)
+    elif args.command == 'customer-search':
+        bench_customer_search(args.customers)
+    elif args.command == 'bonus':
+        bench_bonus(args.staff)
+    elif args.command == 'payroll':
+        bench_payroll(args.staff)
+    elif args.command == 'write-log':
+        bench_write_log(args.writers, args.writes)
+    elif args.command == 'sqlite':
+        bench_sqlite(args.scale)
+    elif args.command == 'rollups':
+        bench_rollups(args.transactions)
+    elif args.command == 'dashboard':
+        bench_dashboard(args.transactions)
+    elif args.command == 'pages':
+        bench_pages(args.runs)
+    elif args.command == 'import-time':
+        bench_import_time(args.runs, args.budget_ms, args.check)
+    elif args.command == 'charts':
+        bench_charts()
+    elif args.command == 'tables':
+        bench_tables(args.customers)
+    elif args.command == 'currency':
+        bench_currency(args.rows)
+    elif args.command == 'chits':
+        bench_chits(args.chits)
+    elif args.command == 'dispatch':
+        bench_dispatch(args.recipients, rate=args.rate)
+    elif args.command == 'audience':
+        bench_audience(args.customers)
+    elif args.command == 'simulate':
+        bench_simulate(args.chits, args.runs, args.workers)
+    elif args.command == 'downsample':
+        bench_downsample(max_points=args.max_points)
+    elif args.command == '_cold-start':
+        _cold_start(args.data_dir, args.snapshot_dir)
+
+
+if __name__ == '__main__':
+    main()
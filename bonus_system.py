@@ -1,23 +1,76 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from charts import chart, plotly_chart, time_series_chart
+from data_store import get_store
+from write_log import get_write_log
+
+# Tiered bonus slabs as (sales from, bonus percent), in ascending order. A
+# staff member's whole sales figure earns the percent of the highest slab
+# reached, so ₹2,50,000 in sales pays 10% on all of it.
+BONUS_SLABS = [
+    (0, 5.0),
+    (100000, 8.0),
+    (250000, 10.0),
+]
+ELIGIBLE_MIN_BONUS = 5000
+
+# How much of a day's sales a staff member is credited with, by attendance status
+SALES_SHARE_BY_STATUS = {'present': 1.0, 'half_day': 0.5}
+
+
+def slab_percent(sales, slabs=BONUS_SLABS):
+    """Look up the bonus percent for one sales figure or a whole array of them"""
+    bounds = np.array([bound for bound, _ in slabs], dtype=float)
+    percents = np.array([percent for _, percent in slabs], dtype=float)
+    slot = np.searchsorted(bounds, np.asarray(sales, dtype=float), side='right') - 1
+    return np.where(slot >= 0, percents[slot.clip(min=0)], 0.0)
+
 
 class BonusManagementSystem:
-    def __init__(self, sales_df, staff_df):
+    def __init__(self, sales_df, staff_df, attendance_df=None, slabs=None, write_log=None):
         self.sales_df = sales_df
         self.staff_df = staff_df
+        self.attendance_df = attendance_df
+        self.slabs = slabs or BONUS_SLABS
+        self.write_log = write_log
     
-    def calculate_bonus(self, sales_amount, base_bonus_percent=5):
-        """Calculate bonus based on sales"""
-        if sales_amount < 100000:
-            bonus = sales_amount * 0.05  # 5%
-        elif sales_amount < 250000:
-            bonus = sales_amount * 0.08  # 8%
-        else:
-            bonus = sales_amount * 0.10  # 10%
+    @classmethod
+    def from_store(cls, store=None):
+        """Build from the shared data store instead of loading CSVs again"""
+        store = store or get_store()
+        write_log = get_write_log()
+        return cls(store.get('sales'), store.get('staff'), store.get('attendance'), write_log=write_log)
+    
+    def record_sales(self, date, daily_sales, gold_sales, silver_sales, diamond_sales, staff_count):
+        """Record one day's sales; anything not gold, silver or diamond counts as other"""
+        if self.write_log is None:
+            return False, "Sales cannot be saved: no write log configured"
         
-        return bonus
+        day = pd.Timestamp(date).strftime('%Y-%m-%d')
+        recorded = set(self.sales_df['date'].dt.strftime('%Y-%m-%d'))
+        # Checked against the log and claimed in one step, so two sessions
+        # saving the same day cannot both get through
+        sequence = self.write_log.append_unique('sales', 'date', {
+            'date': day,
+            'daily_sales': int(daily_sales),
+            'gold_sales': int(gold_sales),
+            'silver_sales': int(silver_sales),
+            'diamond_sales': int(diamond_sales),
+            'other_sales': max(int(daily_sales) - int(gold_sales) - int(silver_sales) - int(diamond_sales), 0),
+            'staff_count': int(staff_count),
+        }, recorded)
+        if sequence is None:
+            return False, f"Sales for {day} are already recorded"
+        return True, f"Sales for {day} saved"
+    
+    def calculate_bonus(self, sales_amount, base_bonus_percent=5):
+        """Calculate the tiered bonus for one sales figure
+
+        The percent comes from the slabs; base_bonus_percent is accepted
+        for existing callers and ignored, as it always was.
+        """
+        return float(sales_amount * slab_percent(sales_amount, self.slabs) / 100)
     
     def get_sales_summary(self):
         """Get overall sales summary"""
@@ -31,24 +84,65 @@ class BonusManagementSystem:
             'records': len(self.sales_df)
         }
     
-    def get_staff_bonus_suggestions(self):
-        """Get bonus suggestions for staff"""
-        suggestions = []
+    def get_staff_sales(self):
+        """Get each staff member's share of the recorded sales, indexed by staff_id
         
-        for idx, staff in self.staff_df.head(10).iterrows():
-            sales_mock = 150000  # Mock sales
-            bonus = self.calculate_bonus(sales_mock)
-            
-            suggestions.append({
-                'staff_id': staff['staff_id'],
-                'name': staff['name'],
-                'sales': sales_mock,
-                'bonus': bonus,
-                'bonus_percent': (bonus / sales_mock) * 100,
-                'eligible': bonus > 5000
-            })
+        sales.csv only has shop-wide daily totals, so each day's sales are
+        split between the staff who worked that day (half days count half).
+        Without attendance the total is split evenly across all staff.
+        """
+        staff_ids = self.staff_df['staff_id']
+        daily = self.sales_df.groupby(self.sales_df['date'].dt.normalize())['daily_sales'].sum().astype(float)
+        
+        shares = None
+        if self.attendance_df is not None and not self.attendance_df.empty:
+            attendance = self.attendance_df
+            weight = attendance['status'].astype(object).map(SALES_SHARE_BY_STATUS).fillna(0).to_numpy()
+            date = attendance['date'].dt.normalize()
+            worked = pd.DataFrame({'staff_id': attendance['staff_id'].to_numpy(), 'date': date, 'weight': weight})
+            worked = worked[(worked['weight'] > 0) & worked['date'].isin(daily.index)]
+            if not worked.empty:
+                day_weight = worked.groupby('date')['weight'].transform('sum')
+                worked['sales'] = worked['date'].map(daily) * worked['weight'] / day_weight
+                shares = worked.groupby('staff_id')['sales'].sum()
         
-        return suggestions
+        if shares is None:
+            per_head = daily.sum() / len(staff_ids) if len(staff_ids) else 0.0
+            shares = pd.Series(per_head, index=staff_ids.to_numpy())
+        
+        return shares.reindex(staff_ids.to_numpy(), fill_value=0.0).rename_axis('staff_id').rename('sales')
+    
+    def compute_bonuses(self, staff_sales=None, slabs=None):
+        """Compute the tiered bonus for every staff member in one pass
+        
+        `staff_sales` is a Series of sales indexed by staff_id (or a frame
+        with staff_id and sales columns); it defaults to get_staff_sales().
+        """
+        if staff_sales is None:
+            staff_sales = self.get_staff_sales()
+        if isinstance(staff_sales, pd.DataFrame):
+            staff_sales = staff_sales.set_index('staff_id')['sales']
+        
+        sales = staff_sales.to_numpy(dtype=float)
+        percent = slab_percent(sales, slabs or self.slabs)
+        bonus = sales * percent / 100
+        return pd.DataFrame({
+            'staff_id': staff_sales.index.to_numpy(),
+            'sales': sales,
+            'bonus': bonus,
+            'bonus_percent': percent,
+            'eligible': bonus > ELIGIBLE_MIN_BONUS,
+        })
+    
+    def get_staff_bonus_suggestions(self, limit=10):
+        """Get bonus suggestions for staff, highest bonus first"""
+        bonuses = self.compute_bonuses()
+        names = self.staff_df[['staff_id', 'name']].drop_duplicates('staff_id')
+        suggestions = bonuses.merge(names, on='staff_id', how='left')
+        suggestions = suggestions.sort_values('bonus', ascending=False, kind='stable')
+        if limit is not None:
+            suggestions = suggestions.head(limit)
+        return suggestions[['staff_id', 'name', 'sales', 'bonus', 'bonus_percent', 'eligible']].to_dict('records')
 
 def render_sales_tracking(bonus_mgmt):
     """Render sales tracking interface"""
@@ -77,7 +171,11 @@ def render_sales_tracking(bonus_mgmt):
         diamond_sales = st.number_input("Diamond Sales (₹)", value=20000, min_value=0)
     
     if st.button("💾 Save Sales Data", use_container_width=True):
-        st.success("✅ Sales data saved successfully!")
+        ok, message = bonus_mgmt.record_sales(date, daily_sales, gold_sales, silver_sales, diamond_sales, staff_count)
+        if ok:
+            st.success(f"✅ {message}")
+        else:
+            st.error(message)
 
 def render_bonus_suggestions(bonus_mgmt):
     """Render bonus suggestions for staff"""
@@ -94,7 +192,7 @@ def render_bonus_suggestions(bonus_mgmt):
             st.write(f"**{sugg['name']}**")
         
         with col2:
-            st.write(f"Sales: ₹{sugg['sales']:,}")
+            st.write(f"Sales: ₹{sugg['sales']:,.0f}")
         
         with col3:
             st.write(f"Bonus: ₹{sugg['bonus']:,.0f}")
@@ -133,15 +231,17 @@ def render_bonus_analytics(bonus_mgmt):
         col1, col2 = st.columns(2)
         
         with col1:
-            # Sales trend
-            fig = px.line(
-                bonus_mgmt.sales_df.tail(30),
-                x='date',
-                y='daily_sales',
-                title='Sales Trend (Last 30 Days)',
+            # Sales trend: the whole history, zoomed to the last 30 days to start
+            last = bonus_mgmt.sales_df['date'].max()
+            time_series_chart(
+                bonus_mgmt.sales_df,
+                'date',
+                'daily_sales',
+                key='bonus_sales_trend_zoom',
+                window=((last - pd.Timedelta(days=29)).to_pydatetime(), last.to_pydatetime()),
+                title='Sales Trend',
                 markers=True
             )
-            st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Category breakdown
@@ -154,12 +254,13 @@ def render_bonus_analytics(bonus_mgmt):
                 'Other': latest.get('other_sales', 0)
             }
             
-            fig = px.pie(
-                names=categories.keys(),
-                values=categories.values(),
+            fig = chart(
+                'pie',
+                names=list(categories.keys()),
+                values=list(categories.values()),
                 title='Sales by Category (Latest Day)'
             )
-            st.plotly_chart(fig, use_container_width=True)
+            plotly_chart(fig)
 
 def render_staff_bonus_view():
     """Render staff view of their bonuses"""
@@ -0,0 +1,256 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from downsample import downsample
+
+# Serialized figures kept across reruns and sessions, least recently used evicted first
+CHART_CACHE_BYTES = int(float(os.environ.get('JEWELLERY_CHART_CACHE_MB', 64)) * 1024 * 1024)
+
+# Line/area charts with more points than this are downsampled before plotting
+CHART_MAX_POINTS = int(os.environ.get('JEWELLERY_CHART_MAX_POINTS', 2000))
+DOWNSAMPLED_KINDS = {'line', 'area', 'scatter'}
+
+THEME = 'jewellery_dark'
+THEME_LAYOUT = {
+    'paper_bgcolor': '#0f0f0f',
+    'plot_bgcolor': '#1a1a1a',
+    'font': {'color': '#e8e8e8'},
+}
+
+# A go.Figure rebuilt from cached JSON (kept so a rerun skips plotly's
+# validation) is charged to the cache at this estimate; measured, it takes
+# roughly 150 KB plus 3x its JSON, more for small charts.
+FIGURE_BASE_BYTES = 256 * 1024
+FIGURE_BYTES_PER_JSON_BYTE = 4
+
+
+def _register_theme():
+    """Register the dark shop theme as a plotly template (once per process)"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+
+    if THEME not in pio.templates:
+        pio.templates[THEME] = go.layout.Template(layout=THEME_LAYOUT)
+    return f"plotly_dark+{THEME}"
+
+
+def _update(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes])).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(repr((value.name, str(value.dtype))).encode())
+        digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode())
+            _update(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}:{len(value)}".encode())
+        for item in value:
+            _update(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def fingerprint(*parts):
+    """Get a short hash of chart inputs: frames and arrays by content, everything else by repr"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _update(digest, part)
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def figure_bytes(spec):
+    """Estimate the memory a go.Figure rebuilt from figure JSON takes"""
+    return FIGURE_BASE_BYTES + FIGURE_BYTES_PER_JSON_BYTE * len(spec)
+
+
+class ChartCache:
+    """LRU of serialized plotly figures, keyed on a fingerprint of data plus chart spec
+
+    Each entry is [JSON, go.Figure or None, bytes]: the figure is rebuilt
+    from the JSON the first time it is drawn and then kept with it, counted
+    against max_bytes and evicted together.
+    """
+
+    def __init__(self, max_bytes=CHART_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._keys = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key, build):
+        """Get the figure JSON cached under `key`, calling build() -> go.Figure on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[0]
+
+        template = _register_theme()
+        figure = build()
+        figure.update_layout(template=template)
+        spec = figure.to_json()
+
+        with self._lock:
+            self._stats['misses'] += 1
+            if key not in self._entries:
+                self._entries[key] = [spec, None, len(spec)]
+                self._keys[spec] = key
+                self._bytes += len(spec)
+            self._evict()
+        return spec
+
+    def figure(self, spec):
+        """Get the go.Figure for figure JSON from get(), rebuilt once while the JSON is cached"""
+        import plotly.io as pio
+
+        with self._lock:
+            entry = self._entries.get(self._keys.get(spec))
+            if entry is not None and entry[1] is not None:
+                self._entries.move_to_end(self._keys[spec])
+                return entry[1]
+        built = pio.from_json(spec)
+        with self._lock:
+            entry = self._entries.get(self._keys.get(spec))
+            if entry is not None and entry[1] is None:
+                entry[1] = built
+                entry[2] += figure_bytes(spec)
+                self._bytes += figure_bytes(spec)
+                self._evict()
+        return built
+
+    def _evict(self):
+        # A chart bigger than the whole cap is still returned, just not kept
+        while self._bytes > self.max_bytes and self._entries:
+            key, (spec, _, size) = self._entries.popitem(last=False)
+            if self._keys.get(spec) == key:
+                del self._keys[spec]
+            self._bytes -= size
+            self._stats['evictions'] += 1
+
+    def stats(self):
+        """Get entry count, size and hit/miss counts"""
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries), bytes=self._bytes, max_bytes=self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._bytes = 0
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_chart_cache():
+    """Get the process-wide chart cache shared by every session"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ChartCache()
+        return _cache
+
+
+def _decimate(data, spec, max_points):
+    """Cut a line/area series down to max_points (shared across colour groups), keeping its shape
+
+    Each colour group keeps at least its two ends, so only a chart with
+    more than max_points / 2 groups can go over.
+    """
+    x, y = spec.get('x'), spec.get('y')
+    if isinstance(data, pd.DataFrame):
+        if not (isinstance(x, str) and isinstance(y, str)) or len(data) <= max_points:
+            return data, spec
+        xs, ys = data[x].to_numpy(), data[y].to_numpy()
+        group = spec.get('color') or spec.get('line_group')
+        if isinstance(group, str):
+            groups = data.groupby(group, sort=False, observed=True).indices
+            budget = max(max_points // len(groups), 2)
+            keep = np.sort(np.concatenate([
+                positions[downsample(xs[positions], ys[positions], budget)] for positions in groups.values()
+            ]))
+        else:
+            keep = downsample(xs, ys, max_points)
+        return data.iloc[keep], spec
+    if data is None and x is not None and y is not None and len(y) > max_points:
+        xs, ys = np.asarray(x), np.asarray(y)
+        keep = downsample(xs, ys, max_points)
+        return None, dict(spec, x=xs[keep], y=ys[keep])
+    return data, spec
+
+
+def chart(kind, data=None, max_points=CHART_MAX_POINTS, **spec):
+    """Get a themed plotly express chart (px.<kind>(data, **spec)) as cached figure JSON
+
+    Line, area and scatter series longer than max_points are downsampled
+    (LTTB) first, so the payload stays the same size however much history
+    there is. Pass max_points=None to plot every point.
+    """
+    def build():
+        import plotly.express as px
+
+        plotted, plotted_spec = data, spec
+        if max_points and kind in DOWNSAMPLED_KINDS:
+            plotted, plotted_spec = _decimate(data, spec, max_points)
+        return getattr(px, kind)(plotted, **plotted_spec)
+
+    return get_chart_cache().get(fingerprint(kind, data, spec, max_points), build)
+
+
+def time_series_chart(frame, x, y, key, window=None, max_points=CHART_MAX_POINTS, **spec):
+    """Draw a long series with a date-range zoom; zooming in re-fetches detail for that range
+
+    Only the selected range is sent to the chart, downsampled to max_points,
+    so a narrower range shows more of the underlying points.
+    """
+    import streamlit as st
+
+    frame = frame.sort_values(x, kind='stable') if not frame[x].is_monotonic_increasing else frame
+    dates = frame[x]
+    visible = frame
+    if len(frame) > 1 and dates.iloc[0] < dates.iloc[-1]:
+        first, last = dates.iloc[0].to_pydatetime(), dates.iloc[-1].to_pydatetime()
+        start, end = window or (first, last)
+        start, end = st.slider(
+            "Zoom", min_value=first, max_value=last, value=(max(start, first), min(end, last)),
+            format="YYYY-MM-DD", key=key,
+        )
+        lo, hi = dates.searchsorted(pd.Timestamp(start), side='left'), dates.searchsorted(pd.Timestamp(end), side='right')
+        visible = frame.iloc[lo:hi]
+    if max_points and len(visible) > max_points:
+        st.caption(f"Showing {max_points:,} of {len(visible):,} points; zoom in for more detail")
+    plotly_chart(chart('line', visible, x=x, y=y, max_points=max_points, **spec))
+
+
+def figure(name, build, *data):
+    """Get a themed hand-built figure as cached figure JSON; `data` is what the figure depends on"""
+    return get_chart_cache().get(fingerprint(name, *data), build)
+
+
+def plotly_chart(spec, use_container_width=True):
+    """Draw cached figure JSON through st.plotly_chart
+
+    A go.Figure is handed over rather than the JSON as a dict: Streamlit
+    re-validates a dict on every rerun, while a figure was validated once,
+    when the chart cache rebuilt it.
+    """
+    import streamlit as st
+
+    # The theme is in the figure's template; "streamlit" would restyle it client-side
+    return st.plotly_chart(get_chart_cache().figure(spec), use_container_width=use_container_width, theme=None)
@@ -0,0 +1,270 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import get_store
+
+# Months between draws for each draw_schedule in chits.csv
+DRAW_INTERVALS = {'Monthly': 1, 'Bi-monthly': 2, 'Quarterly': 3, 'Half-yearly': 6, 'Yearly': 12}
+
+# Share of a payout a member typically spends in the shop, for pre-order planning
+EXPECTED_SPEND_SHARE = 0.05
+
+# Pre-order design tiers by expected spend: light below ₹50,000, regular
+# ₹50,000-₹1,00,000 inclusive, premium above. np.digitize puts x in bucket i
+# when edge[i-1] <= x < edge[i], so the upper edge sits just past ₹1,00,000.
+SPEND_BUCKETS = ['light', 'regular', 'premium']
+SPEND_EDGES = np.array([50_000, np.nextafter(100_000, np.inf)])
+
+# Spend-bucket results kept per (as-of day, window); old days are dropped
+SPEND_CACHE_SIZE = 64
+
+
+def payout_calendar(chits):
+    """Get every chit's draw dates from start_date to end_date, sorted by payout date
+
+    Draws fall on start_date's day of the month (clipped to short months),
+    every DRAW_INTERVALS[draw_schedule] months. Built for all chits at once
+    with month arithmetic, not a date_range per chit.
+    """
+    unknown = set(chits['draw_schedule'].astype(object).dropna()) - set(DRAW_INTERVALS)
+    if unknown:
+        raise ValueError(f"Unknown draw schedule: {sorted(unknown)}")
+    step = chits['draw_schedule'].astype(object).map(DRAW_INTERVALS).to_numpy(dtype=np.int64)
+    start = chits['start_date'].to_numpy(dtype='datetime64[D]')
+    end = chits['end_date'].to_numpy(dtype='datetime64[D]')
+    start_month = start.astype('datetime64[M]')
+    span = (end.astype('datetime64[M]') - start_month).astype(np.int64)
+    draws = np.maximum(span // step + 1, 0)
+
+    # One row per draw: which chit, and which draw of that chit
+    owner = np.repeat(np.arange(len(chits)), draws)
+    draw = np.arange(len(owner)) - np.repeat(np.cumsum(draws) - draws, draws)
+    month = start_month[owner] + draw * step[owner]
+    day = (start[owner] - start_month[owner].astype('datetime64[D]')).astype(np.int64)
+    month_days = ((month + 1).astype('datetime64[D]') - month.astype('datetime64[D]')).astype(np.int64)
+    dates = month.astype('datetime64[D]') + np.minimum(day, month_days - 1)
+    keep = dates <= end[owner]
+
+    amount = chits['amount'].to_numpy(dtype=np.int64)[owner]
+    calendar = pd.DataFrame({
+        'payout_date': dates.astype('datetime64[ns]'),
+        'chit_id': chits['id'].to_numpy()[owner],
+        'chit_name': chits['name'].to_numpy()[owner],
+        'draw': (draw + 1).astype(np.int32),
+        'payout_amount': amount,
+        'expected_spending': amount * EXPECTED_SPEND_SHARE,
+    })[keep]
+    return calendar.sort_values(['payout_date', 'chit_id'], kind='stable').reset_index(drop=True)
+
+
+class ChitLedger:
+    """Chits, their members and the payout calendar, with running paid/remaining totals
+
+    Members are indexed by chit_id and by customer_id (two sorted orders
+    searched with searchsorted), the calendar is sorted by payout date so a
+    date window is two binary searches, and posting an installment updates
+    the member's and the chit's totals in place.
+    """
+
+    def __init__(self, chits, chit_members, chit_installments=None):
+        self._lock = threading.RLock()
+        self.chits = chits.sort_values('id', kind='stable').reset_index(drop=True)
+        self._chit_ids = self.chits['id'].to_numpy()
+        self.members = chit_members.reset_index(drop=True)
+        self.version = 0
+
+        chit_ids = self.members['chit_id'].to_numpy()
+        customer_ids = self.members['customer_id'].to_numpy()
+        self._by_chit = np.lexsort((customer_ids, chit_ids))
+        self._by_chit_keys = chit_ids[self._by_chit]
+        self._by_customer = np.lexsort((chit_ids, customer_ids))
+        self._by_customer_keys = customer_ids[self._by_customer]
+        self._positions = dict(zip(zip(chit_ids.tolist(), customer_ids.tolist()), range(len(self.members))))
+        self._member_chit = np.searchsorted(self._chit_ids, chit_ids)
+
+        self._paid = self.members['amount_paid'].to_numpy(dtype=np.int64).copy()
+        self._remaining = self.members['amount_remaining'].to_numpy(dtype=np.int64).copy()
+        self.unmatched_installments = 0
+        if chit_installments is not None and len(chit_installments):
+            self._add_installments(chit_installments)
+        self._chit_paid = np.bincount(self._member_chit, weights=self._paid, minlength=len(self.chits)).astype(np.int64)
+        self._chit_remaining = np.bincount(self._member_chit, weights=self._remaining, minlength=len(self.chits)).astype(np.int64)
+
+        self.calendar = payout_calendar(self.chits)
+        self._payout_days = self.calendar['payout_date'].to_numpy(dtype='datetime64[D]')
+        self._expected = self.calendar['expected_spending'].to_numpy(dtype=np.float64)
+        self._spend_cache = {}
+        self._draw_dates = pd.Series(
+            self.calendar['payout_date'].to_numpy(),
+            index=pd.MultiIndex.from_arrays([self.calendar['chit_id'].to_numpy(), self.calendar['draw'].to_numpy()]),
+        )
+
+    def _add_installments(self, installments):
+        """Fold already-posted installments into the member totals in one pass"""
+        sums = installments.groupby(['chit_id', 'customer_id'], observed=True)['amount'].sum()
+        positions = pd.Series(self._positions, dtype=np.int64).reindex(sums.index)
+        matched = positions.notna().to_numpy()
+        # Installments for a membership that is no longer in chit_members.csv
+        self.unmatched_installments = int((~matched).sum())
+        rows = positions.to_numpy()[matched].astype(np.int64)
+        amounts = sums.to_numpy(dtype=np.int64)[matched]
+        self._paid[rows] += amounts
+        self._remaining[rows] = np.where(self._remaining[rows] > 0, np.maximum(self._remaining[rows] - amounts, 0), self._remaining[rows])
+
+    def _position(self, chit_id, customer_id):
+        position = self._positions.get((int(chit_id), int(customer_id)))
+        if position is None:
+            raise KeyError(f"Customer {customer_id} is not a member of chit {chit_id}")
+        return position
+
+    def _apply(self, chit_id, customer_id, amount):
+        position = self._position(chit_id, customer_id)
+        applied = min(amount, max(int(self._remaining[position]), 0))
+        self._paid[position] += amount
+        self._remaining[position] -= applied
+        chit = self._member_chit[position]
+        self._chit_paid[chit] += amount
+        self._chit_remaining[chit] -= applied
+
+    def post_installment(self, chit_id, customer_id, amount, date=None, write_log=None):
+        """Record an installment and update the member's and chit's running totals
+
+        With a write-ahead log the installment is made durable first, so it
+        is in chit_installments.csv after the next compaction.
+        """
+        amount = int(amount)
+        if amount <= 0:
+            raise ValueError("Installment amount must be positive")
+        with self._lock:
+            self._position(chit_id, customer_id)
+            if write_log is not None:
+                write_log.append('chit_installments', {
+                    'chit_id': int(chit_id),
+                    'customer_id': int(customer_id),
+                    'date': pd.Timestamp(date or pd.Timestamp.now()).strftime('%Y-%m-%d'),
+                    'amount': amount,
+                })
+            self._apply(chit_id, customer_id, amount)
+            self.version += 1
+
+    def balance(self, chit_id, customer_id):
+        """Get one member's paid and remaining amounts"""
+        with self._lock:
+            position = self._position(chit_id, customer_id)
+            return {'amount_paid': int(self._paid[position]), 'amount_remaining': int(self._remaining[position])}
+
+    def member_balances(self):
+        """Get each member's position in `chits` and running remaining amount, in chit_members order"""
+        with self._lock:
+            return self._member_chit.copy(), self._remaining.copy()
+
+    def _member_rows(self, positions):
+        rows = self.members.iloc[positions]
+        chits = self.chits.iloc[self._member_chit[positions]]
+        return pd.DataFrame({
+            'chit_id': rows['chit_id'].to_numpy(),
+            'chit_name': chits['name'].to_numpy(),
+            'customer_id': rows['customer_id'].to_numpy(),
+            'status': rows['status'].to_numpy(),
+            'draw_number': rows['draw_number'].to_numpy(),
+            'payout_date': self.draw_date(chits['id'].to_numpy(), rows['draw_number'].to_numpy()),
+            'amount_paid': self._paid[positions],
+            'amount_remaining': self._remaining[positions],
+        })
+
+    def chit_members(self, chit_id):
+        """Get one chit's members (sorted by customer_id) with their running totals"""
+        with self._lock:
+            start = np.searchsorted(self._by_chit_keys, chit_id, side='left')
+            stop = np.searchsorted(self._by_chit_keys, chit_id, side='right')
+            return self._member_rows(self._by_chit[start:stop])
+
+    def customer_chits(self, customer_id):
+        """Get every chit one customer belongs to, with their running totals"""
+        with self._lock:
+            start = np.searchsorted(self._by_customer_keys, customer_id, side='left')
+            stop = np.searchsorted(self._by_customer_keys, customer_id, side='right')
+            return self._member_rows(self._by_customer[start:stop])
+
+    def draw_date(self, chit_ids, draws):
+        """Get the payout date of draw number `draws` of each chit in `chit_ids` (NaT past the end)"""
+        wanted = pd.MultiIndex.from_arrays([np.asarray(chit_ids), np.asarray(draws, dtype=np.int64)])
+        return self._draw_dates.reindex(wanted).to_numpy()
+
+    def totals(self):
+        """Get every chit with its members' running paid and remaining totals"""
+        with self._lock:
+            return self.chits.assign(amount_paid=self._chit_paid.copy(), amount_remaining=self._chit_remaining.copy())
+
+    def _window(self, start, end):
+        """Get the calendar rows [lo, hi) paid out from `start` to `end` inclusive"""
+        lo = np.searchsorted(self._payout_days, np.datetime64(pd.Timestamp(start).date(), 'D'), side='left')
+        hi = np.searchsorted(self._payout_days, np.datetime64(pd.Timestamp(end).date(), 'D'), side='right')
+        return int(lo), int(hi)
+
+    def payouts_between(self, start, end):
+        """Get the calendar's payouts from `start` to `end` inclusive, by binary search on the dates"""
+        lo, hi = self._window(start, end)
+        return self.calendar.iloc[lo:hi]
+
+    def upcoming(self, days=60, today=None):
+        """Get the payouts from today through the next `days` days"""
+        today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+        return self.payouts_between(today, today + pd.Timedelta(days=days))
+
+    def spend_buckets(self, days=60, today=None):
+        """Get expected spend and payout count per SPEND_BUCKETS tier for the next `days` days
+
+        One np.digitize and two bincounts over the window's slice of the
+        calendar, cached per (as-of day, days) since the calendar only
+        changes when the ledger is rebuilt.
+        """
+        today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+        key = (today, days)
+        with self._lock:
+            cached = self._spend_cache.get(key)
+            if cached is not None:
+                return cached.copy()
+        lo, hi = self._window(today, today + pd.Timedelta(days=days))
+        spend = self._expected[lo:hi]
+        tiers = np.digitize(spend, SPEND_EDGES)
+        buckets = pd.DataFrame({
+            'expected_spending': np.bincount(tiers, weights=spend, minlength=len(SPEND_BUCKETS)),
+            'payouts': np.bincount(tiers, minlength=len(SPEND_BUCKETS)),
+        }, index=pd.Index(SPEND_BUCKETS, name='tier'))
+        with self._lock:
+            if len(self._spend_cache) >= SPEND_CACHE_SIZE:
+                self._spend_cache.clear()
+            self._spend_cache[key] = buckets
+        return buckets.copy()
+
+
+    def replay(self, rows):
+        """Add installments logged but not yet compacted into the table (a write log's pending('chit_installments'))"""
+        if not rows:
+            return self
+        installments = pd.DataFrame(rows, columns=['chit_id', 'customer_id', 'amount']).astype('int64')
+        with self._lock:
+            unmatched = self.unmatched_installments
+            self._add_installments(installments)
+            self.unmatched_installments += unmatched
+            self._chit_paid = np.bincount(self._member_chit, weights=self._paid, minlength=len(self.chits)).astype(np.int64)
+            self._chit_remaining = np.bincount(self._member_chit, weights=self._remaining, minlength=len(self.chits)).astype(np.int64)
+            self.version += 1
+        return self
+
+
+def get_chit_ledger(store=None, write_log=None):
+    """Get the chit ledger for the current chit CSVs, built once per process
+
+    With a `write_log`, installments it still holds are replayed into a
+    fresh build, so a rewritten chit CSV does not drop them until the next
+    compaction.
+    """
+    def build(chits, chit_members, chit_installments):
+        ledger = ChitLedger(chits, chit_members, chit_installments)
+        return ledger.replay(write_log.pending('chit_installments')) if write_log is not None else ledger
+
+    return (store or get_store()).derive('chit_ledger', ['chits', 'chit_members', 'chit_installments'], build)
@@ -0,0 +1,148 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+
+from chit_ledger import EXPECTED_SPEND_SHARE, SPEND_BUCKETS, SPEND_EDGES
+
+# Runs and months the pre-order tab simulates by default
+SIMULATION_RUNS = 10_000
+SIMULATION_MONTHS = 12
+PERCENTILES = (5, 50, 95)
+
+# Worker processes across chits; 0 simulates in the calling process
+SIMULATION_WORKERS = int(os.environ.get('JEWELLERY_SIM_WORKERS', 0))
+
+# Monthly chance a member misses an installment. Each run draws its own rate
+# from a Beta around DEFAULT_RATE, so bad months hit every chit together.
+DEFAULT_RATE = 0.05
+DEFAULT_CONCENTRATION = 40
+
+# Winners bid away up to this share of the pot at each draw
+MAX_BID_DISCOUNT = 0.30
+
+# Chance a winner buys from the shop, and how widely the spend (a lognormal
+# share of the pot averaging EXPECTED_SPEND_SHARE overall) varies
+SPEND_PROBABILITY = 0.7
+SPEND_SIGMA = 0.6
+
+# Typical piece price per SPEND_BUCKETS tier, to turn spend into stock counts
+PIECE_PRICES = np.array([25_000, 75_000, 150_000], dtype=np.float64)
+
+DrawForecast = namedtuple('DrawForecast', ['liability', 'demand', 'runs', 'seed'])
+
+
+def _chit_inputs(ledger, months, today):
+    """Get (chit_id, draw months, pots, monthly dues, paying members) for each chit with activity ahead
+
+    Dues are what the chit's active members still owe in each month (an
+    installment, or less on the last one), stopping at the chit's end_date.
+    """
+    first = np.datetime64(today.date(), 'M')
+    chits = ledger.chits
+    chit_ids = chits['id'].to_numpy()
+    payment = chits['monthly_payment'].to_numpy(dtype=np.int64)
+    end_month = (chits['end_date'].to_numpy(dtype='datetime64[M]') - first).astype(np.int64)
+
+    draws = ledger.payouts_between(today, pd.Timestamp((first + months).astype('datetime64[D]') - 1))
+    draw_chit = np.searchsorted(chit_ids, draws['chit_id'].to_numpy())
+    draw_month = (draws['payout_date'].to_numpy(dtype='datetime64[M]') - first).astype(np.int64)
+    pots = draws['payout_amount'].to_numpy(dtype=np.float64)
+
+    member_chit, remaining = ledger.member_balances()
+    active = ledger.members['status'].astype(object).to_numpy() == 'active'
+    member_chit, remaining = member_chit[active], remaining[active]
+    step = np.arange(months)
+    owed = np.clip(remaining[:, None] - step * payment[member_chit][:, None], 0, payment[member_chit][:, None])
+    owed[step > end_month[member_chit][:, None]] = 0
+    dues = np.stack([np.bincount(member_chit, weights=owed[:, m], minlength=len(chits)) for m in range(months)], axis=1)
+    payers = np.stack([np.bincount(member_chit, weights=owed[:, m] > 0, minlength=len(chits)) for m in range(months)], axis=1).astype(np.int64)
+
+    inputs = []
+    for chit in np.flatnonzero(np.bincount(draw_chit, minlength=len(chits)) + payers.sum(axis=1)).tolist():
+        mine = draw_chit == chit
+        inputs.append((int(chit_ids[chit]), draw_month[mine], pots[mine], dues[chit], payers[chit]))
+    return inputs
+
+
+def _simulate_chit(rng, draw_month, pots, dues, payers, default_rate, months):
+    """Simulate one chit for every run at once: payouts and collections per month, spend and pieces per tier"""
+    runs = len(default_rate)
+    paying = rng.binomial(payers, 1 - default_rate[:, None])
+    per_member = np.divide(dues, payers, out=np.zeros(months), where=payers > 0)
+    collections = paying * per_member
+
+    spend = np.zeros((runs, len(SPEND_BUCKETS)))
+    pieces = np.zeros((runs, len(SPEND_BUCKETS)))
+    if not len(pots):
+        return np.zeros((runs, months)), collections, spend, pieces
+    placement = np.zeros((len(pots), months))
+    placement[np.arange(len(pots)), draw_month] = 1
+    discount = rng.uniform(0, MAX_BID_DISCOUNT, (runs, len(pots)))
+    payouts = (pots * (1 - discount)) @ placement
+
+    # Mean of the lognormal share for a buyer, so spend averages EXPECTED_SPEND_SHARE overall
+    mu = np.log(EXPECTED_SPEND_SHARE / SPEND_PROBABILITY) - SPEND_SIGMA ** 2 / 2
+    buys = rng.random((runs, len(pots))) < SPEND_PROBABILITY
+    amount = pots * rng.lognormal(mu, SPEND_SIGMA, (runs, len(pots)))
+    cells = (np.arange(runs)[:, None] * len(SPEND_BUCKETS) + np.digitize(amount, SPEND_EDGES))[buys]
+    bought = amount[buys]
+    size = runs * len(SPEND_BUCKETS)
+    spend = np.bincount(cells, weights=bought, minlength=size).reshape(runs, -1)
+    pieces = np.bincount(cells, weights=bought / PIECE_PRICES[cells % len(SPEND_BUCKETS)], minlength=size).reshape(runs, -1)
+    return payouts, collections, spend, pieces
+
+
+def _simulate_chits(inputs, default_rate, seed, months):
+    """Sum _simulate_chit over `inputs`, each chit on its own random stream"""
+    runs = len(default_rate)
+    totals = [np.zeros((runs, months)), np.zeros((runs, months)),
+              np.zeros((runs, len(SPEND_BUCKETS))), np.zeros((runs, len(SPEND_BUCKETS)))]
+    for chit_id, draw_month, pots, dues, payers in inputs:
+        rng = np.random.default_rng([seed, chit_id])
+        for total, part in zip(totals, _simulate_chit(rng, draw_month, pots, dues, payers, default_rate, months)):
+            total += part
+    return totals
+
+
+def simulate_draws(ledger, runs=SIMULATION_RUNS, months=SIMULATION_MONTHS, seed=None, workers=SIMULATION_WORKERS, today=None):
+    """Monte Carlo the next `months` of draws and installments from the ledger's current state
+
+    Every run bids each draw's pot down at random, lets members miss
+    installments and decides what each winner spends, and the runs give
+    percentile bands of the shop's monthly net payout liability (payouts
+    less collections) and of jewellery demand per SPEND_BUCKETS tier. Each
+    chit is simulated for all runs at once on a stream seeded from (seed,
+    chit id), so the same seed gives the same forecast with or without
+    `workers` processes.
+    """
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    seed = int(np.random.SeedSequence().entropy % 2 ** 63) if seed is None else int(seed)
+    inputs = _chit_inputs(ledger, months, today)
+    mean = DEFAULT_RATE * DEFAULT_CONCENTRATION
+    default_rate = np.random.default_rng([seed]).beta(mean, DEFAULT_CONCENTRATION - mean, runs)
+
+    if workers and workers > 1 and len(inputs) > 1:
+        chunks = [inputs[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chits, chunks, repeat(default_rate), repeat(seed), repeat(months)))
+        payouts, collections, spend, pieces = (sum(arrays) for arrays in zip(*parts))
+    else:
+        payouts, collections, spend, pieces = _simulate_chits(inputs, default_rate, seed, months)
+
+    def bands(values, prefix):
+        return {f'{prefix}_p{p}': band for p, band in zip(PERCENTILES, np.percentile(values, PERCENTILES, axis=0))}
+
+    month_index = pd.DatetimeIndex(
+        (np.datetime64(today.date(), 'M') + np.arange(months)).astype('datetime64[ns]'), name='month',
+    )
+    liability = pd.DataFrame({
+        'payouts_p50': np.median(payouts, axis=0),
+        'collections_p50': np.median(collections, axis=0),
+        **bands(payouts - collections, 'liability'),
+    }, index=month_index)
+    demand = pd.DataFrame({**bands(spend, 'spend'), **bands(pieces, 'pieces')}, index=pd.Index(SPEND_BUCKETS, name='tier'))
+    return DrawForecast(liability, demand, runs, seed)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+RUPEE = '₹'
+MISSING = '-'
+
+# 10**0 .. 10**18, for counting digits with one searchsorted
+_POWERS = 10 ** np.arange(19, dtype=np.int64)
+
+
+def _digit_offset(k):
+    """Get how far from the right digit k (0 = units) sits once lakh/crore commas are added"""
+    return k if k < 3 else k + 1 + (k - 3) // 2
+
+
+def format_rupees(values, symbol=RUPEE):
+    """Format whole-rupee amounts with Indian grouping (₹45,00,000), all at once
+
+    Amounts are rounded half-to-even like f"{x:,.0f}", negatives read
+    -₹1,200 and missing values MISSING. Every string is laid out in one
+    (rows x width) array of code points and turned into Python strings in a
+    single pass, so there is no per-row Python formatting. A Series comes
+    back as a Series on the same index, anything else as a list.
+    """
+    index = values.index if isinstance(values, pd.Series) else None
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.to_numpy(dtype=np.float64, na_value=np.nan) if values.hasnans else values.to_numpy()
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.integer):
+        values = values.astype(np.float64)
+    missing = np.isnan(values) if values.dtype.kind == 'f' else np.zeros(len(values), dtype=bool)
+    amounts = np.where(missing, 0, np.rint(values) if values.dtype.kind == 'f' else values).astype(np.int64)
+
+    negative = amounts < 0
+    magnitude = np.abs(amounts)
+    digits = np.maximum(np.searchsorted(_POWERS, magnitude, side='right'), 1)
+    max_digits = int(digits.max(initial=1))
+
+    # Digits and commas right-aligned, one row per character position, so
+    # each digit is written for every amount at once
+    width = _digit_offset(max_digits - 1) + 1
+    chars = np.empty((width, len(amounts)), dtype=np.uint32)
+    rest = magnitude.copy()
+    for k in range(max_digits):
+        row = width - 1 - _digit_offset(k)
+        chars[row] = ord('0') + (rest % 10).astype(np.uint32)
+        rest //= 10
+        if k >= 3 and (k - 3) % 2 == 0:
+            chars[row + 1] = ord(',')
+
+    # Amounts with the same sign and digit count are the same trailing
+    # slice of `chars` behind the same prefix, so each group becomes
+    # strings in one go
+    chars = chars.T.copy()
+    text = np.empty(len(amounts), dtype=object)
+    group = digits * 2 + negative
+    for key in np.unique(group).tolist():
+        rows = np.flatnonzero(group == key)
+        prefix = ('-' if key % 2 else '') + symbol
+        length = _digit_offset(key // 2 - 1) + 1
+        block = np.empty((len(rows), len(prefix) + length), dtype=np.uint32)
+        block[:, :len(prefix)] = [ord(char) for char in prefix]
+        block[:, len(prefix):] = chars[rows, width - length:]
+        text[rows] = block.view(f'<U{block.shape[1]}').ravel()
+    text[missing] = MISSING
+    return pd.Series(text, index=index) if index is not None else text.tolist()
+
+
+def format_rupee(amount, symbol=RUPEE):
+    """Format one amount with Indian grouping, the same way as format_rupees"""
+    return format_rupees([amount], symbol)[0]
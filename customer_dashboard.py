@@ -1,5 +1,8 @@
 import streamlit as st
 import pandas as pd
+from chit_ledger import get_chit_ledger
+from currency import format_rupees
+from write_log import get_write_log
 
 def render_customer_dashboard(user_data):
     """Render the customer dashboard"""
@@ -73,13 +76,19 @@ def render_customer_dashboard(user_data):
         st.subheader("💎 Chit Membership")
         st.info("Your chit participation details")
         
-        chit_data = {
-            'Chit Name': ['Gold Chit 100K', 'Premium Chit 150K'],
-            'Status': ['Active', 'Active'],
-            'Amount Paid': ['₹500,000', '₹750,000'],
-            'Remaining': ['₹500,000', '₹750,000']
-        }
-        st.dataframe(chit_data, use_container_width=True)
+        customer_id = user_data.get('id')
+        chits = get_chit_ledger(write_log=get_write_log()).customer_chits(customer_id) if customer_id is not None else None
+        if chits is None or chits.empty:
+            st.write("You are not in any chit yet")
+        else:
+            chit_data = pd.DataFrame({
+                'Chit Name': chits['chit_name'],
+                'Status': chits['status'].astype(str).str.title(),
+                'Payout Date': chits['payout_date'].dt.date,
+                'Amount Paid': format_rupees(chits['amount_paid']),
+                'Remaining': format_rupees(chits['amount_remaining'])
+            })
+            st.dataframe(chit_data, use_container_width=True, hide_index=True)
     
     with customer_tabs[3]:
         st.subheader("💰 Available Offers")
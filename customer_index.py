@@ -0,0 +1,116 @@
+import threading
+
+from data_store import get_store
+
+
+def mobile_key(mobile):
+    """Normalise a mobile number the way the index stores and looks it up"""
+    return str(mobile).strip()
+
+
+def _text_key(value):
+    return str(value).strip().lower()
+
+
+class CustomerIndex:
+    """Customer lookups by id, mobile, username and email
+
+    One index is shared by every session, so registrations (add) and reads
+    take the same lock. Ranked name/phone search is CustomerSearch's job.
+    Registrations only live here until customers.csv is rebuilt; callers
+    log them (see AuthenticationSystem) and replay() what is still pending.
+    """
+
+    def __init__(self, customers_df):
+        self.customers_df = customers_df
+        self._added = []
+        self._lock = threading.RLock()
+
+        positions = range(len(customers_df))
+        mobiles = customers_df['mobile'].astype(str).str.strip()
+        self._by_id = dict(zip(customers_df['id'].tolist(), positions))
+        self._by_mobile = dict(zip(mobiles.tolist(), positions))
+        self._by_username = dict(zip(customers_df['username'].str.strip().str.lower().tolist(), positions))
+        self._by_email = dict(zip(customers_df['email'].str.strip().str.lower().tolist(), positions))
+        self._next_id = max(self._by_id, default=0) + 1
+
+    def __len__(self):
+        with self._lock:
+            return len(self.customers_df) + len(self._added)
+
+    def record(self, position):
+        """Get a customer as a dict by row position"""
+        if position < len(self.customers_df):
+            return self.customers_df.iloc[position].to_dict()
+        with self._lock:
+            return dict(self._added[position - len(self.customers_df)])
+
+    def _lookup(self, mapping, key):
+        with self._lock:
+            position = mapping.get(key)
+            return None if position is None else self.record(position)
+
+    def get(self, customer_id):
+        """Find a customer by id"""
+        return self._lookup(self._by_id, customer_id)
+
+    def find_by_mobile(self, mobile):
+        """Find a customer by mobile number"""
+        return self._lookup(self._by_mobile, mobile_key(mobile))
+
+    def find_by_username(self, username):
+        """Find a customer by username (case-insensitive)"""
+        return self._lookup(self._by_username, _text_key(username))
+
+    def find_by_email(self, email):
+        """Find a customer by email (case-insensitive)"""
+        return self._lookup(self._by_email, _text_key(email))
+
+    def add(self, customer):
+        """Add a newly registered customer (a dict, updated in place) without rebuilding the index
+
+        Returns the customer's row position, or None when the mobile number
+        is already registered (checked under the same lock as the insert).
+        A customer without an id gets the next free one, set on the dict.
+        """
+        mobile = mobile_key(customer.get('mobile', ''))
+        customer['mobile'] = mobile
+        with self._lock:
+            if mobile in self._by_mobile:
+                return None
+            if customer.get('id') is None:
+                customer['id'] = self._next_id
+            self._next_id = max(self._next_id, int(customer['id']) + 1)
+            position = len(self)
+            self._added.append(customer)
+
+            self._by_id[customer['id']] = position
+            self._by_mobile[mobile] = position
+            if customer.get('username'):
+                self._by_username[_text_key(customer['username'])] = position
+            if customer.get('email'):
+                self._by_email[_text_key(customer['email'])] = position
+            return position
+
+    def replay(self, rows):
+        """Add customers logged but not yet compacted into the table (a write log's pending('customers'))
+
+        A row that is also in the table already has its mobile indexed, so
+        add() skips it.
+        """
+        for row in rows:
+            self.add(dict(row))
+        return self
+
+
+def get_customer_index(store=None, write_log=None):
+    """Get the customer index for the current customers.csv, built once per process
+
+    With a `write_log`, registrations it still holds are replayed into a
+    fresh build, so they are not lost when customers.csv changes first.
+    """
+    def build(customers):
+        index = CustomerIndex(customers)
+        return index.replay(write_log.pending('customers')) if write_log is not None else index
+
+    return (store or get_store()).derive('customer_index', ['customers'], build)
@@ -0,0 +1,482 @@
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # literal matches are scored through pandas' string methods instead
+    pa = None
+    pc = None
+
+from customer_index import mobile_key
+from data_store import get_store
+from schemas import TEXT
+
+_CHUNK_ROWS = 100_000
+
+
+def _code_points(values):
+    """Get a (rows x width) int64 matrix of code points, NUL-padded on the right"""
+    text = np.array(values, dtype=str)
+    width = text.dtype.itemsize // 4
+    return text.view(np.uint32).reshape(len(text), width).astype(np.int64)
+
+
+def trigram_keys(values):
+    """Pack every trigram of every value into one int64 (three 21-bit code points)
+
+    Returns the keys together with the position of the value each came from,
+    in row order.
+    """
+    points = _code_points(values)
+    if points.shape[1] < 3:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+
+    keys = (points[:, :-2] << 42) | (points[:, 1:-1] << 21) | points[:, 2:]
+    valid = points[:, 2:] != 0
+    rows = np.broadcast_to(np.arange(len(points))[:, None], keys.shape)
+    return keys[valid], rows[valid]
+
+
+def word_start_keys(values):
+    """Pack the first two characters of every word of every value into one int64
+
+    Also returns whether each word is the first word of its value.
+    """
+    points = _code_points(values)
+    following = np.zeros_like(points)
+    following[:, :-1] = points[:, 1:]
+    previous = np.full_like(points, ord(' '))
+    previous[:, 1:] = points[:, :-1]
+
+    starts = (points != 0) & (points != ord(' ')) & (previous == ord(' '))
+    keys = (points << 21) | following
+    rows = np.broadcast_to(np.arange(len(points))[:, None], keys.shape)
+    first = np.zeros(keys.shape, dtype=bool)
+    first[:, 0] = True
+    return keys[starts], rows[starts], first[starts]
+
+
+def _chunked(key_func, values):
+    """Run a key function over chunks of values, offsetting the row positions"""
+    parts = []
+    for start in range(0, len(values), _CHUNK_ROWS):
+        keys, rows, *extra = key_func(values[start:start + _CHUNK_ROWS])
+        parts.append((keys, rows + start, *extra))
+    if not parts:
+        return key_func([])
+    return tuple(np.concatenate(column) for column in zip(*parts))
+
+
+def _intersect_sorted(small, large):
+    """Intersect two sorted unique arrays by binary-searching the larger one"""
+    if len(small) > len(large):
+        small, large = large, small
+    if not len(small) or not len(large):
+        return small[:0]
+    hits = np.searchsorted(large, small).clip(max=len(large) - 1)
+    return small[large[hits] == small]
+
+
+class TrigramIndex:
+    """Inverted index from 3-character substrings to row positions"""
+
+    def __init__(self, values):
+        self._build(list(values))
+        self._extra = {}
+
+    def _build(self, values):
+        keys, rows = _chunked(trigram_keys, values)
+
+        # Rows come out in ascending order, so a stable sort by trigram leaves
+        # every posting list sorted; repeated trigrams within a value collapse.
+        order = np.argsort(keys, kind='stable')
+        keys, rows = keys[order], rows[order]
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])
+        keys, rows = keys[keep], rows[keep]
+
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.array([], dtype=np.int64)
+        self._keys = keys[starts]
+        self._offsets = np.r_[starts, len(keys)]
+        self._rows = rows
+
+    def add(self, position, value):
+        """Index a row added after the initial build"""
+        keys, _ = trigram_keys([str(value).lower()])
+        for key in set(keys.tolist()):
+            self._extra.setdefault(key, []).append(position)
+
+    def postings(self, key):
+        """Get the sorted row positions whose value contains a packed trigram"""
+        slot = np.searchsorted(self._keys, key)
+        if slot < len(self._keys) and self._keys[slot] == key:
+            rows = self._rows[self._offsets[slot]:self._offsets[slot + 1]]
+        else:
+            rows = self._rows[:0]
+        extra = self._extra.get(key)
+        if extra:
+            rows = np.concatenate([rows, extra])
+        return rows
+
+    def candidates(self, query):
+        """Get rows containing every trigram of the query, or None if it is too short"""
+        keys, _ = trigram_keys([query.lower()])
+        if not len(keys):
+            return None
+
+        lists = sorted((self.postings(key) for key in np.unique(keys)), key=len)
+        result = lists[0]
+        for rows in lists[1:]:
+            if not len(result):
+                break
+            result = _intersect_sorted(result, rows)
+        return result
+
+
+class PrefixIndex:
+    """Index of the first two characters of every word, for one- and two-character queries
+
+    Several fields of the same rows (say names and phones) can share one index.
+    """
+
+    def __init__(self, *fields):
+        keys, rows, first = zip(*(_chunked(word_start_keys, list(values)) for values in fields))
+        keys, rows, first = np.concatenate(keys), np.concatenate(rows), np.concatenate(first)
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._rows = rows[order]
+        self._first = first[order]
+        self._extra = []
+
+    def add(self, position, *values):
+        """Index a row added after the initial build"""
+        for value in values:
+            words = str(value).lower().split()
+            self._extra.extend((word, position, i == 0) for i, word in enumerate(words))
+
+    def matches(self, prefix):
+        """Get (row, is_first_word) for every word that starts with the prefix, unsorted"""
+        points = [ord(char) for char in prefix[:2]]
+        if len(points) == 1:
+            low, high = points[0] << 21, (points[0] + 1) << 21
+        else:
+            low = (points[0] << 21) | points[1]
+            high = low + 1
+        start, stop = np.searchsorted(self._keys, [low, high])
+        rows, first = self._rows[start:stop], self._first[start:stop]
+        extra = [(position, is_first) for word, position, is_first in self._extra if word.startswith(prefix)]
+        if extra:
+            extra_rows, extra_first = zip(*extra)
+            rows = np.concatenate([rows, extra_rows])
+            first = np.concatenate([first, extra_first])
+        return rows, first
+
+    def lookup(self, prefix):
+        """Get the sorted row positions having a word that starts with the prefix"""
+        return np.unique(self.matches(prefix)[0])
+
+
+SEARCH_FIELDS = {
+    # field: (customers.csv column, ranking weight)
+    'name': ('name', 1.0),
+    'phone': ('mobile', 0.9),
+    'username': ('username', 0.9),
+    'email': ('email', 0.8),
+}
+
+# Match quality, best first. Fuzzy matches score below every literal match
+# and are scaled by how many of the query's trigrams they share.
+SCORE_EXACT = 100
+SCORE_PREFIX = 80
+SCORE_WORD_PREFIX = 70
+SCORE_CONTAINS = 50
+SCORE_SOUNDS_LIKE = 45
+SCORE_FUZZY = 40
+
+# Typo tolerance kicks in only when the literal matches cannot fill a
+# couple of pages; a well-spelt common name has no use for it.
+FUZZY_BELOW_MATCHES = 50
+FUZZY_MIN_OVERLAP = 0.5
+
+# Spelling folds for Indian names, applied in order: Lakshmi/Laxmi,
+# Deepika/Dipika, Shreya/Sreya, Vikram/Wikram and Mohammed/Mohamed all fold
+# to the same key. Plain regexes so pyarrow (RE2) and `re` agree.
+NAME_FOLDS = [
+    ('ksh', 'x'), ('ee', 'i'), ('ii', 'i'), ('oo', 'u'), ('aa', 'a'),
+    ('sh', 's'), ('th', 't'), ('dh', 'd'), ('bh', 'b'), ('kh', 'k'), ('gh', 'g'), ('ph', 'f'),
+    ('w', 'v'), ('z', 'j'), ('q', 'k'), ('y', 'i'),
+    ('nn', 'n'), ('mm', 'm'), ('tt', 't'), ('ll', 'l'), ('ss', 's'), ('rr', 'r'),
+    ('kk', 'k'), ('pp', 'p'), ('dd', 'd'), ('vv', 'v'),
+]
+_COMPILED_FOLDS = [(re.compile(pattern), replacement) for pattern, replacement in NAME_FOLDS]
+
+
+def fold_name(text):
+    """Fold a lowercased name to its spelling-insensitive key"""
+    for pattern, replacement in _COMPILED_FOLDS:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _fold_series(values):
+    for pattern, replacement in NAME_FOLDS:
+        values = values.str.replace(pattern, replacement, regex=True)
+    return values
+
+
+def _tier(value, query):
+    """Score one value against the query: exact, prefix, word-prefix, substring or 0"""
+    if value == query:
+        return SCORE_EXACT
+    if value.startswith(query):
+        return SCORE_PREFIX
+    if ' ' + query in value:
+        return SCORE_WORD_PREFIX
+    return SCORE_CONTAINS if query in value else 0
+
+
+def _tiers(values, query):
+    """Score an array (pyarrow) or Series (pandas) of values with _tier's rules, vectorized"""
+    if pc is not None:
+        # One substring search gives prefix and contains (found at 0, found
+        # at all) and, with the byte length, exact too
+        found = pc.fill_null(pc.find_substring(values, query), -1).to_numpy(zero_copy_only=False)
+        length = pc.fill_null(pc.binary_length(values), -1).to_numpy(zero_copy_only=False)
+        prefix = found == 0
+        exact = prefix & (length == len(query.encode()))
+        word_prefix = pc.fill_null(pc.match_substring(values, ' ' + query), False).to_numpy(zero_copy_only=False)
+        contains = found >= 0
+    else:
+        exact = (values == query).to_numpy(dtype=bool, na_value=False)
+        prefix = values.str.startswith(query).to_numpy(dtype=bool, na_value=False)
+        word_prefix = values.str.contains(' ' + query, regex=False).to_numpy(dtype=bool, na_value=False)
+        contains = values.str.contains(query, regex=False).to_numpy(dtype=bool, na_value=False)
+    return np.select(
+        [exact, prefix, word_prefix, contains],
+        [SCORE_EXACT, SCORE_PREFIX, SCORE_WORD_PREFIX, SCORE_CONTAINS],
+        default=0,
+    )
+
+
+class CustomerSearch:
+    """Ranked, paginated customer search over name, phone, username and email
+
+    Customers registered after the build are added in place (add()): their
+    postings go into the indexes' extra lists and their values are scored
+    one by one, and the result cache is cleared. Results are row positions
+    in build-then-add order; ids() maps them to customer ids.
+    """
+
+    def __init__(self, customers_df, cache_size=1024):
+        self.customers_df = customers_df
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._values = {
+            field: customers_df[column].astype(TEXT).str.lower().reset_index(drop=True)
+            for field, (column, _) in SEARCH_FIELDS.items()
+        }
+        self._folded = _fold_series(self._values['name'])
+        self._lists = {field: values.tolist() for field, values in self._values.items()}
+        # Arrow arrays score a few thousand candidates in one compute call
+        # each, without pandas' per-call overhead.
+        self._columns = self._values
+        if pa is not None:
+            self._columns = {field: pa.array(values, from_pandas=True) for field, values in self._values.items()}
+        self._ids = customers_df['id'].to_numpy(dtype=np.int64)
+        self._size = len(customers_df)
+
+        # Rows registered since the build, scored from these lists
+        self._added = {field: [] for field in SEARCH_FIELDS}
+        self._added_folded = []
+        self._added_ids = []
+
+        self._indexes = {field: TrigramIndex(values) for field, values in self._lists.items()}
+        # Pad with spaces so word boundaries contribute trigrams too, which is
+        # what lets short misspellings ("partel") still overlap enough.
+        self._folded_index = TrigramIndex((' ' + self._folded + ' ').tolist())
+        self._prefix_indexes = {field: PrefixIndex(values) for field, values in self._lists.items()}
+
+    def __len__(self):
+        return self._size + len(self._added_ids)
+
+    def add(self, customer):
+        """Index a newly registered customer (a dict of customers.csv columns) and drop cached results"""
+        values = {}
+        for field, (column, _) in SEARCH_FIELDS.items():
+            value = customer.get(column)
+            value = mobile_key(value) if field == 'phone' and value is not None else value
+            values[field] = '' if value is None else str(value).lower()
+        folded = fold_name(values['name'])
+        with self._lock:
+            position = len(self)
+            for field, value in values.items():
+                self._added[field].append(value)
+                self._indexes[field].add(position, value)
+                self._prefix_indexes[field].add(position, value)
+            self._added_folded.append(folded)
+            self._folded_index.add(position, f" {folded} ")
+            self._added_ids.append(int(customer['id']) if customer.get('id') is not None else -1)
+            self._cache.clear()
+        return position
+
+    def ids(self, positions):
+        """Get the customer id at each row position (-1 for a registration without one)"""
+        positions = np.asarray(positions, dtype=np.int64)
+        with self._lock:
+            ids = np.concatenate([self._ids, np.array(self._added_ids, dtype=np.int64)])
+        return ids[positions]
+
+    def search(self, query, page=1, page_size=20):
+        """Get one page of ranked matches as a dict of positions and scores"""
+        positions, scores = self.ranked(query)
+        total = len(positions)
+        pages = max(1, -(-total // page_size))
+        page = min(max(1, page), pages)
+        start = (page - 1) * page_size
+        return {
+            'query': query,
+            'total': total,
+            'page': page,
+            'pages': pages,
+            'positions': positions[start:start + page_size].tolist(),
+            'scores': scores[start:start + page_size].tolist(),
+        }
+
+    def ranked(self, query):
+        """Get every matching row position and its score, best match first"""
+        query = ' '.join(query.lower().split())
+        with self._lock:
+            if not query:
+                return np.arange(len(self)), np.zeros(len(self))
+            if query in self._cache:
+                self._cache.move_to_end(query)
+                return self._cache[query]
+
+            result = self._rank(query)
+            self._cache[query] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            return result
+
+    def ranked_ids(self, query):
+        """Get the customer id and score of every match, best match first"""
+        positions, scores = self.ranked(query)
+        return self.ids(positions), scores
+
+    def ranked_rows(self, query, customers_df):
+        """Get the row positions in customers_df (matched on id) of every match, best match first
+
+        Matches without a row there, such as registrations the frame was
+        built before, are left out.
+        """
+        ids, _ = self.ranked_ids(query)
+        rows = pd.Index(customers_df['id']).get_indexer(ids)
+        return rows[rows >= 0]
+
+    def _rank(self, query):
+        # Best score per row across fields, kept dense so merging fields and
+        # excluding literal hits from the fuzzy pass are plain array ops
+        best = np.zeros(len(self))
+        if len(query) < 3:
+            self._score_prefix(query, best)
+        else:
+            self._score_literal(query, best)
+
+        matched = best > 0
+        if len(query) >= 3 and not query.isdigit() and np.count_nonzero(matched) < FUZZY_BELOW_MATCHES:
+            self._add_fuzzy(query, best)
+            matched = best > 0
+
+        # Ascending positions, stably sorted by score: ties stay in row order.
+        # Scores to the hundredth fit a 16-bit key, which numpy radix-sorts.
+        positions = np.flatnonzero(matched)
+        order = np.argsort(-np.rint(best[positions] * 100).astype(np.int16), kind='stable')
+        return positions[order], best[positions[order]]
+
+    def _score_prefix(self, query, best):
+        """Score one- and two-character queries as prefix or word-prefix matches"""
+        for field, (_, weight) in SEARCH_FIELDS.items():
+            rows, first = self._prefix_indexes[field].matches(query)
+            # A row can repeat (several words match); within each pass every
+            # hit scores the same, so plain fancy assignment is safe and far
+            # cheaper than np.maximum.at.
+            for hits, score in ((rows[~first], SCORE_WORD_PREFIX), (rows[first], SCORE_PREFIX)):
+                best[hits] = np.maximum(best[hits], score * weight)
+
+    def _score_literal(self, query, best):
+        """Score exact, prefix, word-prefix and substring matches, field by field
+
+        Each field is only checked on its own trigram candidates, so a common
+        surname does not make every email and username get scanned too.
+        """
+        for field, (_, weight) in SEARCH_FIELDS.items():
+            candidates = self._indexes[field].candidates(query)
+            if not len(candidates):
+                continue
+            # Postings are sorted, so rows added since the build come last
+            split = np.searchsorted(candidates, self._size)
+            base = candidates[:split]
+            if pa is not None:
+                score = _tiers(self._columns[field].take(pa.array(base)), query)
+            else:
+                score = _tiers(self._columns[field].iloc[base], query)
+            if split < len(candidates):
+                added = self._added[field]
+                extra = [_tier(added[position - self._size], query) for position in candidates[split:].tolist()]
+                score = np.concatenate([score, np.array(extra, dtype=score.dtype)])
+            matched = score > 0
+            rows = candidates[matched]
+            best[rows] = np.maximum(best[rows], score[matched] * weight)
+
+    def _add_fuzzy(self, query, best):
+        """Add names that sound alike or share most of the query's trigrams"""
+        folded = fold_name(query)
+        keys, _ = trigram_keys([f" {folded} "])
+        keys = np.unique(keys)
+        if not len(keys):
+            return
+
+        postings = [self._folded_index.postings(key) for key in keys]
+        counts = np.bincount(np.concatenate(postings), minlength=len(self))
+        needed = max(1, int(np.ceil(len(keys) * FUZZY_MIN_OVERLAP)))
+        fuzzy = np.flatnonzero((counts >= needed) & (best == 0))
+        if not len(fuzzy):
+            return
+
+        similarity = counts[fuzzy] / len(keys)
+        split = np.searchsorted(fuzzy, self._size)
+        sounds_like = np.concatenate([
+            self._folded.iloc[fuzzy[:split]].str.contains(folded, regex=False).to_numpy(dtype=bool, na_value=False),
+            np.array([folded in self._added_folded[position - self._size] for position in fuzzy[split:].tolist()], dtype=bool),
+        ])
+        best[fuzzy] = np.where(sounds_like, SCORE_SOUNDS_LIKE, SCORE_FUZZY * similarity)
+
+    def clear_cache(self):
+        """Forget cached query results"""
+        with self._lock:
+            self._cache.clear()
+
+
+def get_customer_search(store=None, write_log=None):
+    """Get the search engine for the current customers.csv, built once per process
+
+    With a `write_log`, registrations it holds that are not in the table
+    yet are added to a fresh build.
+    """
+    def build(customers):
+        search = CustomerSearch(customers)
+        if write_log is not None:
+            known = set(customers['id'].tolist())
+            for row in write_log.pending('customers'):
+                if int(row['id']) not in known:
+                    search.add(row)
+        return search
+
+    return (store or get_store()).derive('customer_search', ['customers'], build)
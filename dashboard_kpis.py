@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from currency import format_rupee, format_rupees
+from data_store import get_store
+from rollups import get_sales_rollups, make_sales_rollups
+
+KPI_TTL_SECONDS = float(os.environ.get('JEWELLERY_KPI_TTL', 60))
+RECENT_TRANSACTIONS = 5
+
+# Tile aggregates and the latest transactions, pushed down on the SQLite backend
+CUSTOMER_KPI_SQL = """
+    SELECT COUNT(*) AS customers,
+           COALESCE(SUM(joined_date >= ?), 0) AS joined,
+           COALESCE(SUM(pending_amount), 0) AS pending,
+           COALESCE(SUM(pending_amount > 0), 0) AS owing
+    FROM customers
+"""
+
+CHIT_KPI_SQL = """
+    SELECT COALESCE(SUM(status = 'active'), 0) AS active,
+           COALESCE(SUM(status = 'active' AND joined_date >= ?), 0) AS joined
+    FROM chit_members
+"""
+
+RECENT_TRANSACTIONS_SQL = """
+    SELECT recent.id, recent.invoice_id, customers.name, recent.amount, recent.date, recent.status
+    FROM (SELECT rowid, * FROM transactions ORDER BY date DESC, rowid LIMIT ?) AS recent
+    LEFT JOIN customers ON customers.id = recent.customer_id
+    ORDER BY recent.date DESC, recent.rowid
+"""
+
+
+def _month_start():
+    return pd.Timestamp.now().normalize().replace(day=1)
+
+
+def _total_sales(store, rollups):
+    months = rollups.monthly_summary()
+    delta = None
+    if len(months) > 1:
+        change = months['total_sales'].iloc[-1] - months['total_sales'].iloc[-2]
+        delta = f"{'+' if change >= 0 else '-'}{format_rupee(abs(change))} vs last month"
+    return format_rupee(rollups.totals()['total_sales']), delta
+
+
+def _sql_row(store, sql):
+    """Get the single row of an aggregate query filtered from the start of this month"""
+    return store.query(sql, (_month_start().strftime('%Y-%m-%d'),)).iloc[0]
+
+
+def _total_customers(store, rollups):
+    if getattr(store, 'supports_sql', False):
+        row = _sql_row(store, CUSTOMER_KPI_SQL)
+        return f"{int(row['customers']):,}", f"+{int(row['joined']):,} this month"
+    customers = store.get('customers')
+    joined = int((customers['joined_date'] >= _month_start()).sum())
+    return f"{len(customers):,}", f"+{joined:,} this month"
+
+
+def _pending_dues(store, rollups):
+    if getattr(store, 'supports_sql', False):
+        row = _sql_row(store, CUSTOMER_KPI_SQL)
+        return format_rupee(int(row['pending'])), f"{int(row['owing']):,} customers"
+    customers = store.get('customers')
+    pending = customers['pending_amount'].to_numpy(dtype=np.int64)
+    return format_rupee(pending.sum()), f"{int((pending > 0).sum()):,} customers"
+
+
+def _active_chits(store, rollups):
+    if getattr(store, 'supports_sql', False):
+        row = _sql_row(store, CHIT_KPI_SQL)
+        return f"{int(row['active']):,}", f"+{int(row['joined']):,} this month"
+    members = store.get('chit_members')
+    active = members['status'] == 'active'
+    joined = int((active & (members['joined_date'] >= _month_start())).sum())
+    return f"{int(active.sum()):,}", f"+{joined:,} this month"
+
+
+# The KPI row, left to right: (key, label, compute(store, rollups) -> (value, delta))
+KPI_TILES = [
+    ('total_sales', '💰 Total Sales', _total_sales),
+    ('total_customers', '👥 Total Customers', _total_customers),
+    ('pending_dues', '🧾 Pending Dues', _pending_dues),
+    ('active_chits', '💎 Active Chits', _active_chits),
+]
+
+
+def _recent_transactions_sql(store, limit):
+    """Get the latest transactions with customer names from the date index"""
+    recent = store.query(RECENT_TRANSACTIONS_SQL, (limit,))
+    return pd.DataFrame({
+        'Transaction ID': recent['invoice_id'].fillna(recent['id'].astype(str)).to_numpy(),
+        'Customer': recent['name'].fillna('-').to_numpy(),
+        'Amount': format_rupees(recent['amount'].to_numpy()),
+        'Date': recent['date'].str.slice(0, 10).to_numpy(),
+        'Status': ['✅ Completed' if status == 'completed' else '⏳ Pending' for status in recent['status']],
+    })
+
+
+def _recent_transactions(store, limit=RECENT_TRANSACTIONS):
+    """Get the latest transactions with customer names, without sorting the whole table"""
+    if getattr(store, 'supports_sql', False):
+        return _recent_transactions_sql(store, limit)
+    transactions = store.get('transactions')
+    if transactions.empty:
+        return transactions
+    dates = transactions['date'].to_numpy().view(np.int64)
+    limit = min(limit, len(dates))
+    # The table is append-only, so the newest dates are near the end: the
+    # tail gives a cutoff and only rows at or after it need ranking.
+    cutoff = np.partition(dates[-limit * 100:], -limit)[-limit]
+    candidates = np.flatnonzero(dates >= cutoff)
+    latest = candidates[np.argsort(-dates[candidates], kind='stable')[:limit]]
+    recent = transactions.iloc[latest]
+    customers = store.get('customers')
+    names = pd.Series(customers['name'].to_numpy(), index=customers['id'].to_numpy())
+    return pd.DataFrame({
+        'Transaction ID': recent['invoice_id'].to_numpy() if 'invoice_id' in recent else recent['id'].to_numpy(),
+        'Customer': names.reindex(recent['customer_id'].to_numpy()).fillna('-').to_numpy(),
+        'Amount': format_rupees(recent['amount'].to_numpy()),
+        'Date': recent['date'].dt.strftime('%Y-%m-%d').to_numpy(),
+        'Status': ['✅ Completed' if status == 'completed' else '⏳ Pending' for status in recent['status'].astype(object)],
+    })
+
+
+def build_kpi_snapshot(store=None, rollups=None):
+    """Compute every dashboard KPI tile and chart series, timing each one"""
+    store = store or get_store()
+    started = time.perf_counter()
+    rollups = (rollups or make_sales_rollups(store)).refresh()
+    refresh_ms = (time.perf_counter() - started) * 1000
+
+    tiles = []
+    for key, label, compute in KPI_TILES:
+        tile_started = time.perf_counter()
+        value, delta = compute(store, rollups)
+        tiles.append({
+            'key': key, 'label': label, 'value': value, 'delta': delta,
+            'ms': (time.perf_counter() - tile_started) * 1000,
+        })
+
+    timings = {'rollups': refresh_ms}
+    step = time.perf_counter()
+    register = rollups.register_daily.frame()
+    trend = pd.DataFrame({'date': register.index, 'sales': register['register_sales'].to_numpy()})
+    timings['trend'] = (time.perf_counter() - step) * 1000
+
+    step = time.perf_counter()
+    totals = rollups.totals()
+    categories = {name.title(): totals[f"{name}_sales"] for name in ('gold', 'silver', 'diamond', 'other')}
+    timings['categories'] = (time.perf_counter() - step) * 1000
+
+    step = time.perf_counter()
+    recent = _recent_transactions(store)
+    timings['recent'] = (time.perf_counter() - step) * 1000
+
+    return {
+        'tiles': tiles,
+        'trend': trend,
+        'categories': categories,
+        'recent': recent,
+        'timings': timings,
+        'built_at': time.monotonic(),
+        'build_ms': (time.perf_counter() - started) * 1000,
+        'store': store,
+    }
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def get_kpi_snapshot(ttl=None, force=False):
+    """Get the shared KPI snapshot, rebuilt once it is older than `ttl` seconds"""
+    global _snapshot
+    ttl = KPI_TTL_SECONDS if ttl is None else ttl
+    with _snapshot_lock:
+        store = get_store()
+        stale = (
+            _snapshot is None
+            or force
+            or _snapshot['store'] is not store
+            or time.monotonic() - _snapshot['built_at'] >= ttl
+        )
+        if stale:
+            _snapshot = build_kpi_snapshot(store, get_sales_rollups())
+        return _snapshot
@@ -0,0 +1,436 @@
+import csv
+import io
+import itertools
+import os
+import threading
+import time
+import zlib
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # snapshots are optional, CSV loading still works
+    pa = None
+    feather = None
+
+from schemas import TABLES
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.environ.get('JEWELLERY_SNAPSHOT_DIR', os.path.join(DATA_DIR, '.snapshots'))
+BACKEND = os.environ.get('JEWELLERY_BACKEND', 'csv')
+BACKENDS = ['csv', 'sqlite']
+
+
+class DataStore:
+    # Whether query() runs SQL against the tables, so aggregates can be pushed down
+    supports_sql = False
+
+    def __init__(self, data_dir=DATA_DIR, tables=None, snapshot_dir=None):
+        self.data_dir = data_dir
+        self.tables = tables if tables is not None else TABLES
+        self.snapshot_dir = snapshot_dir if feather is not None else None
+        self._cache = {}
+        self._derived = {}
+        self._generations = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def path(self, name):
+        """Get the CSV path backing a table"""
+        return os.path.join(self.data_dir, self.tables[name]['file'])
+
+    def snapshot_path(self, name):
+        """Get the Feather snapshot path for a table"""
+        return os.path.join(self.snapshot_dir, f"{name}.feather")
+
+    def get(self, name):
+        """Get a read-only view of a table, reloading only if the file changed"""
+        if name not in self.tables:
+            raise KeyError(f"Unknown table: {name}")
+
+        version = self._version(name)
+        with self._lock:
+            entry = self._cache.get(name)
+            if entry is None or entry['version'] != version:
+                entry = self._load(name, version)
+            return entry['frame'].copy(deep=False)
+
+    def generation(self, name):
+        """Get a token that stays the same while a table only has rows appended
+
+        It changes on every full reload (a rewritten or edited file), so a
+        caller folding in rows incrementally knows to start over. Read it
+        before get(): a reload in between then costs a rebuild, not a miss.
+        """
+        with self._lock:
+            self.get(name)
+            return self._cache[name]['generation']
+
+    def derive(self, key, sources, build, lazy=False, variant=None):
+        """Get a frame (or index) built from other tables, rebuilt only when a source changes
+
+        With `lazy` the sources are not loaded: build() is called with no
+        arguments and queries the store itself, and only their versions are
+        checked. A `variant` (say, today's date) is checked like a version,
+        so a new one replaces the entry under `key` instead of adding one.
+        """
+        with self._lock:
+            if lazy:
+                frames = {}
+                version = tuple(self._version(name) for name in sources)
+            else:
+                frames = {name: self.get(name) for name in sources}
+                version = tuple(self._cache[name]['version'] for name in sources)
+            version = (version, variant)
+            entry = self._derived.get(key)
+            if entry is None or entry['version'] != version:
+                value = build(**frames)
+                entry = {'version': version, 'value': read_only(value) if isinstance(value, pd.DataFrame) else value}
+                self._derived[key] = entry
+            value = entry['value']
+            return value.copy(deep=False) if isinstance(value, pd.DataFrame) else value
+
+    def invalidate(self, name=None):
+        """Drop one table (or everything) from the cache"""
+        with self._lock:
+            if name is None:
+                self._cache.clear()
+                self._derived.clear()
+            else:
+                self._cache.pop(name, None)
+
+    def stats(self):
+        """Get load time and memory footprint of every cached table"""
+        with self._lock:
+            rows = [
+                {
+                    'table': name,
+                    'rows': len(entry['frame']),
+                    'load_ms': entry['load_seconds'] * 1000,
+                    'memory_kb': entry['memory_bytes'] / 1024,
+                    'mode': entry['mode'],
+                    'appended_rows': entry['appended_rows'],
+                    'loaded_at': entry['loaded_at'],
+                }
+                for name, entry in self._cache.items()
+            ]
+        columns = ['table', 'rows', 'load_ms', 'memory_kb', 'mode', 'appended_rows', 'loaded_at']
+        return pd.DataFrame(rows, columns=columns)
+
+    def memory_report(self, names=None):
+        """Compare per-column memory of pandas-default frames against the compact schema"""
+        rows = []
+        for name in names or self.tables:
+            before = pd.read_csv(self.path(name))
+            after = self.get(name)
+            before_bytes = before.memory_usage(deep=True, index=False)
+            after_bytes = after.memory_usage(deep=True, index=False)
+            for column in after.columns:
+                rows.append({
+                    'table': name,
+                    'column': column,
+                    'before_dtype': str(before[column].dtype),
+                    'after_dtype': str(after[column].dtype),
+                    'before_bytes': int(before_bytes[column]),
+                    'after_bytes': int(after_bytes[column]),
+                })
+        report = pd.DataFrame(rows)
+        report['ratio'] = report['before_bytes'] / report['after_bytes'].clip(lower=1)
+        return report
+
+    def _version(self, name):
+        """Get a token that changes whenever a table's data changes"""
+        return os.stat(self.path(name)).st_mtime_ns
+
+    def _load(self, name, version):
+        spec = self.tables[name]
+        previous = self._cache.get(name)
+        started = time.perf_counter()
+
+        entry = None
+        if previous is not None and spec.get('append_only'):
+            entry = self._load_appended(name, previous)
+        if entry is None:
+            entry = self._load_full(name)
+            entry['generation'] = next(self._generations)
+        else:
+            entry['generation'] = previous['generation']
+
+        entry.update({
+            'frame': read_only(entry['frame']),
+            'version': version,
+            'load_seconds': time.perf_counter() - started,
+            'memory_bytes': int(entry['frame'].memory_usage(deep=True).sum()),
+            'loaded_at': pd.Timestamp.now(),
+        })
+        self._cache[name] = entry
+        return entry
+
+    def _load_full(self, name):
+        if self.snapshot_dir:
+            entry = self._read_snapshot(name)
+            if entry is not None:
+                return entry
+
+        # Stat before reading, and snapshot only what matches that stat: a row
+        # appended later then leaves the snapshot stale, not fresh without it
+        source = os.stat(self.path(name))
+        with open(self.path(name), 'rb') as f:
+            data = f.read()
+
+        # Only newline-terminated rows count as read; a partially written
+        # last line is picked up by the next incremental reload.
+        offset = data.rfind(b'\n') + 1
+        frame = self._parse(name, data[:offset])
+        entry = {
+            'frame': frame,
+            'offset': offset,
+            'checksum': zlib.crc32(data[:offset]),
+            'columns': list(frame.columns),
+            'mode': 'full',
+            'appended_rows': 0,
+        }
+        if self.snapshot_dir and len(data) == source.st_size:
+            self._write_snapshot(name, entry, source)
+        return entry
+
+    def build_snapshots(self):
+        """Convert every CSV source into a fresh Feather snapshot"""
+        if not self.snapshot_dir:
+            raise RuntimeError("Snapshots need pyarrow and a snapshot_dir")
+        with self._lock:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            for name in self.tables:
+                self._cache.pop(name, None)
+                stale = self.snapshot_path(name)
+                if os.path.exists(stale):
+                    os.remove(stale)
+                self.get(name)
+
+    def _read_snapshot(self, name):
+        """Load a table from its snapshot, or None when missing or stale"""
+        path = self.snapshot_path(name)
+        if not os.path.exists(path):
+            return None
+
+        table = feather.read_table(path)
+        meta = table.schema.metadata or {}
+        source = os.stat(self.path(name))
+        if (
+            meta.get(b'source_mtime') != str(source.st_mtime_ns).encode()
+            or meta.get(b'source_size') != str(source.st_size).encode()
+        ):
+            return None
+
+        frame = table.to_pandas(types_mapper=_ARROW_TYPES.get)
+        return {
+            'frame': frame,
+            'offset': int(meta[b'offset']),
+            'checksum': int(meta[b'checksum']),
+            'columns': list(frame.columns),
+            'mode': 'snapshot',
+            'appended_rows': 0,
+        }
+
+    def _write_snapshot(self, name, entry, source):
+        """Save a table's frame as a snapshot, fresh for as long as the source still matches `source` (its stat)"""
+        table = pa.Table.from_pandas(entry['frame'], preserve_index=False)
+        meta = dict(table.schema.metadata or {})
+        meta.update({
+            b'source_mtime': str(source.st_mtime_ns).encode(),
+            b'source_size': str(source.st_size).encode(),
+            b'offset': str(entry['offset']).encode(),
+            b'checksum': str(entry['checksum']).encode(),
+        })
+        table = table.replace_schema_metadata(meta)
+
+        # Write to a temp file first so other processes never read half a snapshot
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            tmp_path = self.snapshot_path(name) + f".{os.getpid()}.tmp"
+            feather.write_feather(table, tmp_path)
+            os.replace(tmp_path, self.snapshot_path(name))
+        except OSError:
+            pass
+
+    def append_rows(self, name, rows):
+        """Durably append rows (dicts keyed by column) to a table's CSV"""
+        path = self.path(name)
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            columns = next(csv.reader(f))
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, restval='', extrasaction='ignore', lineterminator='\n')
+        writer.writerows({key: '' if value is None else value for key, value in row.items()} for row in rows)
+        with open(path, 'ab') as f:
+            f.write(buffer.getvalue().encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def fold_marker(self, names):
+        """Remember where each table ends, so a half-done append can be undone"""
+        return {name: os.path.getsize(self.path(name)) for name in names}
+
+    def undo_fold(self, marker):
+        """Cut tables back to a fold_marker()"""
+        for name, size in marker.items():
+            with open(self.path(name), 'r+b') as f:
+                f.truncate(size)
+
+    def monthly_summary(self):
+        """Get per-month sales totals from the transactions table"""
+        sales = self.get('transactions')
+        sales = sales[sales['type'] == 'sale']
+        month = sales['date'].dt.strftime('%Y-%m')
+        amount = sales['amount'].astype('int64')
+        by_category = amount.groupby([month, sales['category'].astype(object)]).sum().unstack(fill_value=0)
+        summary = pd.DataFrame({
+            'total_sales': amount.groupby(month).sum(),
+            'total_transactions': amount.groupby(month).size(),
+            'gold_sales': by_category.get('gold', 0),
+            'silver_sales': by_category.get('silver', 0),
+            'diamond_sales': by_category.get('diamond', 0),
+            'other_sales': by_category.get('other', 0),
+            'avg_transaction': amount.groupby(month).mean().round(),
+            'total_customers': sales['customer_id'].groupby(month).nunique(),
+        })
+        return summary.fillna(0).astype('int64').rename_axis('month').reset_index()
+
+    def attendance_counts(self, year, month):
+        """Get per-staff attendance status counts for one month, counting a corrected day once"""
+        attendance = self.get('attendance')
+        start = pd.Timestamp(year=year, month=month, day=1)
+        attendance = attendance[(attendance['date'] >= start) & (attendance['date'] < start + pd.offsets.MonthBegin(1))]
+        attendance = attendance.drop_duplicates(['staff_id', 'date'], keep='last')
+        return pd.crosstab(attendance['staff_id'], attendance['status'].astype(object))
+
+    def _load_appended(self, name, previous):
+        """Parse only the rows appended since the last load, or None if a full reload is needed"""
+        offset = previous['offset']
+        with open(self.path(name), 'rb') as f:
+            prefix = f.read(offset)
+            if len(prefix) < offset or zlib.crc32(prefix) != previous['checksum']:
+                return None
+            tail = f.read()
+
+        tail = tail[:tail.rfind(b'\n') + 1]
+        frame = previous['frame']
+        appended = 0
+        if tail:
+            new_rows = self._parse(name, tail, names=previous['columns'])
+            appended = len(new_rows)
+            frame = _concat_rows(frame, new_rows)
+
+        return {
+            'frame': frame,
+            'offset': offset + len(tail),
+            'checksum': zlib.crc32(tail, previous['checksum']),
+            'columns': previous['columns'],
+            'mode': 'append',
+            'appended_rows': appended,
+        }
+
+    def _parse(self, name, data, names=None):
+        spec = self.tables[name]
+        frame = pd.read_csv(
+            io.BytesIO(data),
+            dtype=spec['dtype'],
+            parse_dates=spec['parse_dates'],
+            header=None if names else 'infer',
+            names=names,
+        )
+        if frame.empty:
+            # With no rows read_csv leaves date columns as object; give them the schema's dtype
+            dates = {column: 'datetime64[ns]' for column in spec['parse_dates'] if column in frame.columns}
+            frame = frame.astype(dates)
+        return frame
+
+_ARROW_TYPES = {}
+if pa is not None:
+    _ARROW_TYPES = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+
+
+def read_only(frame):
+    """Get a frame over the same data with its numpy arrays flagged read-only
+
+    The store hands out shallow copies of one cached frame, so an in-place
+    write (df.loc[mask, 'a'] = x) would change it for every session; with
+    the flag off it raises instead. Adding or replacing a whole column
+    (df['a'] = x) only touches the caller's copy and still works. Object
+    columns stay writable: pandas reads them through writable memoryviews
+    (memory_usage(deep=True) among others) and fails on a read-only one.
+    """
+    columns = {}
+    for column in frame.columns:
+        values = frame[column].array
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            codes = values.codes.view()
+            codes.flags.writeable = False
+            values = pd.Categorical.from_codes(codes, dtype=values.dtype)
+        elif isinstance(frame[column].dtype, np.dtype) and frame[column].dtype != object:
+            values = frame[column].to_numpy(copy=False).view()
+            values.flags.writeable = False
+        # Arrow-backed columns are immutable already
+        columns[column] = values
+    return pd.DataFrame(columns, index=frame.index, columns=frame.columns, copy=False)
+
+
+def _concat_rows(frame, new_rows):
+    """Append rows, keeping categorical columns categorical"""
+    if frame.empty:
+        # Nothing to keep: an empty table's dtypes are only what its header implied
+        return new_rows.reset_index(drop=True)
+    frame = frame.copy(deep=False)
+    for column in frame.columns:
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            categories = frame[column].cat.categories.union(new_rows[column].astype(object).dropna().unique())
+            frame[column] = frame[column].cat.set_categories(categories)
+            new_rows[column] = pd.Categorical(new_rows[column], categories=categories)
+    return pd.concat([frame, new_rows], ignore_index=True)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def _open_store(backend):
+    if backend == 'sqlite':
+        from sqlite_store import SQLiteStore
+        return SQLiteStore()
+    if backend == 'csv':
+        return DataStore(snapshot_dir=SNAPSHOT_DIR)
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+def get_store():
+    """Get the process-wide data store shared by every session"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = _open_store(BACKEND)
+        return _store
+
+
+def get_backend():
+    """Get the name of the storage backend in use"""
+    return BACKEND
+
+
+def use_backend(backend):
+    """Switch every session over to another storage backend"""
+    global _store, BACKEND
+    with _store_lock:
+        if backend != BACKEND or _store is None:
+            _store = _open_store(backend)
+            BACKEND = backend
+        return _store
+
+
+def load_table(name):
+    """Get a read-only view of a table from the shared store"""
+    return get_store().get(name)
+
+
+def memory_report(names=None):
+    """Get before/after bytes per column for the shared store's tables"""
+    return get_store().memory_report(names)
@@ -0,0 +1,626 @@
+import asyncio
+import json
+import os
+import random
+import smtplib
+import string
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from email.message import EmailMessage
+
+import numpy as np
+import pandas as pd
+
+from currency import format_rupees
+from data_store import DATA_DIR
+
+DISPATCH_DIR = os.environ.get('JEWELLERY_DISPATCH_DIR', os.path.join(DATA_DIR, '.dispatch'))
+
+CHANNELS = ['whatsapp', 'sms', 'email']
+CHANNEL_LABELS = {'whatsapp': 'WhatsApp', 'sms': 'SMS', 'email': 'Email'}
+
+# Sends per second and burst size per channel (WhatsApp Cloud API's default
+# throughput is 80 messages a second)
+CHANNEL_LIMITS = {'whatsapp': (80, 80), 'sms': (30, 30), 'email': (10, 20), 'fake': (1000, 1000)}
+
+# Messages rendered and sent together, and batches of one job in flight at once
+BATCH_SIZE = 100
+CONCURRENT_BATCHES = 4
+
+# Retryable failures are retried with exponential backoff and jitter
+MAX_ATTEMPTS = 5
+BACKOFF_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+# Columns kept per recipient; templates can use any of them
+RECIPIENT_COLUMNS = ['id', 'name', 'phone', 'email', 'pending_amount', 'tier']
+
+WHATSAPP_API = 'https://graph.facebook.com/v18.0'
+# Language of the approved message template, when one is configured
+WHATSAPP_TEMPLATE_LANGUAGE = 'en'
+
+
+class DispatchError(Exception):
+    """A message could not be sent; `retryable` says whether trying again may help"""
+
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def _retryable(error):
+    if isinstance(error, DispatchError):
+        return error.retryable
+    return isinstance(error, (OSError, asyncio.TimeoutError))
+
+
+def _http_error(error):
+    """Get a DispatchError for an HTTP error; rate limits and server errors are worth retrying"""
+    return DispatchError(f"HTTP {error.code}: {error.reason}", retryable=error.code == 429 or error.code >= 500)
+
+
+def _post_json(url, payload, headers, timeout=10):
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode('utf-8'), method='POST',
+        headers=dict(headers, **{'Content-Type': 'application/json'}),
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read() or b'{}')
+    except urllib.error.HTTPError as error:
+        raise _http_error(error) from error
+
+
+class ChannelAdapter:
+    """Sends rendered messages on one channel
+
+    A message is a dict with `to`, `subject` and `body`. Subclasses
+    implement send(); send_batch() returns None or the exception for each
+    message, in order.
+    """
+
+    channel = None
+    address = 'phone'
+
+    async def send(self, message):
+        raise NotImplementedError
+
+    async def send_batch(self, messages):
+        return await asyncio.gather(*(self.send(message) for message in messages), return_exceptions=True)
+
+
+class WhatsAppAdapter(ChannelAdapter):
+    """WhatsApp Cloud API messages from one business phone number
+
+    Business-initiated messages are only delivered as an approved template;
+    free-form text is rejected (HTTP 400) unless the customer wrote in
+    within the last 24 hours. With `template` set, every message is sent as
+    that template with the rendered text as its one body parameter ({{1}}).
+    Without it messages go as plain text and only reach customers inside
+    that window.
+    """
+
+    channel = 'whatsapp'
+
+    def __init__(self, phone_number_id, access_token, country_code='91', template=None, language=WHATSAPP_TEMPLATE_LANGUAGE):
+        self.phone_number_id = phone_number_id
+        self.access_token = access_token
+        self.country_code = country_code
+        self.template = template or None
+        self.language = language or WHATSAPP_TEMPLATE_LANGUAGE
+
+    def _number(self, phone):
+        digits = ''.join(char for char in str(phone) if char.isdigit())
+        return self.country_code + digits if len(digits) == 10 else digits
+
+    def payload(self, message):
+        """Get the Cloud API request body for one rendered message"""
+        payload = {'messaging_product': 'whatsapp', 'to': self._number(message['to'])}
+        if self.template is None:
+            return dict(payload, type='text', text={'body': message['body']})
+        # Template parameters may not contain newlines, tabs or runs of spaces
+        text = ' '.join(message['body'].split())
+        return dict(payload, type='template', template={
+            'name': self.template,
+            'language': {'code': self.language},
+            'components': [{'type': 'body', 'parameters': [{'type': 'text', 'text': text}]}],
+        })
+
+    def _post(self, message):
+        _post_json(
+            f"{WHATSAPP_API}/{self.phone_number_id}/messages", self.payload(message),
+            {'Authorization': f"Bearer {self.access_token}"},
+        )
+
+    async def send(self, message):
+        await asyncio.to_thread(self._post, message)
+
+    def check(self):
+        """Look up the phone number with the credentials; raises DispatchError if they are rejected"""
+        request = urllib.request.Request(
+            f"{WHATSAPP_API}/{self.phone_number_id}", headers={'Authorization': f"Bearer {self.access_token}"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            raise _http_error(error) from error
+
+
+class SMSAdapter(ChannelAdapter):
+    """SMS through an HTTP gateway that takes {to, from, text} as JSON with a bearer key"""
+
+    channel = 'sms'
+
+    def __init__(self, url, api_key, sender):
+        self.url = url
+        self.api_key = api_key
+        self.sender = sender
+
+    def _post(self, message):
+        _post_json(self.url, {'to': message['to'], 'from': self.sender, 'text': message['body']},
+                   {'Authorization': f"Bearer {self.api_key}"})
+
+    async def send(self, message):
+        await asyncio.to_thread(self._post, message)
+
+
+class EmailAdapter(ChannelAdapter):
+    """Email over SMTP (STARTTLS), one connection per batch"""
+
+    channel = 'email'
+    address = 'email'
+
+    def __init__(self, host, port, username, password, sender):
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.sender = sender
+
+    def _send_all(self, messages):
+        results = []
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            for message in messages:
+                email = EmailMessage()
+                email['From'], email['To'], email['Subject'] = self.sender, message['to'], message['subject']
+                email.set_content(message['body'])
+                try:
+                    smtp.send_message(email)
+                    results.append(None)
+                except smtplib.SMTPRecipientsRefused:
+                    results.append(DispatchError(f"Recipient refused: {message['to']}", retryable=False))
+                except smtplib.SMTPException as error:
+                    results.append(DispatchError(str(error)))
+        return results
+
+    async def send_batch(self, messages):
+        try:
+            return await asyncio.to_thread(self._send_all, messages)
+        except (OSError, smtplib.SMTPException) as error:
+            return [DispatchError(str(error))] * len(messages)
+
+
+class FakeAdapter(ChannelAdapter):
+    """Keeps messages in memory instead of sending them, optionally failing some, for tests and demos"""
+
+    def __init__(self, channel='fake', failure_rate=0.0, latency=0.0, seed=None):
+        self.channel = channel
+        self.address = 'email' if channel == 'email' else 'phone'
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.sent = []
+        self._random = random.Random(seed)
+
+    async def send(self, message):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self._random.random() < self.failure_rate:
+            raise DispatchError(f"Simulated failure for {message['to']}")
+        self.sent.append(message)
+
+
+class TokenBucket:
+    """Allows `rate` sends a second on average, in bursts of up to `capacity`"""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, count=1):
+        """Wait until `count` (at most `capacity`) sends are allowed, then take them"""
+        count = min(count, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= count:
+                    self._tokens -= count
+                    return
+                await asyncio.sleep((count - self._tokens) / self.rate)
+
+
+class _Fields(dict):
+    def __missing__(self, key):
+        # Unknown placeholders are left as written
+        return '{' + key + '}'
+
+
+def check_template(template):
+    """Raise ValueError if `template` is not a valid message template ({name}, {discount}, ...)"""
+    for _, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (not field.isidentifier() or spec or conversion):
+            raise ValueError(f"Unsupported placeholder {{{field}}} in message; use names like {{name}}")
+
+
+def render_messages(template, recipients, fields=None, subject='', address='phone'):
+    """Render one message per recipient row: customer columns, first_name and `fields` fill the template"""
+    values = recipients.assign(
+        first_name=recipients['name'].astype(object).fillna('').str.split().str[0].fillna('there'),
+        pending_amount=format_rupees(recipients['pending_amount']),
+    )
+    messages = []
+    for row in values.to_dict('records'):
+        row = _Fields(fields or {}, **row)
+        messages.append({
+            'customer_id': row['id'], 'to': row[address],
+            'subject': subject.format_map(row), 'body': template.format_map(row),
+        })
+    return messages
+
+
+def _backoff(attempt):
+    return min(BACKOFF_MAX_SECONDS, BACKOFF_SECONDS * 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+def _read_progress(path):
+    """Yield the batch records of a progress log, skipping a torn last line"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                yield json.loads(line)
+            except ValueError:
+                break
+
+
+def _load_progress(path):
+    """Get the rows already sent (a set) and the rows given up on ([row, customer_id, reason]) from a progress log"""
+    sent, failed = set(), []
+    for record in _read_progress(path):
+        sent.update(record['sent'])
+        failed.extend(record['failed'])
+    return sent, failed
+
+
+def _append_progress(path, record):
+    with open(path, 'ab') as f:
+        f.write(json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n')
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class Dispatcher:
+    """Queue of outbound message jobs, sent from a background asyncio loop
+
+    A job (one campaign on one channel) is written to `dispatch_dir` before
+    submit() returns: its spec as JSON and its recipients as CSV. Batches
+    are rendered and sent through the channel's adapter under a token
+    bucket, and the rows each attempt sent or gave up on are appended
+    (fsynced) to the job's progress log, so after a restart only the rest
+    are sent. Messages in flight at a crash are sent again.
+    """
+
+    def __init__(self, dispatch_dir=DISPATCH_DIR, adapters=None, batch_size=BATCH_SIZE, limits=None, resume=True):
+        self.dispatch_dir = dispatch_dir
+        self.adapters = dict(adapters or {})
+        self.batch_size = batch_size
+        self.limits = dict(CHANNEL_LIMITS, **(limits or {}))
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._buckets = {}
+        os.makedirs(dispatch_dir, exist_ok=True)
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='dispatcher', daemon=True)
+        self._thread.start()
+        if resume:
+            self.resume()
+
+    def _path(self, job_id, suffix):
+        return os.path.join(self.dispatch_dir, f"{job_id}.{suffix}")
+
+    def adapter(self, channel):
+        """Get the adapter sending on `channel`, or None if it is not configured"""
+        with self._lock:
+            return self.adapters.get(channel)
+
+    def configure(self, adapter):
+        """Send on adapter.channel through `adapter`, and start jobs that were waiting for it"""
+        with self._lock:
+            self.adapters[adapter.channel] = adapter
+            waiting = [job_id for job_id, job in self._jobs.items()
+                       if job['status'] == 'waiting' and job['spec']['channel'] == adapter.channel]
+        for job_id in waiting:
+            self._start(job_id)
+
+    def submit(self, recipients, channel, template, name='', subject='', fields=None, simulated=False):
+        """Queue `template` for every row of `recipients` on `channel` and return the job id at once
+
+        With `simulated` the job goes to a FakeAdapter for the channel
+        instead of the configured one.
+        """
+        if channel not in CHANNELS:
+            raise ValueError(f"Unknown channel: {channel}")
+        check_template(template)
+        check_template(subject)
+        missing = set(RECIPIENT_COLUMNS) - set(recipients.columns)
+        if missing:
+            raise ValueError(f"Recipients need columns {sorted(missing)}")
+
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        spec = {
+            'id': job_id, 'name': name, 'channel': channel, 'template': template, 'subject': subject,
+            'fields': fields or {}, 'simulated': bool(simulated), 'total': len(recipients),
+            'batch_size': self.batch_size, 'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        recipients[RECIPIENT_COLUMNS].to_csv(self._path(job_id, 'csv'), index=False)
+        # The spec is written last, so a job on disk always has its recipients
+        tmp_path = self._path(job_id, 'json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(spec, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path(job_id, 'json'))
+        self._add(spec, 0, [])
+        self._start(job_id)
+        return job_id
+
+    def _add(self, spec, sent, failed):
+        with self._lock:
+            self._jobs[spec['id']] = {
+                'spec': spec, 'sent': sent, 'failed': failed,
+                'status': 'queued', 'error': None, 'future': None,
+            }
+
+    def _start(self, job_id):
+        with self._lock:
+            job = self._jobs[job_id]
+            spec = job['spec']
+            adapter = FakeAdapter(spec['channel']) if spec['simulated'] else self.adapters.get(spec['channel'])
+            if adapter is None:
+                # Not configured (yet), e.g. set up on the Settings page
+                # before a restart: configure() starts it
+                job['status'] = 'waiting'
+                job['error'] = f"{CHANNEL_LABELS[spec['channel']]} is not configured since the app started"
+                return
+            job['status'], job['error'] = 'sending', None
+            job['future'] = asyncio.run_coroutine_threadsafe(self._run(job_id, adapter), self._loop)
+
+    def resume(self):
+        """Pick up every unfinished job in dispatch_dir, e.g. after a restart"""
+        for file_name in sorted(os.listdir(self.dispatch_dir)):
+            if not file_name.endswith('.json'):
+                continue
+            job_id = file_name[:-len('.json')]
+            with self._lock:
+                if job_id in self._jobs:
+                    continue
+            with open(self._path(job_id, 'json'), encoding='utf-8') as f:
+                spec = json.load(f)
+            sent, failed = _load_progress(self._path(job_id, 'progress'))
+            self._add(spec, len(sent), failed)
+            cancelled = os.path.exists(self._path(job_id, 'cancelled'))
+            if cancelled or len(sent) + len(failed) >= spec['total']:
+                with self._lock:
+                    self._jobs[job_id]['status'] = 'cancelled' if cancelled else 'done'
+            else:
+                self._start(job_id)
+
+    def cancel(self, job_id):
+        """Stop sending a job; it stays stopped after a restart"""
+        open(self._path(job_id, 'cancelled'), 'a').close()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job['status'] = 'cancelled'
+            future = job['future']
+        if future is not None:
+            future.cancel()
+
+    def _bucket(self, channel):
+        bucket = self._buckets.get(channel)
+        if bucket is None:
+            bucket = self._buckets[channel] = TokenBucket(*self.limits.get(channel, self.limits['fake']))
+        return bucket
+
+    async def _run(self, job_id, adapter):
+        with self._lock:
+            job = self._jobs[job_id]
+            spec = job['spec']
+        progress = self._path(job_id, 'progress')
+        try:
+            text = ['name', 'phone', 'email', 'tier']
+            recipients = await asyncio.to_thread(pd.read_csv, self._path(job_id, 'csv'), dtype=dict.fromkeys(text, str))
+            recipients[text] = recipients[text].fillna('')
+            sent, failed = await asyncio.to_thread(_load_progress, progress)
+            todo = np.ones(len(recipients), dtype=bool)
+            todo[list(sent) + [row for row, _, _ in failed]] = False
+            todo = np.flatnonzero(todo)
+            size = spec['batch_size']
+            # Simulated jobs are paced like the fake channel, not the real one
+            bucket = self._bucket('fake' if spec['simulated'] else spec['channel'])
+            progress_lock = asyncio.Lock()
+            slots = asyncio.Semaphore(CONCURRENT_BATCHES)
+
+            async def record(sent, failed):
+                async with progress_lock:
+                    await asyncio.to_thread(_append_progress, progress, {'sent': sent, 'failed': failed})
+                with self._lock:
+                    job['sent'] += len(sent)
+                    job['failed'].extend(failed)
+
+            await asyncio.gather(*(
+                self._send_batch(spec, adapter, bucket, recipients, todo[start:start + size], slots, record)
+                for start in range(0, len(todo), size)
+            ))
+            with self._lock:
+                job['status'] = 'done'
+        except asyncio.CancelledError:
+            with self._lock:
+                job['status'] = 'cancelled'
+            raise
+        except Exception as error:  # noqa: BLE001 - the job stops, the loop keeps serving others
+            with self._lock:
+                job['status'], job['error'] = 'failed', str(error)
+
+    async def _send_batch(self, spec, adapter, bucket, recipients, rows, slots, record):
+        """Send one batch of recipient `rows`, retrying retryable failures
+
+        After every attempt the rows sent and the rows given up on go to
+        `record`, so a restart only resends what was in flight. A batch
+        holds one of the job's `slots` while rendering or sending but not
+        while backing off, so a retry does not hold up other batches.
+        """
+        async with slots:
+            messages = render_messages(spec['template'], recipients.iloc[rows], spec['fields'], spec['subject'], adapter.address)
+        pending, failed = [], []
+        for i, message in enumerate(messages):
+            if message['to']:
+                pending.append(i)
+            else:
+                failed.append([int(rows[i]), int(message['customer_id']), f"No {adapter.address} on file"])
+        if failed:
+            await record([], failed)
+        for attempt in range(MAX_ATTEMPTS):
+            if not pending:
+                break
+            results = []
+            async with slots:
+                for start in range(0, len(pending), int(bucket.capacity)):
+                    chunk = pending[start:start + int(bucket.capacity)]
+                    await bucket.acquire(len(chunk))
+                    results.extend(await adapter.send_batch([messages[i] for i in chunk]))
+            sent, failed, retry = [], [], []
+            for i, result in zip(pending, results):
+                if result is None:
+                    sent.append(int(rows[i]))
+                elif _retryable(result) and attempt < MAX_ATTEMPTS - 1:
+                    retry.append(i)
+                else:
+                    failed.append([int(rows[i]), int(messages[i]['customer_id']), str(result)])
+            await record(sent, failed)
+            pending = retry
+            if pending:
+                await asyncio.sleep(_backoff(attempt))
+
+    def status(self, job_id):
+        """Get a job's progress: total, sent, failed, remaining and status"""
+        with self._lock:
+            job = self._jobs[job_id]
+            spec = job['spec']
+            return {
+                'id': job_id, 'name': spec['name'], 'channel': spec['channel'], 'simulated': spec['simulated'],
+                'created': spec['created'], 'total': spec['total'], 'sent': job['sent'], 'failed': len(job['failed']),
+                'remaining': spec['total'] - job['sent'] - len(job['failed']), 'status': job['status'], 'error': job['error'],
+            }
+
+    def jobs(self):
+        """Get every job's status, newest first"""
+        with self._lock:
+            job_ids = list(self._jobs)
+        rows = [self.status(job_id) for job_id in job_ids]
+        return pd.DataFrame(rows, columns=['id', 'name', 'channel', 'simulated', 'created', 'total', 'sent',
+                                           'failed', 'remaining', 'status', 'error']).iloc[::-1].reset_index(drop=True)
+
+    def wait(self, job_id, timeout=None):
+        """Block until a job is no longer sending (for scripts and benchmarks, not pages)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.status(job_id)['status'] in ('queued', 'sending'):
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Job {job_id} still sending")
+            time.sleep(0.01)
+        return self.status(job_id)
+
+    def close(self):
+        """Stop sending and the loop; unfinished jobs resume from their progress logs next time"""
+        async def stop_jobs():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(stop_jobs(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+def adapters_from_env():
+    """Get adapters for the channels configured through JEWELLERY_* environment variables"""
+    env = os.environ
+    adapters = {}
+    if env.get('JEWELLERY_WHATSAPP_PHONE_ID') and env.get('JEWELLERY_WHATSAPP_TOKEN'):
+        adapters['whatsapp'] = WhatsAppAdapter(
+            env['JEWELLERY_WHATSAPP_PHONE_ID'], env['JEWELLERY_WHATSAPP_TOKEN'],
+            template=env.get('JEWELLERY_WHATSAPP_TEMPLATE'),
+            language=env.get('JEWELLERY_WHATSAPP_TEMPLATE_LANG', WHATSAPP_TEMPLATE_LANGUAGE),
+        )
+    if env.get('JEWELLERY_SMS_URL') and env.get('JEWELLERY_SMS_KEY'):
+        adapters['sms'] = SMSAdapter(env['JEWELLERY_SMS_URL'], env['JEWELLERY_SMS_KEY'], env.get('JEWELLERY_SMS_SENDER', ''))
+    if env.get('JEWELLERY_SMTP_HOST'):
+        adapters['email'] = EmailAdapter(
+            env['JEWELLERY_SMTP_HOST'], env.get('JEWELLERY_SMTP_PORT', 587), env.get('JEWELLERY_SMTP_USER', ''),
+            env.get('JEWELLERY_SMTP_PASSWORD', ''), env.get('JEWELLERY_SMTP_SENDER', env.get('JEWELLERY_SMTP_USER', '')),
+        )
+    return adapters
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """Get the process-wide dispatcher, resuming unfinished jobs on first use"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = Dispatcher(adapters=adapters_from_env())
+        return _dispatcher
+
+
+def queue_messages(recipients, template, name, channels=('whatsapp',), subject='', fields=None):
+    """Queue `template` to `recipients` on each channel from a page, and say what was queued
+
+    Returns straight away with the job ids; sending happens on the
+    dispatcher's loop. A channel without an adapter gets a simulated job.
+    """
+    import streamlit as st
+
+    dispatcher = get_dispatcher()
+    job_ids = []
+    for channel in channels:
+        label = CHANNEL_LABELS[channel]
+        simulated = dispatcher.adapter(channel) is None
+        try:
+            job_ids.append(dispatcher.submit(recipients, channel, template, name, subject, fields, simulated=simulated))
+        except ValueError as error:
+            st.error(f"❌ {error}")
+            continue
+        st.success(f"✅ Queued {len(recipients):,} {label} messages")
+        if simulated:
+            st.warning(f"⚠️ {label} is not configured, so these messages go to the test adapter, not to customers")
+    return job_ids
@@ -0,0 +1,110 @@
+import numpy as np
+
+# Above this many points, LTTB first narrows the series down with min/max
+# buckets (MinMaxLTTB), which keeps the extremes and is fully vectorised.
+PRESELECT_FACTOR = 8
+
+
+def _as_float(x):
+    """Get x as float64 distances from its first value; dates become nanoseconds"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').view(np.int64)
+    elif not np.issubdtype(x.dtype, np.number):
+        return np.arange(len(x), dtype=np.float64)
+    x = x.astype(np.float64)
+    return x - x[0] if len(x) else x
+
+
+def minmax(x, y, n_out):
+    """Get indices of the min and max y in (n_out - 2) // 2 equal-count buckets, plus both ends"""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    buckets = (n_out - 2) // 2
+    if buckets < 1:
+        return np.array([0, n - 1][:max(n_out, 0)], dtype=np.int64)
+    size = -(-n // buckets)
+    values = np.asarray(y, dtype=np.float64)
+    low = np.full(buckets * size, np.inf)
+    high = np.full(buckets * size, -np.inf)
+    known = ~np.isnan(values)
+    low[:n] = np.where(known, values, np.inf)
+    high[:n] = np.where(known, values, -np.inf)
+    offsets = np.arange(buckets) * size
+    picks = np.concatenate([
+        [0, n - 1],
+        offsets + low.reshape(buckets, size).argmin(axis=1),
+        offsets + high.reshape(buckets, size).argmax(axis=1),
+    ])
+    return np.unique(np.minimum(picks, n - 1))
+
+
+def lttb(x, y, n_out):
+    """Get indices of n_out points chosen by Largest-Triangle-Three-Buckets
+
+    The first and last points are always kept. Each bucket in between keeps
+    the point forming the largest triangle with the point kept from the
+    previous bucket and the average of the next one, which preserves the
+    visual shape of the line far better than striding.
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1][:max(n_out, 0)], dtype=np.int64)
+    xs = _as_float(x)
+    ys = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    starts, stops = edges[:-1], edges[1:]
+    # Bucket averages from cumulative sums, so each is O(1)
+    sum_x = np.concatenate([[0.0], np.cumsum(xs)])
+    sum_y = np.concatenate([[0.0], np.cumsum(ys)])
+    counts = stops - starts
+    avg_x = np.append((sum_x[stops] - sum_x[starts]) / counts, xs[-1])
+    avg_y = np.append((sum_y[stops] - sum_y[starts]) / counts, ys[-1])
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = starts[i], stops[i]
+        ax, ay = xs[a], ys[a]
+        area = np.abs((ax - avg_x[i + 1]) * (ys[lo:hi] - ay) - (ax - xs[lo:hi]) * (avg_y[i + 1] - ay))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def downsample(x, y, n_out, method='lttb'):
+    """Get sorted indices of at most n_out points that keep the series' shape
+
+    method is 'lttb' (Largest-Triangle-Three-Buckets, preceded by min/max
+    preselection on very long series) or 'minmax' (the extremes of each
+    bucket). x need not be sorted.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    order = None
+    if n > 1 and (np.issubdtype(x.dtype, np.number) or np.issubdtype(x.dtype, np.datetime64)):
+        if (x[1:] < x[:-1]).any():
+            order = np.argsort(x, kind='stable')
+            x, y = x[order], y[order]
+
+    if method == 'minmax':
+        picks = minmax(x, y, n_out)
+    elif method == 'lttb':
+        if n > PRESELECT_FACTOR * n_out:
+            candidates = minmax(x, y, PRESELECT_FACTOR * n_out)
+            picks = candidates[lttb(x[candidates], y[candidates], n_out)]
+        else:
+            picks = lttb(x, y, n_out)
+    else:
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    return picks if order is None else np.sort(order[picks])
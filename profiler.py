@@ -0,0 +1,245 @@
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+# Imported on every rerun before the login page, so this module keeps to
+# the standard library; numpy is only needed for the admin summary.
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.profile')
+PROFILE_LOG = os.environ.get('JEWELLERY_PROFILE_LOG', os.path.join(PROFILE_DIR, 'reruns.jsonl'))
+PROFILE_ENABLED = os.environ.get('JEWELLERY_PROFILE', '1') != '0'
+
+# Reruns kept in memory per page for the overlay's percentiles
+HISTORY_PER_PAGE = 500
+# The log is rotated to reruns.jsonl.1 once it grows past this
+MAX_LOG_BYTES = 20 * 1024 * 1024
+
+PHASES = ['theme', 'auth', 'router', 'page']
+
+
+class Rerun:
+    """Timings for one script rerun: top-level phases plus spans inside the page"""
+
+    def __init__(self, session=None):
+        self.session = session
+        self.page = None
+        self.status = 'ok'
+        self.phases = {}
+        self.spans = []
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.total_ms = None
+
+    @contextmanager
+    def phase(self, name):
+        """Time one top-level phase of the rerun (theme, auth, router, page)"""
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+    @contextmanager
+    def span(self, name):
+        """Time a data load or chart build inside the page"""
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.spans.append((name, (time.perf_counter() - started) * 1000))
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+        return self
+
+    def to_dict(self):
+        return {
+            'ts': round(self.started_at, 3),
+            'session': self.session,
+            'page': self.page,
+            'status': self.status,
+            'total_ms': round(self.total_ms, 3),
+            'phases': {name: round(ms, 3) for name, ms in self.phases.items()},
+            'spans': [[name, round(ms, 3)] for name, ms in self.spans],
+        }
+
+
+class RerunProfiler:
+    """Times every rerun of the app and keeps per-page percentiles
+
+    Each rerun is appended to a JSONL log (one object per line) and to an
+    in-memory history per page, which the admin overlay summarises. Spans
+    opened from helpers deep inside a page attach to the rerun running on
+    the current thread; Streamlit runs each session's script on its own.
+    """
+
+    def __init__(self, log_path=PROFILE_LOG, enabled=PROFILE_ENABLED, history=HISTORY_PER_PAGE):
+        self.log_path = log_path
+        self.enabled = enabled
+        self._history = {}
+        self._history_size = history
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._file = None
+
+    @contextmanager
+    def rerun(self, session=None):
+        """Profile one rerun; the record is logged when the block exits"""
+        rerun = Rerun(session)
+        self._local.rerun = rerun
+        try:
+            yield rerun
+        except BaseException as error:
+            # st.rerun() and st.stop() end a run with an exception too
+            rerun.status = type(error).__name__
+            raise
+        finally:
+            self._local.rerun = None
+            self.record(rerun.finish())
+
+    def current(self):
+        """Get the rerun being profiled on this thread, if any"""
+        return getattr(self._local, 'rerun', None)
+
+    @contextmanager
+    def span(self, name):
+        """Time a block as a span of the current rerun (a no-op outside one)"""
+        rerun = self.current()
+        if rerun is None:
+            yield None
+            return
+        with rerun.span(name):
+            yield rerun
+
+    def record(self, rerun):
+        """Add a finished rerun to the history and the log"""
+        if not self.enabled:
+            return
+        with self._lock:
+            history = self._history.setdefault(rerun.page or '(login)', deque(maxlen=self._history_size))
+            history.append(rerun)
+            if self.log_path:
+                self._write(json.dumps(rerun.to_dict(), ensure_ascii=False) + '\n')
+
+    def _write(self, line):
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            self._file = open(self.log_path, 'a', encoding='utf-8')
+        self._file.write(line)
+        self._file.flush()
+        if self._file.tell() > MAX_LOG_BYTES:
+            self._file.close()
+            os.replace(self.log_path, self.log_path + '.1')
+            self._file = None
+
+    def history(self, page):
+        """Get the reruns kept in memory for one page, oldest first"""
+        with self._lock:
+            return list(self._history.get(page, ()))
+
+    def summary(self):
+        """Get p50/p95 rerun times per page (and per phase), slowest p95 first"""
+        with self._lock:
+            records = [rerun.to_dict() for history in self._history.values() for rerun in history]
+        return summarize(records)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def summarize(records):
+    """Get p50/p95 per page from rerun records (dicts, as written to the log)"""
+    import numpy as np
+
+    by_page = {}
+    for record in records:
+        by_page.setdefault(record['page'] or '(login)', []).append(record)
+
+    rows = []
+    for page, page_records in by_page.items():
+        totals = np.array([record['total_ms'] for record in page_records])
+        row = {
+            'page': page,
+            'reruns': len(page_records),
+            'p50_ms': float(np.percentile(totals, 50)),
+            'p95_ms': float(np.percentile(totals, 95)),
+        }
+        for phase in PHASES:
+            row[f"{phase}_p95_ms"] = float(np.percentile([record['phases'].get(phase, 0.0) for record in page_records], 95))
+        spans = {}
+        for record in page_records:
+            for name, ms in record['spans']:
+                spans.setdefault(name, []).append(ms)
+        slowest = max(spans.items(), key=lambda item: np.percentile(item[1], 95), default=None)
+        row['slowest_span'] = f"{slowest[0]} ({np.percentile(slowest[1], 95):.1f}ms)" if slowest else ''
+        rows.append(row)
+    return sorted(rows, key=lambda row: row['p95_ms'], reverse=True)
+
+
+def read_log(path=PROFILE_LOG):
+    """Read rerun records back from a JSONL log, skipping a torn last line"""
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break
+    return records
+
+
+def profiled(name=None):
+    """Decorator timing every call of a loader or chart builder as a span"""
+    def decorate(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_profiler().span(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    """Get the process-wide rerun profiler shared by every session"""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = RerunProfiler()
+        return _profiler
+
+
+def main(argv=None):
+    """Print per-page p50/p95 from a rerun log: python profiler.py [log]"""
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else PROFILE_LOG
+    rows = summarize(read_log(path))
+    if not rows:
+        print(f"No reruns logged in {path}")
+        return
+    print(f"{'page':<28} {'reruns':>7} {'p50':>9} {'p95':>9} {'page p95':>9}  slowest span")
+    for row in rows:
+        print(
+            f"{row['page']:<28} {row['reruns']:>7} {row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms "
+            f"{row['page_p95_ms']:>7.1f}ms  {row['slowest_span']}"
+        )
+
+
+if __name__ == '__main__':
+    main()
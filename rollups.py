@@ -0,0 +1,302 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_store import get_store
+
+CATEGORIES = ['gold', 'silver', 'diamond', 'other']
+
+# Per-bucket measures and how a bucket combines with new rows. Both are
+# associative, so a bucket can absorb appended rows without a rescan.
+TRANSACTION_MEASURES = {
+    'total_sales': 'sum',
+    'total_transactions': 'sum',
+    'gold_sales': 'sum',
+    'silver_sales': 'sum',
+    'diamond_sales': 'sum',
+    'other_sales': 'sum',
+}
+REGISTER_MEASURES = {
+    'register_sales': 'sum',
+    'register_gold': 'sum',
+    'register_silver': 'sum',
+    'register_diamond': 'sum',
+    'register_other': 'sum',
+    'active_staff': 'max',
+}
+
+# Rollup inputs aggregated inside SQLite, over the rows in a rowid range
+SALE_DAYS_SQL = """
+    SELECT substr(date, 1, 10) AS day,
+           SUM(amount) AS total_sales,
+           COUNT(*) AS total_transactions,
+           SUM(CASE WHEN category = 'gold' THEN amount ELSE 0 END) AS gold_sales,
+           SUM(CASE WHEN category = 'silver' THEN amount ELSE 0 END) AS silver_sales,
+           SUM(CASE WHEN category = 'diamond' THEN amount ELSE 0 END) AS diamond_sales,
+           SUM(CASE WHEN category = 'other' THEN amount ELSE 0 END) AS other_sales
+    FROM transactions
+    WHERE type = 'sale' AND rowid > ? AND rowid <= ?
+    GROUP BY day
+"""
+
+SALE_CUSTOMERS_SQL = """
+    SELECT DISTINCT substr(date, 1, 7) AS month, customer_id
+    FROM transactions
+    WHERE type = 'sale' AND rowid > ? AND rowid <= ?
+"""
+
+REGISTER_DAYS_SQL = """
+    SELECT substr(date, 1, 10) AS day,
+           SUM(daily_sales) AS register_sales,
+           SUM(gold_sales) AS register_gold,
+           SUM(silver_sales) AS register_silver,
+           SUM(diamond_sales) AS register_diamond,
+           SUM(other_sales) AS register_other,
+           MAX(staff_count) AS active_staff
+    FROM sales
+    WHERE rowid > ? AND rowid <= ?
+    GROUP BY day
+"""
+
+SUMMARY_COLUMNS = [
+    'month', 'total_sales', 'total_transactions', 'gold_sales', 'silver_sales', 'diamond_sales',
+    'other_sales', 'avg_transaction', 'total_customers', 'active_staff',
+]
+
+
+class Rollup:
+    """Running aggregates per bucket (a day or a month), updated in place"""
+
+    def __init__(self, measures):
+        self.measures = measures
+        self._buckets = {}
+        self._frame = None
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def add(self, grouped):
+        """Fold a frame of per-bucket partial aggregates (indexed by bucket) into the rollup"""
+        columns = list(self.measures)
+        for bucket, values in zip(grouped.index.tolist(), grouped[columns].to_numpy(dtype=float)):
+            current = self._buckets.get(bucket)
+            if current is None:
+                self._buckets[bucket] = values.copy()
+                continue
+            for i, column in enumerate(columns):
+                if self.measures[column] == 'max':
+                    current[i] = max(current[i], values[i])
+                else:
+                    current[i] += values[i]
+        if len(grouped):
+            self._frame = None
+
+    def get(self, bucket):
+        """Get one bucket's measures as a dict (zeros when nothing was recorded)"""
+        values = self._buckets.get(bucket)
+        if values is None:
+            return dict.fromkeys(self.measures, 0)
+        return dict(zip(self.measures, values.tolist()))
+
+    def frame(self):
+        """Get every bucket as a frame indexed by bucket, oldest first"""
+        if self._frame is None:
+            buckets = sorted(self._buckets)
+            values = np.array([self._buckets[bucket] for bucket in buckets]).reshape(len(buckets), len(self.measures))
+            self._frame = pd.DataFrame(values, index=pd.Index(buckets, name='bucket'), columns=list(self.measures))
+        return self._frame
+
+
+class SalesRollups:
+    """Daily and monthly sales rollups over transactions.csv and sales.csv
+
+    Both tables are append-only, so refresh() only aggregates the rows added
+    since the last call and touches just the day and month buckets they
+    fall in. Any full reload of either table (an edited row, say) changes
+    its store generation and rebuilds everything.
+    """
+
+    def __init__(self, store=None):
+        self.store = store or get_store()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.daily = Rollup(TRANSACTION_MEASURES)
+        self.monthly = Rollup(TRANSACTION_MEASURES)
+        self.register_daily = Rollup(REGISTER_MEASURES)
+        self.register_monthly = Rollup(REGISTER_MEASURES)
+        self._customers = {}
+        self._totals = dict.fromkeys(TRANSACTION_MEASURES, 0.0)
+        # Rows folded in so far, and the store generation they came from
+        self._seen = {'transactions': (0, None), 'sales': (0, None)}
+
+    def refresh(self):
+        """Fold in rows appended since the last refresh; rebuild if a table was reloaded in full"""
+        with self._lock:
+            generations = {name: self.store.generation(name) for name in self._seen}
+            transactions = self.store.get('transactions')
+            sales = self.store.get('sales')
+            if not all(self._is_append(name, generations[name]) for name in self._seen):
+                self._reset()
+            self._add_transactions(transactions.iloc[self._seen['transactions'][0]:])
+            self._add_register(sales.iloc[self._seen['sales'][0]:])
+            self._seen = {
+                'transactions': (len(transactions), generations['transactions']),
+                'sales': (len(sales), generations['sales']),
+            }
+        return self
+
+    def _is_append(self, name, generation):
+        """Check the store has only appended to a table since its rows were folded in"""
+        seen, folded = self._seen[name]
+        return seen == 0 or folded == generation
+
+    def _add_transactions(self, rows):
+        rows = rows[rows['type'] == 'sale']
+        if rows.empty:
+            return
+        dates = rows['date'].to_numpy()
+        day = pd.DatetimeIndex(dates.astype('datetime64[D]'))
+        amount = rows['amount'].to_numpy(dtype=np.int64)
+        category = rows['category'].astype(pd.CategoricalDtype(CATEGORIES))
+
+        # Aggregate to days first; months are then summed from the (few)
+        # day buckets instead of from every row.
+        by_category = pd.Series(amount).groupby([day, category.to_numpy()], observed=False).sum().unstack(fill_value=0)
+        daily = pd.DataFrame({
+            'total_sales': pd.Series(amount).groupby(day).sum(),
+            'total_transactions': pd.Series(amount).groupby(day).size(),
+            **{f"{name}_sales": by_category.get(name, 0) for name in CATEGORIES},
+        }).fillna(0)
+        self._add_days(daily)
+        self._add_customers(dates.astype('datetime64[M]'), rows['customer_id'].to_numpy(dtype=np.int64))
+
+    def _add_days(self, daily):
+        """Fold per-day sale measures (indexed by day) into the day and month rollups and the totals"""
+        if daily.empty:
+            return
+        self.daily.add(daily)
+        self.monthly.add(daily.groupby(_month_keys(daily.index)).sum())
+        for column, total in daily.sum().items():
+            self._totals[column] += total
+
+    def _add_customers(self, months, customer_ids):
+        """Merge (month, customer_id) pairs into the distinct customers per month, kept as sorted id arrays"""
+        month = np.asarray(months, dtype='datetime64[M]').astype(np.int64)
+        pairs = np.unique((month << 32) | customer_ids)
+        if not len(pairs):
+            return
+        pair_months = pairs >> 32
+        bounds = np.flatnonzero(np.r_[True, pair_months[1:] != pair_months[:-1], True])
+        keys = _month_keys(pair_months[bounds[:-1]].astype('datetime64[M]'))
+        for key, start, stop in zip(keys, bounds[:-1], bounds[1:]):
+            ids = pairs[start:stop] & 0xFFFFFFFF
+            current = self._customers.get(key)
+            self._customers[key] = ids if current is None else np.union1d(current, ids)
+
+    def _add_register(self, rows):
+        if rows.empty:
+            return
+        measures = pd.DataFrame({
+            'register_sales': rows['daily_sales'].astype('int64'),
+            **{f"register_{name}": rows[f"{name}_sales"].astype('int64') for name in CATEGORIES},
+            'active_staff': rows['staff_count'].astype('int64'),
+        })
+        day = pd.DatetimeIndex(rows['date'].to_numpy().astype('datetime64[D]'))
+        self._add_register_days(measures.groupby(day).agg(REGISTER_MEASURES))
+
+    def _add_register_days(self, daily):
+        if daily.empty:
+            return
+        self.register_daily.add(daily)
+        self.register_monthly.add(daily.groupby(_month_keys(daily.index)).agg(REGISTER_MEASURES))
+
+    def day(self, date):
+        """Get one day's sales measures"""
+        return self.daily.get(pd.Timestamp(date).normalize())
+
+    def month(self, month):
+        """Get one month's ('YYYY-MM') sales measures, customers and register totals"""
+        values = self.monthly.get(month)
+        values.update(self.register_monthly.get(month))
+        values['total_customers'] = len(self._customers.get(month, ()))
+        values['avg_transaction'] = values['total_sales'] / values['total_transactions'] if values['total_transactions'] else 0
+        return values
+
+    def totals(self):
+        """Get all-time sales measures"""
+        return dict(self._totals)
+
+    def monthly_summary(self):
+        """Get the monthly summary table (the shape of the old summary.csv)"""
+        months = self.monthly.frame().join(self.register_monthly.frame()[['active_staff']], how='outer').fillna(0)
+        months['avg_transaction'] = (months['total_sales'] / months['total_transactions'].where(months['total_transactions'] > 0)).fillna(0).round()
+        months['total_customers'] = [len(self._customers.get(month, ())) for month in months.index]
+        months = months.rename_axis('month').reset_index()
+        return months[SUMMARY_COLUMNS].astype({column: 'int64' for column in SUMMARY_COLUMNS[1:]})
+
+
+class SQLiteSalesRollups(SalesRollups):
+    """SalesRollups over the SQLite backend, aggregated inside SQLite
+
+    Both tables only grow at the end, so each refresh groups just the rows
+    past the last rowid it saw by day (and month and customer) in SQL and
+    folds the per-day results in; the tables never load into pandas.
+    """
+
+    def refresh(self):
+        """Fold in rows inserted since the last refresh; rebuild if a table was rewritten"""
+        with self._lock:
+            generations = {name: self.store.generation(name) for name in self._seen}
+            with self.store.connection() as connection:
+                last = {name: _last_rowid(connection, name) for name in self._seen}
+            if not all(self._is_append(name, generations[name]) for name in self._seen):
+                self._reset()
+            since = {name: self._seen[name][0] for name in self._seen}
+
+            daily = self.store.query(SALE_DAYS_SQL, (since['transactions'], last['transactions']))
+            self._add_days(_by_day(daily))
+            pairs = self.store.query(SALE_CUSTOMERS_SQL, (since['transactions'], last['transactions']))
+            self._add_customers(pairs['month'].to_numpy(dtype='datetime64[M]'), pairs['customer_id'].to_numpy(dtype=np.int64))
+            register = self.store.query(REGISTER_DAYS_SQL, (since['sales'], last['sales']))
+            self._add_register_days(_by_day(register))
+            self._seen = {name: (last[name], generations[name]) for name in self._seen}
+        return self
+
+
+def make_sales_rollups(store=None):
+    """Get empty sales rollups for a store: aggregated in SQL on the SQLite backend, from its frames otherwise"""
+    store = store or get_store()
+    if getattr(store, 'supports_sql', False):
+        return SQLiteSalesRollups(store)
+    return SalesRollups(store)
+
+
+def _last_rowid(connection, name):
+    return connection.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {name}").fetchone()[0]
+
+
+def _by_day(frame):
+    """Index per-day query results by their day"""
+    return frame.drop(columns='day').set_index(pd.DatetimeIndex(pd.to_datetime(frame['day'])))
+
+
+def _month_keys(dates):
+    """Get 'YYYY-MM' keys for an array of dates"""
+    return pd.DatetimeIndex(np.asarray(dates).astype('datetime64[M]')).strftime('%Y-%m')
+
+
+_rollups = None
+_rollups_lock = threading.Lock()
+
+
+def get_sales_rollups():
+    """Get the shared sales rollups, brought up to date with the store"""
+    global _rollups
+    with _rollups_lock:
+        store = get_store()
+        if _rollups is None or _rollups.store is not store:
+            _rollups = make_sales_rollups(store)
+    return _rollups.refresh()
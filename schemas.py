@@ -0,0 +1,103 @@
+try:
+    import pyarrow  # noqa: F401
+    TEXT = 'string[pyarrow]'
+except ImportError:  # fall back to pandas' own nullable strings
+    TEXT = 'string'
+
+# Compact dtypes for every shop table. Ids that stay small (staff, chits)
+# are unsigned 16-bit, customer and transaction ids and rupee amounts are
+# 32-bit, low-cardinality labels are categoricals and free text uses
+# nullable strings so sparse columns like `remarks` cost almost nothing.
+# Monthly summaries are derived from transactions and sales (see rollups.py).
+TABLES = {
+    'customers': {
+        'file': 'customers.csv',
+        'dtype': {
+            'id': 'int32', 'name': TEXT, 'mobile': TEXT, 'email': TEXT,
+            'username': TEXT, 'password_hash': TEXT, 'tier': 'category',
+            'pending_amount': 'int32', 'total_purchased': 'int32', 'chit_amount': 'int32',
+        },
+        'parse_dates': ['joined_date'],
+    },
+    'transactions': {
+        'file': 'transactions.csv',
+        'dtype': {
+            'id': 'int32', 'customer_id': 'int32', 'amount': 'int32', 'category': 'category',
+            'type': 'category', 'status': 'category', 'invoice_id': TEXT,
+        },
+        'parse_dates': ['date'],
+        'append_only': True,
+    },
+    'sales': {
+        'file': 'sales.csv',
+        'dtype': {
+            'daily_sales': 'int32', 'gold_sales': 'int32', 'silver_sales': 'int32',
+            'diamond_sales': 'int32', 'other_sales': 'int32', 'staff_count': 'uint16',
+        },
+        'parse_dates': ['date'],
+        'append_only': True,
+    },
+    'attendance': {
+        'file': 'attendance.csv',
+        'dtype': {'staff_id': 'uint16', 'status': 'category', 'remarks': TEXT},
+        'parse_dates': ['date'],
+        'append_only': True,
+    },
+    'staff': {
+        'file': 'staff.csv',
+        'dtype': {
+            'staff_id': 'uint16', 'name': TEXT, 'mobile': TEXT, 'email': TEXT,
+            'floor': 'category', 'role': 'category', 'salary_per_day': 'float32',
+            'username': TEXT, 'password_hash': TEXT, 'status': 'category',
+        },
+        'parse_dates': ['hire_date'],
+    },
+    'chits': {
+        'file': 'chits.csv',
+        'dtype': {
+            'id': 'uint16', 'name': TEXT, 'amount': 'int32', 'monthly_payment': 'int32',
+            'members': 'uint16', 'draw_schedule': 'category',
+        },
+        'parse_dates': ['start_date', 'end_date'],
+    },
+    'chit_members': {
+        'file': 'chit_members.csv',
+        'dtype': {
+            'chit_id': 'uint16', 'customer_id': 'int32', 'amount_paid': 'int32',
+            'amount_remaining': 'int32', 'draw_number': 'uint16', 'status': 'category',
+        },
+        'parse_dates': ['joined_date'],
+    },
+    # Installments posted since chit_members.csv was written; the chit
+    # ledger adds them to each member's amount_paid.
+    'chit_installments': {
+        'file': 'chit_installments.csv',
+        'dtype': {'chit_id': 'uint16', 'customer_id': 'int32', 'amount': 'int32'},
+        'parse_dates': ['date'],
+        'append_only': True,
+    },
+    'offers': {
+        'file': 'offers.csv',
+        'dtype': {
+            'id': 'uint16', 'name': TEXT, 'discount_percent': 'uint8', 'description': TEXT,
+            'applicable_to': 'category', 'campaign_message': TEXT,
+        },
+        'parse_dates': ['valid_from', 'valid_to'],
+    },
+    'users': {
+        'file': 'users.csv',
+        'dtype': {
+            'user_id': 'int32', 'username': TEXT, 'password_hash': TEXT,
+            'name': TEXT, 'email': TEXT, 'role': 'category',
+        },
+        'parse_dates': ['created_date'],
+    },
+}
+
+
+def get_schema(name):
+    """Get the schema declared for a table"""
+    if name not in TABLES:
+        raise KeyError(f"Unknown table: {name}")
+    return TABLES[name]
+
@@ -0,0 +1,284 @@
+import os
+import queue
+import sqlite3
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+from data_store import DATA_DIR, DataStore, _concat_rows, read_only
+
+DB_PATH = os.environ.get('JEWELLERY_DB_PATH', os.path.join(DATA_DIR, 'jewellery.db'))
+POOL_SIZE = 4
+
+# Lookups the pages and *System classes make, as (table, columns)
+INDEXES = [
+    ('customers', ('mobile',)),
+    ('customers', ('username',)),
+    ('customers', ('id',)),
+    ('transactions', ('customer_id',)),
+    ('transactions', ('date',)),
+    ('attendance', ('staff_id', 'date')),
+    # Covers month-range status counts without touching the table
+    ('attendance', ('date', 'staff_id', 'status')),
+    ('chit_members', ('chit_id', 'customer_id')),
+    ('chit_installments', ('chit_id', 'customer_id')),
+]
+
+MONTHLY_SUMMARY_SQL = """
+    SELECT substr(date, 1, 7) AS month,
+           SUM(amount) AS total_sales,
+           COUNT(*) AS total_transactions,
+           SUM(CASE WHEN category = 'gold' THEN amount ELSE 0 END) AS gold_sales,
+           SUM(CASE WHEN category = 'silver' THEN amount ELSE 0 END) AS silver_sales,
+           SUM(CASE WHEN category = 'diamond' THEN amount ELSE 0 END) AS diamond_sales,
+           SUM(CASE WHEN category = 'other' THEN amount ELSE 0 END) AS other_sales,
+           CAST(ROUND(AVG(amount)) AS INTEGER) AS avg_transaction,
+           COUNT(DISTINCT customer_id) AS total_customers
+    FROM transactions
+    WHERE type = 'sale'
+    GROUP BY month
+    ORDER BY month
+"""
+
+# A corrected day is counted once, with its last mark
+ATTENDANCE_COUNTS_SQL = """
+    SELECT staff_id, status, COUNT(*) AS days
+    FROM attendance AS marked
+    WHERE date >= ? AND date < ?
+      AND rowid = (
+          SELECT MAX(rowid) FROM attendance AS later
+          WHERE later.staff_id = marked.staff_id AND later.date = marked.date
+      )
+    GROUP BY staff_id, status
+"""
+
+ATTENDANCE_MONTH_SQL = """
+    SELECT * FROM attendance
+    WHERE date >= ? AND date < ?
+    ORDER BY rowid
+"""
+
+ATTENDANCE_MONTHS_SQL = """
+    SELECT DISTINCT CAST(substr(date, 1, 4) AS INTEGER) AS year, CAST(substr(date, 6, 2) AS INTEGER) AS month
+    FROM attendance
+    ORDER BY year, month
+"""
+
+
+def _column_type(dtype):
+    dtype = str(dtype)
+    if dtype.startswith(('int', 'uint')):
+        return 'INTEGER'
+    if dtype.startswith('float'):
+        return 'REAL'
+    return 'TEXT'
+
+
+class SQLiteStore(DataStore):
+    """DataStore backed by one SQLite database instead of the flat CSVs
+
+    Tables are imported from their CSVs the first time the database is
+    opened. After that SQLite is the source of truth: writes append rows
+    and bump a per-table version, which is what the frame cache keys on.
+    """
+
+    supports_sql = True
+
+    def __init__(self, db_path=DB_PATH, data_dir=DATA_DIR, tables=None, pool_size=POOL_SIZE):
+        super().__init__(data_dir, tables)
+        self.db_path = db_path
+        self._pool = queue.Queue()
+        for _ in range(pool_size):
+            self._pool.put(self._connect())
+        self._create_schema()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection, committing on success"""
+        connection = self._pool.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._pool.put(connection)
+
+    def query(self, sql, params=()):
+        """Run a SELECT and get the result as a frame"""
+        with self.connection() as connection:
+            return pd.read_sql_query(sql, connection, params=params)
+
+    def _create_schema(self):
+        with self.connection() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS _versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+            connection.execute('CREATE TABLE IF NOT EXISTS _generations (name TEXT PRIMARY KEY, generation INTEGER NOT NULL)')
+            existing = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for name, spec in self.tables.items():
+                if name not in existing:
+                    self._import_csv(connection, name, spec)
+            self._create_indexes(connection)
+
+    def _create_indexes(self, connection):
+        for name, columns in INDEXES:
+            if name in self.tables:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{name}_{'_'.join(columns)} ON {name} ({', '.join(columns)})"
+                )
+
+    def _import_csv(self, connection, name, spec):
+        """Create a table from its CSV and copy every row across"""
+        raw = pd.read_csv(self.path(name), dtype=str, keep_default_na=False)
+        columns = ', '.join(f"{column} {_column_type(spec['dtype'].get(column))}" for column in raw.columns)
+        connection.execute(f"CREATE TABLE {name} ({columns})")
+        placeholders = ', '.join('?' for _ in raw.columns)
+        rows = raw.replace('', None).itertuples(index=False, name=None)
+        connection.executemany(f"INSERT INTO {name} VALUES ({placeholders})", rows)
+        connection.execute(
+            'INSERT INTO _versions VALUES (?, 1) ON CONFLICT (name) DO UPDATE SET version = version + 1', (name,),
+        )
+        _bump_generation(connection, name)
+
+    def import_csvs(self, names=None):
+        """Replace tables with a fresh copy of their CSVs"""
+        with self.connection() as connection:
+            for name in names or self.tables:
+                connection.execute(f"DROP TABLE IF EXISTS {name}")
+                self._import_csv(connection, name, self.tables[name])
+            self._create_indexes(connection)
+        self.invalidate()
+
+    def _version(self, name):
+        with self.connection() as connection:
+            row = connection.execute('SELECT version FROM _versions WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else 0
+
+    def generation(self, name):
+        """Get a token that stays the same while a table only has rows inserted at the end"""
+        with self.connection() as connection:
+            return _generation(connection, name)
+
+    def _load(self, name, version):
+        spec = self.tables[name]
+        previous = self._cache.get(name)
+        started = time.perf_counter()
+
+        # Within a generation rows are only ever appended, so anything past
+        # the last rowid seen is new; a re-import or undone fold starts a new one.
+        with self.connection() as connection:
+            generation = _generation(connection, name)
+            last_rowid = connection.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {name}").fetchone()[0]
+            appending = previous is not None and previous['generation'] == generation and previous['offset'] <= last_rowid
+            since = previous['offset'] if appending else 0
+            new_rows = pd.read_sql_query(
+                f"SELECT * FROM {name} WHERE rowid > ? ORDER BY rowid", connection, params=(since,),
+            )
+
+        new_rows = _apply_schema(new_rows, spec)
+        if appending:
+            frame = _concat_rows(previous['frame'], new_rows) if len(new_rows) else previous['frame']
+            mode = 'append'
+        else:
+            frame = new_rows
+            mode = 'sqlite'
+
+        entry = {
+            'frame': read_only(frame),
+            'offset': last_rowid,
+            'generation': generation,
+            'mode': mode,
+            'appended_rows': len(new_rows) if mode == 'append' else 0,
+            'version': version,
+            'load_seconds': time.perf_counter() - started,
+            'memory_bytes': int(frame.memory_usage(deep=True).sum()),
+            'loaded_at': pd.Timestamp.now(),
+        }
+        self._cache[name] = entry
+        return entry
+
+    def append_rows(self, name, rows):
+        """Insert rows (dicts keyed by column) and bump the table's version"""
+        with self.connection() as connection:
+            columns = [row[1] for row in connection.execute(f"PRAGMA table_info({name})")]
+            placeholders = ', '.join('?' for _ in columns)
+            connection.executemany(
+                f"INSERT INTO {name} ({', '.join(columns)}) VALUES ({placeholders})",
+                ([_sql_value(row.get(column)) for column in columns] for row in rows),
+            )
+            connection.execute('UPDATE _versions SET version = version + 1 WHERE name = ?', (name,))
+
+    def fold_marker(self, names):
+        with self.connection() as connection:
+            return {
+                name: connection.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {name}").fetchone()[0]
+                for name in names
+            }
+
+    def undo_fold(self, marker):
+        with self.connection() as connection:
+            for name, last_rowid in marker.items():
+                connection.execute(f"DELETE FROM {name} WHERE rowid > ?", (last_rowid,))
+                connection.execute('UPDATE _versions SET version = version + 1 WHERE name = ?', (name,))
+                _bump_generation(connection, name)
+        for name in marker:
+            self.invalidate(name)
+
+    def monthly_summary(self):
+        """Get per-month sales totals, aggregated inside SQLite"""
+        return self.query(MONTHLY_SUMMARY_SQL)
+
+    def attendance_counts(self, year, month):
+        """Get per-staff attendance status counts for one month, aggregated inside SQLite"""
+        counts = self.query(ATTENDANCE_COUNTS_SQL, _month_range(year, month))
+        return counts.pivot(index='staff_id', columns='status', values='days').fillna(0).astype('int64')
+
+    def attendance_month(self, year, month):
+        """Get one month's attendance rows, in the order they were written, by a date-range query"""
+        return _apply_schema(self.query(ATTENDANCE_MONTH_SQL, _month_range(year, month)), self.tables['attendance'])
+
+    def attendance_months(self):
+        """Get the (year, month) keys that have attendance, oldest first"""
+        return list(self.query(ATTENDANCE_MONTHS_SQL).itertuples(index=False, name=None))
+
+    def close(self):
+        """Close every pooled connection"""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+def _generation(connection, name):
+    row = connection.execute('SELECT generation FROM _generations WHERE name = ?', (name,)).fetchone()
+    return row[0] if row else 0
+
+
+def _bump_generation(connection, name):
+    connection.execute(
+        'INSERT INTO _generations VALUES (?, 1) ON CONFLICT (name) DO UPDATE SET generation = generation + 1', (name,),
+    )
+
+
+def _month_range(year, month):
+    """Get ('YYYY-MM-DD', 'YYYY-MM-DD') bounds of a month, for `date >= ? AND date < ?`"""
+    start = pd.Timestamp(year=year, month=month, day=1)
+    return start.strftime('%Y-%m-%d'), (start + pd.offsets.MonthBegin(1)).strftime('%Y-%m-%d')
+
+
+def _sql_value(value):
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    if value is not None and pd.isna(value):
+        return None
+    return value
+
+
+def _apply_schema(frame, spec):
+    """Give a frame read from SQLite the same dtypes as one parsed from CSV"""
+    frame = frame.astype(spec['dtype'])
+    for column in spec['parse_dates']:
+        frame[column] = pd.to_datetime(frame[column])
+    return frame
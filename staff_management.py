@@ -1,69 +1,139 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
+from attendance_store import ATTENDANCE_STATUSES, AttendanceStore, get_attendance_store
+from data_store import get_store
+from write_log import get_write_log
+
+DEDUCTION_RATE = 0.08  # 8% deductions
+ATTENDANCE_BONUS_RATE = 0.05  # 5% bonus
 
 class StaffManagementSystem:
-    def __init__(self, staff_df, attendance_df):
+    def __init__(self, staff_df, attendance_df, attendance_store=None, write_log=None, store=None):
         self.staff_df = staff_df
         self.attendance_df = attendance_df
+        self.attendance_store = attendance_store or AttendanceStore(attendance_df)
+        self.write_log = write_log
+        self.store = store
+        self._payrolls = {}
+        self._payroll_rows = {}
+    
+    @classmethod
+    def from_store(cls, store=None):
+        """Build from the shared data store instead of loading CSVs again"""
+        store = store or get_store()
+        # Open the log first: recovery folds leftover rows into the CSVs
+        # before attendance is partitioned.
+        write_log = get_write_log()
+        # On the SQLite backend attendance is read a month at a time, never as one frame
+        attendance_df = None if store.supports_sql else store.get('attendance')
+        return cls(store.get('staff'), attendance_df, get_attendance_store(store, write_log), write_log, store)
     
     def add_staff(self, staff_data):
         """Add a new staff member"""
+        name = str(staff_data.get('name') or '').strip()
+        mobile = str(staff_data.get('mobile') or '').strip()
+        if not name or not mobile:
+            return False, "Name and mobile are required"
+        
+        floor = int(self.staff_df['staff_id'].max()) if not self.staff_df.empty else 0
+        staff_id = self.write_log.allocate_id('staff', 'staff_id', floor) if self.write_log else floor + 1
+        row = {
+            'staff_id': staff_id,
+            'name': name,
+            'mobile': mobile,
+            'email': staff_data.get('email', ''),
+            'floor': staff_data.get('floor', 'Main Floor'),
+            'role': staff_data.get('role', 'Sales'),
+            'hire_date': pd.Timestamp(staff_data.get('hire_date') or datetime.now()).strftime('%Y-%m-%d'),
+            'salary_per_day': float(staff_data.get('salary_per_day', 1000.0)),
+            'username': staff_data.get('username') or f"{name.split()[0].upper()}_{mobile[-4:]}",
+            'password_hash': staff_data.get('password_hash', ''),
+            'status': staff_data.get('status', 'active'),
+        }
+        if self.write_log:
+            self.write_log.append('staff', row)
         return True, "Staff member added successfully"
     
     def mark_attendance(self, staff_id, date, status, remarks):
         """Mark attendance for staff"""
+        if status not in ATTENDANCE_STATUSES:
+            return False, f"Unknown attendance status: {status}"
+        if self.write_log:
+            self.write_log.append('attendance', {
+                'staff_id': int(staff_id),
+                'date': pd.Timestamp(date).strftime('%Y-%m-%d'),
+                'status': status,
+                'remarks': remarks,
+            })
+        if self.store is not None:
+            # A compaction may have rebuilt the shared attendance since this
+            # session got it; that build replayed the log, which already has
+            # this mark, so marking the current one cannot lose it
+            self.attendance_store = get_attendance_store(self.store, self.write_log)
+        self.attendance_store.mark(staff_id, date, status, remarks)
         return True, f"Attendance marked as {status}"
     
     def get_monthly_attendance(self, staff_id, year, month):
         """Get monthly attendance for a staff member"""
-        filtered = self.attendance_df[
-            (self.attendance_df['staff_id'] == staff_id)
-        ].copy()
-        return filtered.head(30)
+        return self.attendance_store.staff_month(staff_id, year, month)
     
     def get_attendance_summary(self, staff_id, month):
         """Get attendance summary for the month"""
-        filtered = self.attendance_df[self.attendance_df['staff_id'] == staff_id]
-        
-        summary = {
-            'present': len(filtered[filtered['status'] == 'present']),
-            'absent': len(filtered[filtered['status'] == 'absent']),
-            'leave': len(filtered[filtered['status'] == 'leave']),
-            'half_day': len(filtered[filtered['status'] == 'half_day'])
-        }
-        return summary
+        start = pd.Timestamp(f"{month}-01")
+        return self.attendance_store.summary(staff_id, start.year, start.month)
     
-    def calculate_salary(self, staff_id, year, month):
-        """Calculate salary for staff member"""
-        staff = self.staff_df[self.staff_df['staff_id'] == staff_id]
+    def run_payroll(self, year, month):
+        """Calculate the month's salary for every staff member in one pass"""
+        key = (year, month)
+        partition = self.attendance_store.partition(year, month)
+        # The shared attendance can be swapped for a rebuilt one, so the
+        # cache keeps the partition it came from (an id() could be reused
+        # once that partition is freed) as well as its version
+        cached = self._payrolls.get(key)
+        if cached is not None and cached[0] is partition and cached[1] == partition.version:
+            return cached[2]
         
-        if staff.empty:
-            return {'error': 'Staff not found'}
+        counts = self.attendance_store.status_counts(year, month)
         
-        salary_per_day = staff.iloc[0]['salary_per_day']
+        payroll = self.staff_df[['staff_id', 'name', 'salary_per_day']].drop_duplicates('staff_id')
+        payroll = payroll.merge(counts, left_on='staff_id', right_index=True, how='left')
+        payroll[ATTENDANCE_STATUSES] = payroll[ATTENDANCE_STATUSES].fillna(0).astype('int32')
+        payroll = payroll.rename(columns={
+            'present': 'present_days', 'absent': 'absent_days',
+            'leave': 'leave_days', 'half_day': 'half_days',
+        })
         
-        # Get attendance for the month
-        summary = self.get_attendance_summary(staff_id, f"{year}-{month:02d}")
+        salary_per_day = payroll['salary_per_day'].astype(float)
+        payroll['total_working_days'] = payroll['present_days'] + payroll['half_days'] * 0.5
+        payroll['base_salary'] = payroll['total_working_days'] * salary_per_day
+        payroll['deductions'] = payroll['base_salary'] * DEDUCTION_RATE
+        payroll['bonus'] = payroll['base_salary'] * ATTENDANCE_BONUS_RATE
+        payroll['net_salary'] = payroll['base_salary'] - payroll['deductions'] + payroll['bonus']
         
-        present_days = summary['present']
-        half_days = summary['half_day']
-        total_working_days = present_days + (half_days * 0.5)
+        payroll = payroll.reset_index(drop=True)
+        self._payrolls[key] = (partition, partition.version, payroll)
+        self._payroll_rows[key] = dict(zip(payroll['staff_id'].tolist(), range(len(payroll))))
+        return payroll
+    
+    def calculate_salary(self, staff_id, year, month):
+        """Calculate salary for staff member"""
+        payroll = self.run_payroll(year, month)
+        position = self._payroll_rows[(year, month)].get(staff_id)
         
-        base_salary = total_working_days * salary_per_day
-        deductions = base_salary * 0.08  # 8% deductions
-        bonus = base_salary * 0.05  # 5% bonus
-        net_salary = base_salary - deductions + bonus
+        if position is None:
+            return {'error': 'Staff not found'}
         
+        row = payroll.iloc[position]
         return {
-            'present_days': present_days,
-            'half_days': half_days,
-            'total_working_days': total_working_days,
-            'salary_per_day': salary_per_day,
-            'base_salary': base_salary,
-            'deductions': deductions,
-            'bonus': bonus,
-            'net_salary': net_salary
+            'present_days': int(row['present_days']),
+            'half_days': int(row['half_days']),
+            'total_working_days': row['total_working_days'],
+            'salary_per_day': row['salary_per_day'],
+            'base_salary': row['base_salary'],
+            'deductions': row['deductions'],
+            'bonus': row['bonus'],
+            'net_salary': row['net_salary']
         }
     
     def suggest_festival_roles(self):
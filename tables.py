@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+from currency import format_rupees
+
+PAGE_SIZES = [25, 50, 100, 250]
+DEFAULT_PAGE_SIZE = 50
+
+
+def _sort_keys(column, ascending):
+    """Get a column as int64/float64 keys whose ascending order is the wanted order, or None"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        codes = column.cat.codes.to_numpy().astype(np.int64)
+        # Missing labels (-1) sort last, as pandas does
+        keys = np.where(codes < 0, np.iinfo(np.int64).max, codes)
+        return keys if ascending else np.where(codes < 0, np.iinfo(np.int64).max, -codes)
+    values = column.to_numpy()
+    if np.issubdtype(values.dtype, np.datetime64):
+        keys = values.astype('datetime64[ns]').view(np.int64)
+        missing = np.isnat(values)
+        keys = keys if ascending else -keys
+        return np.where(missing, np.iinfo(np.int64).max, keys)
+    if np.issubdtype(values.dtype, np.number) or values.dtype == np.bool_:
+        keys = values.astype(np.float64)
+        keys = keys if ascending else -keys
+        return np.where(np.isnan(keys), np.inf, keys)
+    return None
+
+
+def sorted_positions(column, ascending=True, stop=None):
+    """Get the positions that stably sort `column`, only the first `stop` of them when given
+
+    Numeric, date and categorical columns only rank the rows up to the end of
+    the page being shown (argpartition, then a sort of that head), so paging
+    near the top of a million rows costs one linear pass. Text columns fall
+    back to a full stable sort.
+    """
+    n = len(column)
+    stop = n if stop is None else min(stop, n)
+    keys = _sort_keys(column, ascending)
+    if keys is None:
+        return column.array.argsort(ascending=ascending, kind='stable', na_position='last')[:stop]
+    if stop >= n // 4:
+        return np.argsort(keys, kind='stable')[:stop]
+    # Keep everything tied with the last row of the page so ties stay in row order
+    boundary = np.partition(keys, stop - 1)[stop - 1]
+    head = np.flatnonzero(keys <= boundary)
+    return head[np.argsort(keys[head], kind='stable')][:stop]
+
+
+def row_positions(frame, rows=None):
+    """Get `rows` (None for all, a boolean mask or positions) as positions into `frame`"""
+    if rows is None:
+        return np.arange(len(frame))
+    rows = np.asarray(rows)
+    return np.flatnonzero(rows) if rows.dtype == np.bool_ else rows
+
+
+def table_page(frame, rows=None, sort_by=None, ascending=True, page=0, page_size=DEFAULT_PAGE_SIZE):
+    """Get one page of `frame`, restricted to `rows` and sorted by `sort_by`
+
+    Nothing but the returned page is copied: filtering keeps positions into
+    `frame`, and sorting only orders those.
+    """
+    positions = row_positions(frame, rows)
+    start = max(page, 0) * page_size
+    if sort_by is not None and len(positions):
+        column = frame[sort_by] if rows is None else frame[sort_by].iloc[positions]
+        positions = positions[sorted_positions(column, ascending, stop=start + page_size)]
+    return frame.iloc[positions[start:start + page_size]]
+
+
+def paged_table(frame, columns, key, rows=None, currency=(), sort_by=None, ascending=True, labels=None, unsorted=None):
+    """Draw `rows` of `frame` one page at a time, sorted and paged on the server
+
+    Only the visible page reaches st.dataframe, and the `currency` columns
+    are formatted for just those rows. Pass `unsorted` (a label such as
+    "Best match") to offer keeping `rows` in the order given.
+    """
+    import streamlit as st
+
+    labels = labels or {}
+    # The options are the labels shown, mapped back to columns (None keeps `rows` order)
+    options = {unsorted: None} if unsorted else {}
+    options.update((labels.get(column, column), column) for column in columns)
+    choices = list(options.values())
+    sort_col, order_col, size_col, page_col = st.columns([2, 1, 1, 1])
+    with sort_col:
+        sort_by = options[st.selectbox(
+            "Sort by", list(options), index=choices.index(sort_by) if sort_by in choices else 0, key=f"{key}_sort",
+        )]
+    with order_col:
+        ascending = st.selectbox(
+            "Order", ["Ascending", "Descending"], index=0 if ascending else 1,
+            disabled=sort_by is None, key=f"{key}_order",
+        ) == "Ascending"
+    with size_col:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE), key=f"{key}_size")
+
+    positions = row_positions(frame, rows)
+    total = len(positions)
+    pages = max(-(-total // page_size), 1)
+    with page_col:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=f"{key}_page_{pages}")
+    page = min(max(int(page), 1), pages)
+
+    visible = table_page(frame, positions, sort_by, ascending, page - 1, page_size)[columns]
+    for column in currency:
+        if column in visible:
+            visible = visible.assign(**{column: format_rupees(visible[column])})
+    st.dataframe(visible.rename(columns=labels), use_container_width=True, hide_index=True)
+    first = (page - 1) * page_size
+    st.caption(f"Rows {min(first + 1, total):,}–{min(first + page_size, total):,} of {total:,} · page {page} of {pages:,}")
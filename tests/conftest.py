@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_store import DataStore  # noqa: E402
+from schemas import TABLES  # noqa: E402
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    """Build a DataStore over CSVs written into a temp dir: make_store(attendance='staff_id,...\\n...')"""
+    def make(**csvs):
+        for name, text in csvs.items():
+            (tmp_path / TABLES[name]['file']).write_text(text)
+        return DataStore(data_dir=str(tmp_path), tables={name: TABLES[name] for name in csvs})
+    return make
@@ -0,0 +1,51 @@
+import time
+
+from attendance_store import AttendanceStore, get_attendance_store
+from staff_management import StaffManagementSystem
+from write_log import WriteAheadLog
+
+ATTENDANCE = 'staff_id,date,status,remarks\n1,2025-12-01,present,\n2,2025-12-01,present,\n'
+
+
+def test_correction_counted_once_after_rebuild(make_store, tmp_path):
+    store = make_store(attendance=ATTENDANCE)
+    attendance = AttendanceStore(store.get('attendance'))
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store)
+    # Staff 1 is corrected from present to absent, and the correction is compacted into the CSV
+    log.append('attendance', {'staff_id': 1, 'date': '2025-12-01', 'status': 'absent', 'remarks': 'corrected'})
+    attendance.mark(1, '2025-12-01', 'absent', 'corrected')
+    log.close()
+
+    rebuilt = AttendanceStore(store.get('attendance'))
+    for partitioned in (attendance, rebuilt):
+        assert partitioned.summary(1, 2025, 12) == {'present': 0, 'absent': 1, 'leave': 0, 'half_day': 0}
+        assert partitioned.summary(2, 2025, 12)['present'] == 1
+    assert rebuilt.status_counts(2025, 12).loc[1].sum() == 1
+    assert len(rebuilt.staff_month(1, 2025, 12)) == 1
+
+
+STAFF = 'staff_id,name,mobile,email,floor,role,hire_date,salary_per_day,username,password_hash,status\n' \
+        '1,Asha Rao,9876552001,asha@example.com,Main Floor,Sales,2025-06-12,1000.0,ASHA_2001,x,active\n'
+
+
+def _session(store, log):
+    return StaffManagementSystem(store.get('staff'), None, get_attendance_store(store, log), log, store)
+
+
+def test_new_session_after_compaction_sees_marks_still_in_the_log(make_store, tmp_path):
+    store = make_store(staff=STAFF, attendance='staff_id,date,status,remarks\n1,2029-12-31,present,\n')
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store, compact_every=3)
+    first = _session(store, log)
+    for day in (1, 2, 3):
+        first.mark_attendance(1, f"2030-01-0{day}", 'present', '')
+    deadline = time.monotonic() + 5
+    while log.stats()['compactions'] < 1:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    first.mark_attendance(1, '2030-01-04', 'present', '')
+
+    assert len(log.pending('attendance')) == 1
+    for session in (first, _session(store, log)):
+        assert session.get_attendance_summary(1, '2030-01')['present'] == 4
+        assert session.run_payroll(2030, 1)['present_days'].tolist() == [4]
+    log.close()
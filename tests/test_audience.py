@@ -0,0 +1,29 @@
+from audience import get_audience_index, get_customer_overview, offer_query
+
+CUSTOMERS = 'id,name,mobile,email,username,password_hash,tier,pending_amount,total_purchased,chit_amount,joined_date\n' \
+            '1,Asha Rao,9876500001,asha@example.com,ASHA_0001,x,Platinum,0,1000,0,2025-01-01\n' \
+            '2,Ravi Kumar,9876500002,ravi@example.com,RAVI_0002,x,Gold,500,2000,0,2025-01-01\n'
+TRANSACTIONS = 'id,customer_id,date,amount,category,type,status,invoice_id\n' \
+               '1,2,2026-01-10,2000,gold,sale,completed,INV1\n'
+
+
+def test_new_day_replaces_the_derived_entries(make_store):
+    store = make_store(customers=CUSTOMERS, transactions=TRANSACTIONS)
+    get_audience_index(store, '2026-01-15')
+    index = get_audience_index(store, '2026-09-01')
+
+    assert sorted(store._derived) == ['audience_index', 'customer_overview']
+    assert index.features['recency_days'].tolist() == [608, 234]
+    assert index.features['segment'].tolist() == ['VIP', 'Dormant']
+    assert get_customer_overview(store, '2026-09-01') is not None
+    assert get_audience_index(store, '2026-09-01') is index
+
+
+def test_offer_for_a_product_category_targets_every_customer(make_store):
+    index = get_audience_index(make_store(customers=CUSTOMERS, transactions=TRANSACTIONS), '2026-01-15')
+
+    assert index.count(offer_query('gold')) == 2
+    assert index.count(offer_query('Diamond')) == 2
+    assert index.count(offer_query('all')) == 2
+    assert index.recipients(offer_query('platinum'))['name'].tolist() == ['Asha Rao']
+    assert index.count(offer_query('standard')) == 0
@@ -0,0 +1,76 @@
+import threading
+
+import pandas as pd
+import pytest
+
+from bonus_system import BonusManagementSystem, slab_percent
+from write_log import WriteAheadLog
+
+SALES = 'date,daily_sales,gold_sales,silver_sales,diamond_sales,other_sales,staff_count\n' \
+        '2026-01-01,100000,60000,20000,10000,10000,5\n'
+STAFF = 'staff_id,name,mobile,email,floor,role,hire_date,salary_per_day,username,password_hash,status\n' \
+        '1,Asha Rao,9876552001,asha@example.com,Main Floor,Sales,2025-06-12,1000.0,ASHA_2001,x,active\n'
+STAFF_OF_THREE = STAFF + \
+        '2,Ravi Nair,9876552002,ravi@example.com,Main Floor,Sales,2025-06-12,1000.0,RAVI_2002,x,active\n' \
+        '3,Meera Iyer,9876552003,meera@example.com,First Floor,Cashier,2025-06-12,1000.0,MEERA_2003,x,active\n'
+ATTENDANCE = 'staff_id,date,status,remarks\n' \
+             '1,2026-01-01,present,\n' \
+             '2,2026-01-01,half_day,\n' \
+             '3,2026-01-01,absent,\n'
+
+
+def test_concurrent_sessions_record_a_day_once(make_store, tmp_path):
+    store = make_store(sales=SALES, staff=STAFF)
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store)
+    start = threading.Barrier(8)
+    results = []
+
+    def save():
+        bonus = BonusManagementSystem(store.get('sales'), store.get('staff'), write_log=log)
+        start.wait()
+        results.append(bonus.record_sales('2026-01-02', 90000, 50000, 20000, 10000, 4)[0])
+
+    threads = [threading.Thread(target=save) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    log.close()
+
+    assert sorted(results) == [False] * 7 + [True]
+    store.invalidate()
+    assert store.get('sales')['date'].dt.strftime('%Y-%m-%d').tolist() == ['2026-01-01', '2026-01-02']
+    bonus = BonusManagementSystem(store.get('sales'), store.get('staff'), write_log=WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store))
+    assert bonus.record_sales('2026-01-01', 1, 1, 0, 0, 1) == (False, "Sales for 2026-01-01 are already recorded")
+
+
+@pytest.mark.parametrize('sales, percent', [
+    (0, 5.0), (99_999, 5.0), (100_000, 8.0), (249_999, 8.0), (250_000, 10.0), (1_000_000, 10.0),
+])
+def test_slab_edges(sales, percent):
+    assert slab_percent(sales) == percent
+    assert slab_percent([sales]).tolist() == [percent]
+
+
+def test_custom_slabs():
+    slabs = [(50_000, 2.0), (75_000, 4.0)]
+    assert slab_percent([0, 49_999, 50_000, 74_999, 75_000], slabs).tolist() == [0.0, 0.0, 2.0, 2.0, 4.0]
+
+    bonuses = BonusManagementSystem(pd.DataFrame(), pd.DataFrame(), slabs=slabs).compute_bonuses(
+        pd.Series([60_000.0, 80_000.0], index=[1, 2]),
+    )
+    assert bonuses['bonus'].tolist() == [1200.0, 3200.0]
+
+
+def test_day_sales_are_split_across_staff_by_attendance(make_store):
+    store = make_store(sales=SALES, staff=STAFF_OF_THREE, attendance=ATTENDANCE)
+    bonus = BonusManagementSystem(store.get('sales'), store.get('staff'), store.get('attendance'))
+
+    bonuses = bonus.compute_bonuses().set_index('staff_id')
+    # ₹1,00,000 over one full day and one half day
+    assert bonuses['sales'].round(2).tolist() == [66666.67, 33333.33, 0.0]
+    assert bonuses['bonus_percent'].tolist() == [5.0, 5.0, 5.0]
+    assert bonus.calculate_bonus(250_000) == 25_000.0
+    # The old base_bonus_percent argument is still accepted, and the slabs still decide
+    assert bonus.calculate_bonus(250_000, base_bonus_percent=5) == 25_000.0
+    assert bonus.calculate_bonus(99_999, 12) == pytest.approx(4_999.95)
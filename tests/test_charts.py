@@ -0,0 +1,94 @@
+import json
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+import charts
+
+
+def draw():
+    import json
+
+    import streamlit as st
+
+    from charts import plotly_chart
+
+    spec = json.dumps({'data': [{'type': 'bar', 'x': ['a', 'b'], 'y': [1, 2]}], 'layout': {'title': {'text': 'Sales'}}})
+    plotly_chart(spec)
+    plotly_chart(spec)
+    st.write('drawn')
+
+
+def test_cached_spec_is_drawn_through_the_public_api():
+    app = AppTest.from_function(draw).run()
+
+    assert not app.exception
+    assert [element.value for element in app.markdown] == ['drawn']
+    drawn = [json.loads(chart.proto.figure.spec) for chart in app.get('plotly_chart')]
+    assert len(drawn) == 2 and drawn[0] == drawn[1]
+    assert drawn[0]['data'][0]['y'] == [1, 2]
+    assert drawn[0]['layout']['title']['text'] == 'Sales'
+    assert json.loads(app.get('plotly_chart')[0].proto.figure.config) == {'showLink': False, 'linkText': False}
+
+
+def _scatter():
+    import plotly.graph_objects as go
+
+    return go.Figure(go.Scatter(x=np.arange(3000), y=np.arange(3000) % 17))
+
+
+def test_figures_are_rebuilt_once_and_counted_in_the_cache_size():
+    cache = charts.ChartCache()
+    spec = cache.get('sales', _scatter)
+    charts.ChartCache().figure(spec)  # plotly's first-use imports are not the figure's
+
+    tracemalloc.start()
+    built = cache.figure(spec)
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert cache.figure(spec) is built
+    assert cache.stats()['bytes'] >= len(spec) + kept
+
+
+def test_a_figure_is_evicted_with_its_json():
+    probe = charts.ChartCache()
+    spec = probe.get('sales', _scatter)
+    cache = charts.ChartCache(max_bytes=len(spec) + charts.figure_bytes(spec))
+    cache.get('sales', _scatter)
+    built = cache.figure(spec)
+
+    cache.get('stock', lambda: _scatter().update_layout(title='Stock'))
+    assert cache.stats()['entries'] == 1
+    assert cache.figure(spec) is not built
+    assert cache.stats()['bytes'] <= cache.max_bytes
+
+
+def test_long_series_are_decimated_to_the_point_budget():
+    frame = pd.DataFrame({'day': np.arange(5000), 'sales': np.arange(5000) % 97})
+    plotted, _ = charts._decimate(frame, {'x': 'day', 'y': 'sales'}, 300)
+
+    assert len(plotted) <= 300
+    assert plotted['day'].iloc[0] == 0 and plotted['day'].iloc[-1] == 4999
+
+
+def test_each_colour_group_shares_the_budget():
+    frame = pd.DataFrame({
+        'day': np.tile(np.arange(2000), 3),
+        'sales': np.arange(6000) % 89,
+        'category': np.repeat(['gold', 'silver', 'diamond'], 2000),
+    })
+    plotted, _ = charts._decimate(frame, {'x': 'day', 'y': 'sales', 'color': 'category'}, 300)
+
+    assert len(plotted) <= 300
+    assert plotted.groupby('category')['day'].agg(['min', 'max']).values.tolist() == [[0, 1999]] * 3
+
+
+def test_short_series_and_arrays_pass_through():
+    frame = pd.DataFrame({'day': [1, 2, 3], 'sales': [5, 6, 7]})
+    assert charts._decimate(frame, {'x': 'day', 'y': 'sales'}, 300)[0] is frame
+
+    _, spec = charts._decimate(None, {'x': np.arange(1000), 'y': np.arange(1000) % 7}, 100)
+    assert len(spec['x']) == len(spec['y']) <= 100
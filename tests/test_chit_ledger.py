@@ -0,0 +1,83 @@
+import os
+
+from chit_ledger import ChitLedger, get_chit_ledger
+from write_log import WriteAheadLog
+
+# One draw each (start and end in the same month); 5% of the amount is the expected spend
+CHITS = 'id,name,amount,monthly_payment,members,start_date,end_date,draw_schedule\n' \
+        '1,Just under 50K,999980,1000,20,2026-01-10,2026-01-31,Monthly\n' \
+        '2,Exactly 50K,1000000,1000,20,2026-01-11,2026-01-31,Monthly\n' \
+        '3,Exactly 1L,2000000,1000,20,2026-01-12,2026-01-31,Monthly\n' \
+        '4,Just over 1L,2000020,1000,20,2026-01-13,2026-01-31,Monthly\n'
+MEMBERS = 'chit_id,customer_id,joined_date,amount_paid,amount_remaining,draw_number,status\n' \
+          '1,7,2025-12-01,1000,998980,0,active\n'
+INSTALLMENTS = 'chit_id,customer_id,date,amount\n'
+MONTHLY_CHIT = 'id,name,amount,monthly_payment,members,start_date,end_date,draw_schedule\n' \
+               '2,Monthly,100000,5000,2,2026-02-15,2026-04-15,Monthly\n'
+MONTHLY_MEMBERS = 'chit_id,customer_id,joined_date,amount_paid,amount_remaining,draw_number,status\n' \
+                  '2,7,2026-02-01,5000,95000,1,active\n'
+
+
+def _ledger(make_store):
+    store = make_store(chits=CHITS, chit_members=MEMBERS, chit_installments=INSTALLMENTS)
+    return ChitLedger(store.get('chits'), store.get('chit_members'), store.get('chit_installments'))
+
+
+def test_spend_bucket_edges(make_store):
+    buckets = _ledger(make_store).spend_buckets(days=60, today='2026-01-01')
+
+    assert buckets['payouts'].to_dict() == {'light': 1, 'regular': 2, 'premium': 1}
+    assert buckets['expected_spending'].to_dict() == {'light': 49_999, 'regular': 150_000, 'premium': 100_001}
+
+
+def test_calendar_installments_and_payout_window(make_store):
+    store = make_store(
+        chits='id,name,amount,monthly_payment,members,start_date,end_date,draw_schedule\n'
+              '1,Quarterly,300000,10000,3,2026-01-31,2026-12-31,Quarterly\n'
+              '2,Monthly,100000,5000,2,2026-02-15,2026-04-15,Monthly\n',
+        chit_members='chit_id,customer_id,joined_date,amount_paid,amount_remaining,draw_number,status\n'
+                     '1,7,2026-01-01,10000,290000,2,active\n'
+                     '2,7,2026-02-01,5000,95000,1,active\n'
+                     '2,8,2026-02-01,0,100000,3,active\n',
+        chit_installments='chit_id,customer_id,date,amount\n'
+                          '2,8,2026-03-01,5000\n'
+                          '2,9,2026-03-01,5000\n',
+    )
+    ledger = ChitLedger(store.get('chits'), store.get('chit_members'), store.get('chit_installments'))
+
+    # Draws on the start day, clipped to short months
+    quarterly = ledger.calendar[ledger.calendar['chit_id'] == 1]['payout_date'].dt.strftime('%Y-%m-%d')
+    assert quarterly.tolist() == ['2026-01-31', '2026-04-30', '2026-07-31', '2026-10-31']
+    assert ledger.unmatched_installments == 1
+    assert ledger.balance(2, 8) == {'amount_paid': 5000, 'amount_remaining': 95000}
+
+    ledger.post_installment(2, 7, 10000)
+    assert ledger.balance(2, 7) == {'amount_paid': 15000, 'amount_remaining': 85000}
+    assert ledger.totals().set_index('id').loc[2, 'amount_remaining'] == 180000
+    assert ledger.customer_chits(7)['payout_date'].dt.strftime('%Y-%m-%d').tolist() == ['2026-04-30', '2026-02-15']
+
+    window = ledger.payouts_between('2026-02-15', '2026-04-15')
+    assert list(zip(window['chit_id'], window['payout_date'].dt.strftime('%Y-%m-%d'))) == [
+        (2, '2026-02-15'), (2, '2026-03-15'), (2, '2026-04-15'),
+    ]
+    assert ledger.upcoming(days=14, today='2026-04-16')['payout_date'].dt.strftime('%Y-%m-%d').tolist() == ['2026-04-30']
+
+
+def test_pending_installments_survive_a_rebuild_before_compaction(make_store, tmp_path):
+    store = make_store(chits=MONTHLY_CHIT, chit_members=MONTHLY_MEMBERS, chit_installments=INSTALLMENTS)
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store, compact_every=100)
+    get_chit_ledger(store, log).post_installment(2, 7, 10000, write_log=log)
+
+    # chit_members.csv is rewritten before the log is compacted
+    path = tmp_path / 'chit_members.csv'
+    before = os.stat(path).st_mtime_ns
+    path.write_text(MONTHLY_MEMBERS)
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+    ledger = get_chit_ledger(store, log)
+    assert ledger.balance(2, 7) == {'amount_paid': 15000, 'amount_remaining': 85000}
+    assert ledger.totals().set_index('id').loc[2, 'amount_paid'] == 15000
+
+    # After compaction the installment comes from chit_installments.csv, once
+    log.close()
+    assert get_chit_ledger(store).balance(2, 7) == {'amount_paid': 15000, 'amount_remaining': 85000}
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from chit_ledger import ChitLedger
+from chit_simulation import simulate_draws
+
+CHITS = 'id,name,amount,monthly_payment,members,start_date,end_date,draw_schedule\n' \
+        '1,Gold Chit,1000000,50000,2,2026-01-05,2026-12-31,Monthly\n' \
+        '2,Silver Chit,300000,25000,2,2026-02-10,2026-07-31,Bi-monthly\n'
+MEMBERS = 'chit_id,customer_id,joined_date,amount_paid,amount_remaining,draw_number,status\n' \
+          '1,7,2026-01-01,50000,950000,3,active\n' \
+          '1,8,2026-01-01,50000,950000,5,active\n' \
+          '2,7,2026-02-01,25000,275000,1,active\n' \
+          '2,9,2026-02-01,0,300000,2,defaulted\n'
+INSTALLMENTS = 'chit_id,customer_id,date,amount\n'
+
+
+def test_same_seed_gives_the_same_forecast(make_store):
+    store = make_store(chits=CHITS, chit_members=MEMBERS, chit_installments=INSTALLMENTS)
+    ledger = ChitLedger(store.get('chits'), store.get('chit_members'), store.get('chit_installments'))
+
+    def forecast(seed, workers=0):
+        return simulate_draws(ledger, runs=500, months=6, seed=seed, workers=workers, today='2026-02-01')
+
+    first = forecast(42)
+    pd.testing.assert_frame_equal(forecast(42).liability, first.liability)
+    pd.testing.assert_frame_equal(forecast(42).demand, first.demand)
+    # Chits are simulated on their own streams, so worker processes do not change the result
+    pd.testing.assert_frame_equal(forecast(42, workers=2).liability, first.liability)
+    pd.testing.assert_frame_equal(forecast(42, workers=2).demand, first.demand)
+
+    assert not forecast(43).liability.equals(first.liability)
+    assert first.seed == 42 and first.runs == 500
+    assert len(first.liability) == 6
+    assert (first.liability['liability_p5'] <= first.liability['liability_p95']).all()
@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+
+from currency import MISSING, format_rupee, format_rupees
+
+
+def test_lakh_and_crore_grouping():
+    amounts = [0, 7, 999, 1000, 99999, 100000, 4500000, 12345678, 1000000000]
+
+    assert format_rupees(amounts) == [
+        '₹0', '₹7', '₹999', '₹1,000', '₹99,999', '₹1,00,000', '₹45,00,000', '₹1,23,45,678', '₹1,00,00,00,000',
+    ]
+    assert format_rupee(4500000) == '₹45,00,000'
+
+
+def test_negatives_rounding_and_missing_values():
+    values = pd.Series([-1200.0, np.nan, 2.5, 3.5, -0.4, 1234567.6], index=[10, 11, 12, 13, 14, 15])
+
+    formatted = format_rupees(values)
+
+    assert formatted.index.tolist() == [10, 11, 12, 13, 14, 15]
+    assert formatted.tolist() == ['-₹1,200', MISSING, '₹2', '₹4', '₹0', '₹12,34,568']
+    assert format_rupees(pd.Series([5, None], dtype='Int64')).tolist() == ['₹5', MISSING]
+    assert format_rupees([]) == []
@@ -0,0 +1,67 @@
+import os
+import threading
+
+from auth_system import AuthenticationSystem
+from customer_index import CustomerIndex, get_customer_index
+from write_log import WriteAheadLog
+
+CUSTOMERS = 'id,name,mobile,email,username,password_hash,tier,pending_amount,total_purchased,chit_amount,joined_date\n' \
+            '1,Asha Rao,9876500001,asha@example.com,ASHA_0001,x,Gold,0,1000,0,2025-01-01\n'
+
+
+def test_registered_mobile_is_normalised_and_unique_under_concurrency(make_store):
+    index = CustomerIndex(make_store(customers=CUSTOMERS).get('customers'))
+    positions = []
+
+    def register(name):
+        positions.append(index.add({'name': name, 'mobile': ' 9876500002 ', 'email': f"{name}@example.com"}))
+
+    threads = [threading.Thread(target=register, args=(f"new{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(positions, key=lambda position: position is not None) == [None] * 7 + [1]
+    assert index.find_by_mobile('9876500002')['mobile'] == '9876500002'
+    assert index.find_by_mobile(' 9876500002') is not None
+    assert index.add({'name': 'Again', 'mobile': '9876500001'}) is None
+    assert index.get(2)['mobile'] == '9876500002'
+
+
+def test_new_ids_follow_the_highest_id_seen(make_store):
+    index = CustomerIndex(make_store(customers=CUSTOMERS).get('customers'))
+
+    assert index.add({'name': 'Given', 'mobile': '9876500010', 'id': 40}) == 1
+    index.add({'name': 'Next', 'mobile': '9876500011'})
+    assert index.find_by_mobile('9876500011')['id'] == 41
+
+
+def test_registrations_survive_a_rebuild_of_the_index(make_store, tmp_path):
+    store = make_store(customers=CUSTOMERS)
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store, compact_every=100)
+    auth = AuthenticationSystem(store.get('customers').iloc[:0], store.get('customers'), get_customer_index(store, log), write_log=log)
+    assert auth.register_customer('Ravi Nair', '9876500002', 'ravi@example.com', 'secret1')[0]
+
+    # customers.csv changes before the log is compacted: the rebuild replays it
+    path = tmp_path / 'customers.csv'
+    before = os.stat(path).st_mtime_ns
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+    assert get_customer_index(store, log).find_by_mobile('9876500002')['id'] == 2
+
+    # ...and after compaction it comes from the table itself, once
+    log.close()
+    index = get_customer_index(store)
+    assert len(index) == 2
+    assert index.find_by_mobile('9876500002')['name'] == 'Ravi Nair'
+    assert store.get('customers')['tier'].tolist() == ['Gold', 'Standard']
+
+
+def test_shared_empty_index_still_rejects_a_second_registration(make_store):
+    customers = make_store(customers=CUSTOMERS.split('\n')[0] + '\n').get('customers')
+    shared = CustomerIndex(customers)
+    first, second = (AuthenticationSystem(customers.iloc[:0], customers, shared) for _ in range(2))
+
+    assert first.customer_index is shared and second.customer_index is shared
+    assert first.register_customer('Asha Rao', '9000000000', 'asha@example.com', 'secret1') == (True, 'Registration successful')
+    assert second.register_customer('Asha R', '9000000000', 'asha2@example.com', 'secret1') == (False, 'Mobile number already registered')
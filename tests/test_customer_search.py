@@ -0,0 +1,27 @@
+from auth_system import AuthenticationSystem
+from customer_index import CustomerIndex
+from customer_search import CustomerSearch
+
+CUSTOMERS = 'id,name,mobile,email,username,password_hash,tier,pending_amount,total_purchased,chit_amount,joined_date\n' \
+            '7,Asha Rao,9876500001,asha@example.com,ASHA_0007,x,Gold,0,1000,0,2025-01-01\n' \
+            '3,Ravi Kumar,9876500002,ravi@example.com,RAVI_0003,x,Gold,0,1000,0,2025-01-01\n'
+
+
+def test_registered_customer_is_found_and_cache_dropped(make_store):
+    customers = make_store(customers=CUSTOMERS).get('customers')
+    search = CustomerSearch(customers)
+    auth = AuthenticationSystem(customers.iloc[:0], customers, CustomerIndex(customers), search)
+
+    assert search.ranked_ids('meera')[0].tolist() == []
+    assert auth.register_customer('Meera Nair', ' 9876500003 ', 'meera@example.com', 'secret1')[0]
+    assert search.ranked_ids('meera')[0].tolist() == [8]
+    assert search.ranked_ids('98765000')[0].tolist() == [7, 3, 8]
+
+
+def test_hits_map_to_rows_by_id_not_position(make_store):
+    customers = make_store(customers=CUSTOMERS).get('customers')
+    search = CustomerSearch(customers)
+    overview = customers.iloc[::-1].reset_index(drop=True)
+    search.add({'id': 99, 'name': 'Ravi Shah', 'mobile': '9876500099'})
+
+    assert overview.iloc[search.ranked_rows('ravi', overview)]['id'].tolist() == [3]
@@ -0,0 +1,26 @@
+import dashboard_kpis
+from dashboard_kpis import get_kpi_snapshot
+
+
+def test_snapshot_is_shared_until_it_is_older_than_the_ttl(monkeypatch):
+    monkeypatch.setattr(dashboard_kpis, '_snapshot', None)
+    builds = []
+    build = dashboard_kpis.build_kpi_snapshot
+
+    def counted_build(store, rollups):
+        builds.append(store)
+        return build(store, rollups)
+
+    monkeypatch.setattr(dashboard_kpis, 'build_kpi_snapshot', counted_build)
+    first = get_kpi_snapshot(ttl=60)
+    assert get_kpi_snapshot(ttl=60) is first
+    assert len(builds) == 1
+
+    later = first['built_at'] + 61
+    monkeypatch.setattr(dashboard_kpis.time, 'monotonic', lambda: later)
+    expired = get_kpi_snapshot(ttl=60)
+    assert expired is not first
+    assert get_kpi_snapshot(ttl=60) is expired
+    assert get_kpi_snapshot(ttl=60, force=True) is not expired
+    assert len(builds) == 3
+    assert [tile['key'] for tile in expired['tiles']] == [tile['key'] for tile in first['tiles']]
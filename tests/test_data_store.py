@@ -0,0 +1,105 @@
+import os
+
+import pandas as pd
+import pytest
+
+from data_store import DataStore, read_only
+
+TRANSACTIONS = 'id,customer_id,amount,category,type,status,invoice_id,date\n' \
+               '1,1,5000,gold,sale,paid,INV1,2025-12-01\n' \
+               '2,2,700,silver,sale,paid,INV2,2025-12-02\n'
+
+
+def test_shared_table_cannot_be_changed_in_place(make_store):
+    store = make_store(transactions=TRANSACTIONS)
+    mine = store.get('transactions')
+
+    with pytest.raises(ValueError):
+        mine.loc[0, 'amount'] = 1
+    with pytest.raises(ValueError):
+        mine.loc[0, 'category'] = 'silver'
+    # Replacing a whole column only changes the caller's copy
+    mine['amount'] = mine['amount'] * 2
+
+    assert store.get('transactions')['amount'].tolist() == [5000, 700]
+    assert store.get('transactions')['category'].tolist() == ['gold', 'silver']
+    assert not pd.get_option('mode.copy_on_write')
+
+
+def _write(path, text):
+    # A new mtime even within the filesystem's timestamp granularity
+    before = os.stat(path).st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+
+def test_appended_rows_are_parsed_onto_the_cached_table(make_store, tmp_path):
+    store = make_store(transactions=TRANSACTIONS)
+    store.get('transactions')
+    _write(tmp_path / 'transactions.csv', TRANSACTIONS + '3,1,900,diamond,sale,paid,INV3,2025-12-03\n')
+
+    assert store.get('transactions')['amount'].tolist() == [5000, 700, 900]
+    assert store.stats().set_index('table').loc['transactions', 'mode'] == 'append'
+    assert store.stats().set_index('table').loc['transactions', 'appended_rows'] == 1
+
+
+def test_rewritten_rows_force_a_full_reload(make_store, tmp_path):
+    store = make_store(transactions=TRANSACTIONS)
+    store.get('transactions')
+    # Same length, so only the checksum of the already-read prefix can tell
+    _write(tmp_path / 'transactions.csv', TRANSACTIONS.replace('5000', '6000') + '3,1,900,diamond,sale,paid,INV3,2025-12-03\n')
+
+    assert store.get('transactions')['amount'].tolist() == [6000, 700, 900]
+    assert store.stats().set_index('table').loc['transactions', 'mode'] == 'full'
+
+
+def test_snapshot_is_used_until_its_csv_changes(make_store, tmp_path):
+    tables = make_store(transactions=TRANSACTIONS).tables
+    snapshots = str(tmp_path / 'snapshots')
+    DataStore(data_dir=str(tmp_path), tables=tables, snapshot_dir=snapshots).get('transactions')
+
+    fresh = DataStore(data_dir=str(tmp_path), tables=tables, snapshot_dir=snapshots)
+    assert fresh.get('transactions')['amount'].tolist() == [5000, 700]
+    assert fresh.stats()['mode'].tolist() == ['snapshot']
+
+    _write(tmp_path / 'transactions.csv', TRANSACTIONS + '3,1,900,diamond,sale,paid,INV3,2025-12-03\n')
+    stale = DataStore(data_dir=str(tmp_path), tables=tables, snapshot_dir=snapshots)
+    assert stale.get('transactions')['amount'].tolist() == [5000, 700, 900]
+    assert stale.stats()['mode'].tolist() == ['full']
+
+
+def test_object_columns_can_still_be_measured():
+    frame = read_only(pd.DataFrame({'amount': [1, 2], 'note': pd.Series(['a', None], dtype=object)}))
+
+    assert frame.memory_usage(deep=True, index=False)['note'] > 0
+    with pytest.raises(ValueError):
+        frame.loc[0, 'amount'] = 3
+
+
+def test_empty_table_keeps_its_schema_dtypes(make_store, tmp_path):
+    store = make_store(chit_installments='chit_id,customer_id,date,amount\n')
+
+    dtypes = store.get('chit_installments').dtypes
+    assert str(dtypes['date']) == 'datetime64[ns]'
+    assert str(dtypes['chit_id']) == 'uint16'
+    assert str(dtypes['amount']) == 'int32'
+
+    _write(tmp_path / 'chit_installments.csv', 'chit_id,customer_id,date,amount\n1,7,2025-12-05,2500\n')
+    assert str(store.get('chit_installments').dtypes['date']) == 'datetime64[ns]'
+
+
+def test_row_appended_while_parsing_is_not_lost_from_the_snapshot(make_store, tmp_path):
+    tables = make_store(transactions=TRANSACTIONS).tables
+    snapshots = str(tmp_path / 'snapshots')
+    path = tmp_path / 'transactions.csv'
+
+    class AppendingStore(DataStore):
+        def _parse(self, name, data, names=None):
+            frame = super()._parse(name, data, names)
+            _write(path, TRANSACTIONS + '3,1,900,diamond,sale,paid,INV3,2025-12-03\n')
+            return frame
+
+    AppendingStore(data_dir=str(tmp_path), tables=tables, snapshot_dir=snapshots).get('transactions')
+
+    fresh = DataStore(data_dir=str(tmp_path), tables=tables, snapshot_dir=snapshots)
+    assert fresh.get('transactions')['amount'].tolist() == [5000, 700, 900]
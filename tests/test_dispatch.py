@@ -0,0 +1,47 @@
+import pandas as pd
+
+from dispatch import Dispatcher, FakeAdapter, WhatsAppAdapter
+
+MESSAGE = {'to': '98765 00001', 'subject': '', 'body': 'Hi Asha,\nyour Gold offer is ready'}
+
+
+def test_whatsapp_sends_approved_template_with_message_as_parameter():
+    payload = WhatsAppAdapter('123', 'token', template='shop_update', language='en_IN').payload(MESSAGE)
+
+    assert payload['to'] == '919876500001'
+    assert payload['type'] == 'template'
+    assert payload['template']['name'] == 'shop_update'
+    assert payload['template']['language'] == {'code': 'en_IN'}
+    assert payload['template']['components'] == [
+        {'type': 'body', 'parameters': [{'type': 'text', 'text': 'Hi Asha, your Gold offer is ready'}]},
+    ]
+
+
+def test_whatsapp_without_template_sends_plain_text():
+    payload = WhatsAppAdapter('123', 'token').payload(MESSAGE)
+
+    assert payload['type'] == 'text'
+    assert payload['text'] == {'body': MESSAGE['body']}
+
+
+def test_job_waiting_for_an_unconfigured_channel_says_why_and_resumes(tmp_path):
+    recipients = pd.DataFrame({
+        'id': [1, 2], 'name': ['Asha Rao', 'Ravi Kumar'], 'phone': ['9876500001', '9876500002'],
+        'email': ['', ''], 'pending_amount': [0, 500], 'tier': ['Gold', 'Gold'],
+    })
+    first = Dispatcher(str(tmp_path), resume=False)
+    job_id = first.submit(recipients, 'whatsapp', 'Hi {first_name}', name='Offer')
+    first.close()
+
+    # After a restart the job is picked up but has nothing to send through
+    dispatcher = Dispatcher(str(tmp_path))
+    status = dispatcher.status(job_id)
+    assert status['status'] == 'waiting'
+    assert 'WhatsApp is not configured' in status['error']
+
+    adapter = FakeAdapter('whatsapp')
+    dispatcher.configure(adapter)
+    status = dispatcher.wait(job_id, timeout=5)
+    dispatcher.close()
+    assert (status['status'], status['sent'], status['error']) == ('done', 2, None)
+    assert [message['body'] for message in adapter.sent] == ['Hi Asha', 'Hi Ravi']
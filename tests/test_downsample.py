@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from downsample import downsample, lttb, minmax
+
+
+def _series(n=10_000, seed=7):
+    rng = np.random.default_rng(seed)
+    return np.arange(n), np.cumsum(rng.normal(size=n))
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+@pytest.mark.parametrize('n_out', [2, 3, 10, 101, 500])
+def test_ends_are_kept_within_the_point_budget(method, n_out):
+    x, y = _series()
+    keep = downsample(x, y, n_out, method=method)
+
+    assert len(keep) <= n_out
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+    assert (np.diff(keep) > 0).all()
+
+
+def test_lttb_keeps_exactly_the_budget():
+    x, y = _series(1000)
+    assert len(lttb(x, y, 50)) == 50
+
+
+def test_minmax_keeps_each_buckets_extremes():
+    y = np.zeros(100)
+    y[[13, 57]] = [5.0, -4.0]
+    keep = minmax(np.arange(100), y, 10)
+
+    assert {13, 57} <= set(keep.tolist())
+    assert len(keep) <= 10
+
+
+def test_short_series_come_back_unchanged():
+    x, y = _series(40)
+    for method in ('lttb', 'minmax'):
+        assert downsample(x, y, 40, method=method).tolist() == list(range(40))
+    assert lttb(x, y, 100).tolist() == list(range(40))
+    assert minmax(x, y, 100).tolist() == list(range(40))
+
+
+def test_unsorted_x_gets_indices_into_the_original_order():
+    x, y = _series(2000)
+    shuffled = np.random.default_rng(1).permutation(len(x))
+    keep = downsample(x[shuffled], y[shuffled], 100)
+
+    assert len(keep) <= 100
+    assert np.array_equal(np.sort(x[shuffled][keep]), x[downsample(x, y, 100)])
+
+
+def test_datetime_x_matches_its_numeric_positions():
+    _, y = _series(3000)
+    dates = pd.date_range('2024-01-01', periods=len(y), freq='h').to_numpy()
+
+    assert np.array_equal(downsample(dates, y, 200), downsample(np.arange(len(y)), y, 200))
@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_startup_imports_stay_lazy():
+    # Wall-clock time depends on the machine, so only the lazy imports are checked here
+    result = subprocess.run(
+        [sys.executable, 'benchmarks.py', 'import-time', '--runs', '1', '--budget-ms', '0', '--check'],
+        capture_output=True, text=True, cwd=REPO, timeout=300,
+    )
+
+    assert 'REGRESSION' not in result.stdout, result.stdout
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "app's own imports" in result.stdout
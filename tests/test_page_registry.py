@@ -0,0 +1,33 @@
+import pytest
+
+import app_pages
+from app_pages import PAGES, Page, validate_registry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Validate a registry from scratch, with extra pages appended to the real ones"""
+    def check(*extra):
+        monkeypatch.setattr(app_pages, 'PAGES', PAGES + list(extra))
+        monkeypatch.setattr(app_pages, '_validated', False)
+        validate_registry()
+    return check
+
+
+def test_real_registry_is_valid(registry):
+    registry()
+
+
+def test_missing_module_is_reported(registry):
+    with pytest.raises(ValueError, match=r"reports: module app_pages\.reports not found"):
+        registry(Page('reports', '📑 Reports', 'app_pages.reports', 'reports_page', ('Admin',)))
+
+
+def test_missing_function_is_reported(registry):
+    with pytest.raises(ValueError, match=r"tax_report: app_pages\.tax has no function tax_report_page\(\)"):
+        registry(Page('tax_report', '🧾 Tax Report', 'app_pages.tax', 'tax_report_page', ('Admin',)))
+
+
+def test_unknown_role_and_duplicate_id_are_reported(registry):
+    with pytest.raises(ValueError, match=r"duplicate page id 'dashboard'[\s\S]*unknown roles \['Owner'\]"):
+        registry(Page('dashboard', '📊 Dashboard 2', 'app_pages.dashboard', 'dashboard_page', ('Owner',)))
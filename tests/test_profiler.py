@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from profiler import RerunProfiler, read_log, summarize
+
+
+def _record(page, total_ms, page_ms=0.0, spans=()):
+    return {
+        'ts': 0, 'session': 's', 'page': page, 'status': 'ok', 'total_ms': total_ms,
+        'phases': {'auth': 1.0, 'page': page_ms}, 'spans': [list(span) for span in spans],
+    }
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = tmp_path / 'reruns.jsonl'
+    lines = [json.dumps(_record('Dashboard', ms)) for ms in (10.0, 20.0)]
+    # A crash mid-write leaves part of a line, which may even parse as JSON
+    path.write_text('\n'.join(lines) + '\n' + '{"ts": 1, "page"')
+    assert [record['total_ms'] for record in read_log(str(path))] == [10.0, 20.0]
+
+    path.write_text('\n'.join(lines) + '\n' + '12')
+    assert len(read_log(str(path))) == 2
+    assert read_log(str(tmp_path / 'missing.jsonl')) == []
+
+
+def test_summarize_aggregates_per_page():
+    records = [_record('Dashboard', ms, page_ms=ms / 2, spans=[('load', ms / 4), ('chart', 1.0)]) for ms in range(1, 101)]
+    records += [_record(None, 5.0), _record(None, 7.0)]
+
+    rows = summarize(records)
+
+    assert [row['page'] for row in rows] == ['Dashboard', '(login)']
+    dashboard, login = rows
+    assert dashboard['reruns'] == 100
+    assert dashboard['p50_ms'] == pytest.approx(50.5)
+    assert dashboard['p95_ms'] == pytest.approx(95.05)
+    assert dashboard['page_p95_ms'] == pytest.approx(47.525)
+    assert dashboard['theme_p95_ms'] == 0.0
+    assert dashboard['slowest_span'] == 'load (23.8ms)'
+    assert (login['reruns'], login['p50_ms'], login['slowest_span']) == (2, 6.0, '')
+
+
+def test_logged_reruns_read_back_into_the_same_summary(tmp_path):
+    profiler = RerunProfiler(log_path=str(tmp_path / 'reruns.jsonl'))
+    for _ in range(3):
+        with profiler.rerun('s') as rerun:
+            rerun.page = 'Customers'
+            with profiler.span('load customers'):
+                pass
+    profiler.close()
+
+    assert summarize(read_log(str(tmp_path / 'reruns.jsonl'))) == profiler.summary()
@@ -0,0 +1,81 @@
+import os
+
+from rollups import SalesRollups, SQLiteSalesRollups
+from sqlite_store import SQLiteStore
+
+TRANSACTIONS = 'id,customer_id,date,amount,category,type,status,invoice_id\n' \
+               '1,1,2025-12-01,5000,gold,sale,paid,INV1\n' \
+               '2,2,2025-12-01,700,silver,sale,paid,INV2\n' \
+               '3,1,2025-12-02,300,other,payment,paid,INV3\n'
+SALES = 'date,daily_sales,gold_sales,silver_sales,diamond_sales,other_sales,staff_count\n' \
+        '2025-12-01,5700,5000,700,0,0,4\n'
+
+
+def _append(path, text):
+    # A new mtime even within the filesystem's timestamp granularity
+    before = os.stat(path).st_mtime_ns
+    with open(path, 'a') as f:
+        f.write(text)
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+
+def test_appended_rows_update_only_their_buckets(make_store, tmp_path):
+    rollups = SalesRollups(make_store(transactions=TRANSACTIONS, sales=SALES)).refresh()
+    assert rollups.day('2025-12-01')['total_sales'] == 5700
+    assert rollups.month('2025-12')['total_customers'] == 2
+
+    _append(tmp_path / 'transactions.csv', '4,3,2025-12-01,900,diamond,sale,paid,INV4\n'
+                                           '5,1,2026-01-05,1000,gold,sale,paid,INV5\n')
+    _append(tmp_path / 'sales.csv', '2025-12-02,100,0,0,0,100,6\n')
+    rollups.refresh()
+
+    assert rollups.day('2025-12-01') == {
+        'total_sales': 6600, 'total_transactions': 3, 'gold_sales': 5000,
+        'silver_sales': 700, 'diamond_sales': 900, 'other_sales': 0,
+    }
+    # The payment on 2025-12-02 is not a sale
+    assert rollups.day('2025-12-02')['total_sales'] == 0
+    december = rollups.month('2025-12')
+    assert (december['total_sales'], december['total_customers'], december['active_staff']) == (6600, 3, 6)
+    assert december['avg_transaction'] == 2200
+    assert rollups.month('2026-01')['total_customers'] == 1
+    assert rollups.totals()['total_sales'] == 7600
+    assert rollups.monthly_summary()['month'].tolist() == ['2025-12', '2026-01']
+
+
+def test_rewritten_table_rebuilds_the_rollups(make_store, tmp_path):
+    rollups = SalesRollups(make_store(transactions=TRANSACTIONS, sales=SALES)).refresh()
+    path = tmp_path / 'transactions.csv'
+    before = os.stat(path).st_mtime_ns
+    # A row removed (an edit rather than an append)
+    path.write_text(TRANSACTIONS.replace('2,2,2025-12-01,700,silver,sale,paid,INV2\n', ''))
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+    assert rollups.refresh().day('2025-12-01')['total_sales'] == 5000
+    assert rollups.totals()['total_sales'] == 5000
+    assert rollups.month('2025-12')['total_customers'] == 1
+
+
+def test_edited_earlier_row_rebuilds_the_rollups(make_store, tmp_path):
+    rollups = SalesRollups(make_store(transactions=TRANSACTIONS, sales=SALES)).refresh()
+    path = tmp_path / 'transactions.csv'
+    before = os.stat(path).st_mtime_ns
+    # The last row is untouched, only the first one's amount changes
+    path.write_text(TRANSACTIONS.replace(',5000,', ',9000,'))
+    os.utime(path, ns=(before + 1_000_000, before + 1_000_000))
+
+    assert rollups.refresh().totals()['total_sales'] == 9700
+    assert rollups.day('2025-12-01')['gold_sales'] == 9000
+
+
+def test_reimported_sqlite_table_rebuilds_the_rollups(make_store, tmp_path):
+    tables = make_store(transactions=TRANSACTIONS, sales=SALES).tables
+    store = SQLiteStore(str(tmp_path / 'jewellery.db'), str(tmp_path), tables)
+    try:
+        rollups = SQLiteSalesRollups(store).refresh()
+        (tmp_path / 'transactions.csv').write_text(TRANSACTIONS.replace(',5000,', ',9000,'))
+        store.import_csvs(['transactions'])
+
+        assert rollups.refresh().totals()['total_sales'] == 9700
+    finally:
+        store.close()
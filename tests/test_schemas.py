@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from data_store import DataStore
+from schemas import TABLES
+
+
+@pytest.fixture(scope='module')
+def store():
+    return DataStore()
+
+
+@pytest.mark.parametrize('name', list(TABLES))
+def test_shipped_table_loads_with_its_schema_dtypes(store, name):
+    spec = TABLES[name]
+    frame = store.get(name)
+
+    for column, dtype in spec['dtype'].items():
+        assert frame[column].dtype == dtype, column
+    for column in spec['parse_dates']:
+        assert pd.api.types.is_datetime64_any_dtype(frame[column]), column
+
+
+def test_memory_report_covers_every_table(store):
+    report = store.memory_report()
+
+    assert set(report['table']) == set(TABLES)
+    assert (report['after_bytes'] >= 0).all()
+    for name, spec in TABLES.items():
+        assert set(spec['dtype']) <= set(report.loc[report['table'] == name, 'column'])
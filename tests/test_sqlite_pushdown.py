@@ -0,0 +1,59 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from attendance_store import SQLiteAttendanceStore, get_attendance_store
+from dashboard_kpis import build_kpi_snapshot
+from data_store import DATA_DIR, DataStore
+from rollups import SalesRollups, SQLiteSalesRollups, make_sales_rollups
+from schemas import TABLES
+from sqlite_store import SQLiteStore
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """A CSV store and a SQLite store over copies of the shop's CSVs"""
+    for spec in TABLES.values():
+        shutil.copy(os.path.join(DATA_DIR, spec['file']), tmp_path)
+    sqlite_store = SQLiteStore(str(tmp_path / 'jewellery.db'), str(tmp_path))
+    yield DataStore(str(tmp_path)), sqlite_store
+    sqlite_store.close()
+
+
+def test_rollups_and_kpis_match_without_loading_tables(stores):
+    csv_store, sqlite_store = stores
+    rollups = make_sales_rollups(sqlite_store)
+    assert isinstance(rollups, SQLiteSalesRollups)
+    expected = SalesRollups(csv_store).refresh()
+    rollups.refresh()
+    pd.testing.assert_frame_equal(rollups.monthly_summary(), expected.monthly_summary())
+    assert rollups.totals() == expected.totals()
+
+    sale = {'id': 10**6, 'customer_id': 5, 'date': '2025-12-15', 'amount': 1000, 'category': 'gold',
+            'type': 'sale', 'status': 'completed', 'invoice_id': 'INV-TEST'}
+    for store in stores:
+        store.append_rows('transactions', [sale])
+    pd.testing.assert_frame_equal(rollups.refresh().monthly_summary(), expected.refresh().monthly_summary())
+
+    csv_kpis, sql_kpis = build_kpi_snapshot(csv_store), build_kpi_snapshot(sqlite_store)
+    assert [(tile['value'], tile['delta']) for tile in sql_kpis['tiles']] == [(tile['value'], tile['delta']) for tile in csv_kpis['tiles']]
+    pd.testing.assert_frame_equal(sql_kpis['recent'].reset_index(drop=True), csv_kpis['recent'].reset_index(drop=True))
+    assert not sqlite_store.stats()['table'].isin(['transactions', 'sales', 'customers']).any()
+
+
+def test_attendance_counts_by_month_with_corrections(stores):
+    correction = {'staff_id': 1, 'date': '2025-12-10', 'status': 'absent', 'remarks': 'corrected'}
+    for store in stores:
+        store.append_rows('attendance', [correction])
+    csv_attendance, sql_attendance = (get_attendance_store(store) for store in stores)
+    assert isinstance(sql_attendance, SQLiteAttendanceStore)
+    assert sql_attendance.months() == csv_attendance.months()
+    for year, month in csv_attendance.months():
+        pd.testing.assert_frame_equal(
+            sql_attendance.status_counts(year, month).sort_index(), csv_attendance.status_counts(year, month).sort_index(),
+            check_dtype=False, check_index_type=False,
+        )
+    assert sql_attendance.summary(1, 2025, 12) == csv_attendance.summary(1, 2025, 12)
+    assert 'attendance' not in stores[1].stats()['table'].tolist()
@@ -0,0 +1,69 @@
+import pytest
+
+from attendance_store import AttendanceStore
+from staff_management import StaffManagementSystem
+
+STAFF = 'staff_id,name,mobile,email,floor,role,hire_date,salary_per_day,username,password_hash,status\n' \
+        '1,Asha Rao,9876552001,asha@example.com,Main Floor,Sales,2025-06-12,1000.0,ASHA_2001,x,active\n' \
+        '2,Ravi Kumar,9876552002,ravi@example.com,First Floor,Cashier,2025-07-01,850.0,RAVI_2002,x,active\n' \
+        '3,Meena Iyer,9876552003,meena@example.com,Main Floor,Sales,2025-08-20,1200.0,MEENA_2003,x,active\n'
+ATTENDANCE = 'staff_id,date,status,remarks\n' \
+             '1,2025-12-01,present,\n1,2025-12-02,half_day,Late\n1,2025-12-03,present,\n' \
+             '2,2025-12-01,absent,Sick\n2,2025-12-02,present,\n2,2025-12-03,half_day,\n2,2025-12-04,leave,\n' \
+             '1,2025-11-30,present,\n'
+
+
+def _expected_salary(attendance, staff_row, year, month):
+    # Per-staff calculation the batch payroll replaced
+    rows = attendance[
+        (attendance['staff_id'] == staff_row['staff_id'])
+        & (attendance['date'].dt.year == year) & (attendance['date'].dt.month == month)
+    ]
+    present_days = int((rows['status'] == 'present').sum())
+    half_days = int((rows['status'] == 'half_day').sum())
+    total_working_days = present_days + (half_days * 0.5)
+    base_salary = total_working_days * staff_row['salary_per_day']
+    deductions = base_salary * 0.08
+    bonus = base_salary * 0.05
+    return {
+        'present_days': present_days,
+        'half_days': half_days,
+        'total_working_days': total_working_days,
+        'salary_per_day': staff_row['salary_per_day'],
+        'base_salary': base_salary,
+        'deductions': deductions,
+        'bonus': bonus,
+        'net_salary': base_salary - deductions + bonus,
+    }
+
+
+def test_payroll_matches_the_per_staff_calculation(make_store):
+    store = make_store(staff=STAFF, attendance=ATTENDANCE)
+    staff, attendance = store.get('staff'), store.get('attendance')
+    staff_mgmt = StaffManagementSystem(staff, attendance)
+
+    payroll = staff_mgmt.run_payroll(2025, 12).set_index('staff_id')
+    for _, staff_row in staff.iterrows():
+        expected = _expected_salary(attendance, staff_row, 2025, 12)
+        salary = staff_mgmt.calculate_salary(staff_row['staff_id'], 2025, 12)
+        assert salary == pytest.approx(expected)
+        assert payroll.loc[staff_row['staff_id'], list(expected)].to_dict() == pytest.approx(expected)
+
+    # Staff 3 has no attendance at all and is still paid nothing, not skipped
+    assert staff_mgmt.calculate_salary(3, 2025, 12)['net_salary'] == 0
+    assert staff_mgmt.calculate_salary(99, 2025, 12) == {'error': 'Staff not found'}
+
+
+def test_payroll_is_recalculated_for_a_new_mark_or_a_rebuilt_attendance(make_store):
+    store = make_store(staff=STAFF, attendance=ATTENDANCE)
+    staff_mgmt = StaffManagementSystem(store.get('staff'), store.get('attendance'))
+    assert staff_mgmt.calculate_salary(1, 2025, 12)['present_days'] == 2
+
+    staff_mgmt.mark_attendance(1, '2025-12-04', 'present', '')
+    assert staff_mgmt.calculate_salary(1, 2025, 12)['present_days'] == 3
+
+    # A rebuilt attendance whose partition has reached the same version
+    staff_mgmt.attendance_store = AttendanceStore(store.get('attendance'))
+    staff_mgmt.attendance_store.mark(1, '2025-12-04', 'absent', '')
+    assert staff_mgmt.attendance_store.partition(2025, 12).version == 1
+    assert staff_mgmt.calculate_salary(1, 2025, 12)['present_days'] == 2
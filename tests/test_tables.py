@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tables import table_page
+
+
+def _frame(n=1000):
+    rng = np.random.default_rng(7)
+    amount = rng.integers(0, 50, n).astype(float)
+    amount[::37] = np.nan
+    date = pd.Series(pd.to_datetime('2025-01-01') + pd.to_timedelta(rng.integers(0, 30, n), unit='D'))
+    date[::41] = pd.NaT
+    return pd.DataFrame({
+        'id': np.arange(n),
+        'amount': amount,
+        'date': date,
+        'tier': pd.Categorical(rng.choice(['Gold', 'Silver', None], n), categories=['Silver', 'Gold']),
+        'name': rng.choice(['asha', 'ravi', 'meera'], n),
+    })
+
+
+@pytest.mark.parametrize('sort_by', ['amount', 'date', 'tier', 'name'])
+@pytest.mark.parametrize('ascending', [True, False])
+@pytest.mark.parametrize('page', [0, 3, 19])
+def test_sorted_page_matches_a_stable_sort(sort_by, ascending, page):
+    frame = _frame()
+    expected = frame.sort_values(sort_by, ascending=ascending, kind='stable', na_position='last')
+
+    got = table_page(frame, sort_by=sort_by, ascending=ascending, page=page, page_size=50)
+
+    assert got['id'].tolist() == expected['id'].iloc[page * 50:(page + 1) * 50].tolist()
+
+
+def test_page_bounds_and_row_filters():
+    frame = _frame(120)
+    gold = (frame['tier'] == 'Gold').to_numpy()
+
+    assert table_page(frame, page=-1, page_size=50)['id'].tolist() == list(range(50))
+    assert table_page(frame, page=2, page_size=50)['id'].tolist() == list(range(100, 120))
+    assert table_page(frame, page=3, page_size=50).empty
+    assert table_page(frame, rows=gold, page_size=250)['id'].tolist() == frame['id'][gold].tolist()
+    assert table_page(frame, rows=np.array([], dtype=np.int64), sort_by='amount').empty
+    top = table_page(frame, rows=gold, sort_by='amount', ascending=False, page_size=5)
+    expected = frame[gold].sort_values('amount', ascending=False, kind='stable', na_position='last').head(5)
+    assert top['id'].tolist() == expected['id'].tolist()
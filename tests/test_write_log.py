@@ -0,0 +1,118 @@
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from data_store import DataStore
+from write_log import WriteAheadLog
+
+ATTENDANCE = 'staff_id,date,status,remarks\n1,2025-12-01,present,\n'
+
+
+class FlakyStore(DataStore):
+    """Fails the first `failures` folds: after writing the rows when `partial`, else before"""
+
+    def __init__(self, *args, failures=2, partial=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+        self.partial = partial
+
+    def append_rows(self, name, rows):
+        if self.failures:
+            self.failures -= 1
+            if self.partial:
+                super().append_rows(name, rows)
+            raise sqlite3.OperationalError('database is locked')
+        super().append_rows(name, rows)
+
+
+class SlowStore(DataStore):
+    """Holds every fold until `release` is set"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.folding = threading.Event()
+        self.release = threading.Event()
+
+    def append_rows(self, name, rows):
+        self.folding.set()
+        self.release.wait(timeout=5)
+        super().append_rows(name, rows)
+
+
+def _mark(day):
+    return {'staff_id': 1, 'date': f"2025-12-{day:02d}", 'status': 'present', 'remarks': ''}
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def _logged_days(store):
+    store.invalidate()
+    return store.get('attendance')['date'].dt.day.tolist()
+
+
+def test_failed_compaction_is_retried_while_appends_carry_on(make_store, tmp_path):
+    store = make_store(attendance=ATTENDANCE)
+    flaky = FlakyStore(data_dir=store.data_dir, tables=store.tables)
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=flaky, compact_every=1, retry_seconds=0.01)
+
+    log.append('attendance', _mark(2))
+    _wait_for(lambda: log.stats()['failed_compactions'] >= 1)
+    # Appends keep working while the fold is failing
+    log.append('attendance', _mark(3))
+    _wait_for(lambda: log.stats()['compactions'] >= 1 and not log.pending('attendance'))
+
+    log.append('attendance', _mark(4))
+    log.close()
+    assert log.stats()['compact_error'] is None
+    assert _logged_days(flaky) == [1, 2, 3, 4]
+
+
+def test_half_done_fold_is_undone_before_the_retry(make_store, tmp_path):
+    store = make_store(attendance=ATTENDANCE)
+    flaky = FlakyStore(data_dir=store.data_dir, tables=store.tables, failures=1, partial=True)
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=flaky, compact_every=1, retry_seconds=0.01)
+
+    log.append('attendance', _mark(2))
+    _wait_for(lambda: log.stats()['compactions'] >= 1)
+    log.close()
+    assert _logged_days(flaky) == [1, 2]
+    assert len(pd.read_csv(flaky.path('attendance'))) == 2
+
+
+def test_appends_do_not_wait_for_a_running_fold(make_store, tmp_path):
+    store = make_store(attendance=ATTENDANCE)
+    slow = SlowStore(data_dir=store.data_dir, tables=store.tables)
+    log = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=slow, compact_every=1)
+
+    log.append('attendance', _mark(2))
+    assert slow.folding.wait(timeout=5)
+    started = time.monotonic()
+    log.append('attendance', _mark(3))
+    assert time.monotonic() - started < 1
+
+    slow.release.set()
+    log.close()
+    assert _logged_days(slow) == [1, 2, 3]
+
+
+def test_rows_appended_after_another_process_rotates_the_log_are_kept(make_store, tmp_path):
+    store = make_store(attendance=ATTENDANCE)
+    # Two logs over one directory stand in for two processes
+    first = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store, compact_every=100)
+    second = WriteAheadLog(log_dir=str(tmp_path / 'wal'), store=store, compact_every=100)
+
+    second.append('attendance', _mark(2))
+    first.compact()
+    second.append('attendance', _mark(3))
+    assert second.pending('attendance') == [_mark(3)]
+
+    first.close()
+    second.close()
+    assert _logged_days(store) == [1, 2, 3]
@@ -0,0 +1,362 @@
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; the in-process lock still serialises sessions
+    fcntl = None
+
+from data_store import DATA_DIR, get_store
+
+WAL_DIR = os.environ.get('JEWELLERY_WAL_DIR', os.path.join(DATA_DIR, '.wal'))
+
+# Compaction folds the log into the store's tables once either limit is reached
+COMPACT_EVERY_RECORDS = 500
+COMPACT_EVERY_SECONDS = 60
+# A failed compaction (say, "database is locked") is retried after this,
+# doubling up to COMPACT_EVERY_SECONDS; the rows stay safe in the log
+COMPACT_RETRY_SECONDS = 1.0
+
+
+class WriteAheadLog:
+    """Append-only, group-committed log of new rows, compacted into the store
+
+    Writers block until their record is on disk. Records that arrive while a
+    batch is being fsynced are written together in the next batch, so 50
+    sessions writing at once cost a handful of fsyncs rather than 50.
+    Only a failed log write or fsync fails append(); compaction runs on its
+    own thread, and a failed one is retried with backoff while appends carry on.
+
+    Several processes can share one log directory: a batch is written under
+    a cross-process rotation lock, after reopening the log if another
+    process rotated it away. Without fcntl (Windows) only one process may
+    use the directory.
+    """
+
+    def __init__(self, log_dir=WAL_DIR, store=None, compact_every=COMPACT_EVERY_RECORDS,
+                 compact_seconds=COMPACT_EVERY_SECONDS, group_commit=True, retry_seconds=COMPACT_RETRY_SECONDS):
+        self.log_dir = log_dir
+        self.store = store or get_store()
+        self.compact_every = compact_every
+        self.compact_seconds = compact_seconds
+        self.group_commit = group_commit
+        self.retry_seconds = retry_seconds
+        self.path = os.path.join(log_dir, 'shop.wal')
+
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._pending = []
+        self._sequence = 0
+        self._durable = 0
+        self._error = None
+        self._uncompacted = 0
+        self._last_compacted = time.monotonic()
+        self._last_ids = {}
+        self._claimed = {}
+        self._retry_at = None
+        self._retry_delay = retry_seconds
+        self._compact_error = None
+        self._stats = {'records': 0, 'batches': 0, 'compactions': 0, 'failed_compactions': 0}
+        self._closed = False
+
+        os.makedirs(log_dir, exist_ok=True)
+        self.recover()
+        self._file = open(self.path, 'ab')
+        self._writer = threading.Thread(target=self._write_batches, name='wal-writer', daemon=True)
+        self._writer.start()
+        self._compactor = threading.Thread(target=self._compact_when_due, name='wal-compactor', daemon=True)
+        self._compactor.start()
+
+    def append(self, table, row):
+        """Durably record a new row for a table; returns once it is fsynced"""
+        line = json.dumps({'table': table, 'row': row}, default=str, separators=(',', ':')) + '\n'
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write-ahead log is closed")
+            self._sequence += 1
+            sequence = self._sequence
+            self._pending.append(line.encode('utf-8'))
+            self._cond.notify_all()
+            while self._durable < sequence and self._error is None:
+                self._cond.wait()
+            if self._error is not None:
+                raise self._error
+        return sequence
+
+    def append_unique(self, table, column, row, recorded=()):
+        """Append a row unless one with the same `column` value is recorded, logged or being logged
+
+        The check and the claim happen under one lock, so two sessions
+        saving the same key at once cannot both append. Returns the
+        sequence number, or None for a duplicate.
+        """
+        key = row[column]
+        logged = {logged_row.get(column) for logged_row in self.pending(table)}
+        with self._cond:
+            claimed = self._claimed.setdefault((table, column), set())
+            if key in claimed or key in logged or key in recorded:
+                return None
+            claimed.add(key)
+        try:
+            return self.append(table, row)
+        except Exception:
+            with self._cond:
+                claimed.discard(key)
+            raise
+
+    def allocate_id(self, table, column, floor=0):
+        """Get the next id for a table, above `floor` and every id already handed out"""
+        with self._cond:
+            key = (table, column)
+            next_id = max(int(floor), self._last_ids.get(key, 0)) + 1
+            self._last_ids[key] = next_id
+            return next_id
+
+    def pending(self, table=None):
+        """Get rows logged but not yet compacted, optionally for one table"""
+        with self._io_lock:
+            records = list(_read_records(self.path + '.compacting')) + list(_read_records(self.path))
+        return [row for name, row in records if table is None or name == table]
+
+    def stats(self):
+        """Get counts of records, fsynced batches and compactions so far, and the last compaction error"""
+        with self._cond:
+            return dict(self._stats, uncompacted=self._uncompacted, compact_error=self._compact_error)
+
+    def _write_batches(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed and not self._pending:
+                    return
+                # Without group commit each record gets its own write and fsync
+                take = len(self._pending) if self.group_commit else min(1, len(self._pending))
+                batch, self._pending = self._pending[:take], self._pending[take:]
+                last = self._durable + len(batch)
+
+            try:
+                with self._io_lock, _file_lock(self.path + '.rotate'):
+                    self._reopen_if_rotated()
+                    self._file.write(b''.join(batch))
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            except Exception as error:
+                # The log itself cannot be written (a full disk): nothing is
+                # durable any more, so every waiting and later append() raises
+                with self._cond:
+                    self._error = error
+                    self._cond.notify_all()
+                return
+
+            with self._cond:
+                self._durable = last
+                self._uncompacted += len(batch)
+                self._stats['records'] += len(batch)
+                self._stats['batches'] += 1
+                self._cond.notify_all()
+
+    def _reopen_if_rotated(self):
+        """Reopen the log if another process renamed it away since it was opened"""
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            current = None
+        if current is None or not os.path.samestat(current, os.fstat(self._file.fileno())):
+            self._file.close()
+            self._file = open(self.path, 'ab')
+
+    def _compact_when_due(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._due_for_compaction():
+                    self._cond.wait(timeout=self._wait_seconds())
+                if self._closed:
+                    # close() runs the last compaction itself
+                    return
+            self._try_compact()
+
+    def _try_compact(self):
+        """Compact, or on failure schedule a retry; the rows are already safe in the log"""
+        try:
+            self.compact()
+        except Exception as error:  # noqa: BLE001 - a locked database or a CSV error passes
+            with self._cond:
+                self._compact_error = f"{type(error).__name__}: {error}"
+                self._stats['failed_compactions'] += 1
+                self._retry_at = time.monotonic() + self._retry_delay
+                self._retry_delay = min(self._retry_delay * 2, max(self.compact_seconds, self.retry_seconds))
+        else:
+            with self._cond:
+                self._compact_error = None
+                self._retry_at = None
+                self._retry_delay = self.retry_seconds
+
+    def _wait_seconds(self):
+        if self._retry_at is None:
+            return self.compact_seconds
+        return max(0.0, min(self.compact_seconds, self._retry_at - time.monotonic()))
+
+    def _due_for_compaction(self):
+        if self._retry_at is not None:
+            return time.monotonic() >= self._retry_at
+        if not self._uncompacted:
+            return False
+        return (
+            self._uncompacted >= self.compact_every
+            or time.monotonic() - self._last_compacted >= self.compact_seconds
+        )
+
+    def compact(self):
+        """Fold every logged row into its table's CSV and start a fresh log"""
+        compacting = self.path + '.compacting'
+        with _file_lock(self.path + '.lock'):
+            # First the log a failed compaction left rotated, if any
+            self._fold(compacting)
+        with self._io_lock, _file_lock(self.path + '.rotate'):
+            # Rotate so new batches go to a fresh log while the old one is
+            # folded in; writers only wait for the rename, not the fold.
+            # Other processes reopen the fresh log before their next batch.
+            self._file.close()
+            if os.path.exists(self.path) and not os.path.exists(compacting):
+                os.replace(self.path, compacting)
+            self._file = open(self.path, 'ab')
+            with self._cond:
+                self._uncompacted = 0
+                self._last_compacted = time.monotonic()
+        with _file_lock(self.path + '.lock'):
+            self._fold(compacting)
+        with self._cond:
+            self._stats['compactions'] += 1
+
+    def recover(self):
+        """Finish a compaction interrupted by a crash and fold in any leftover log"""
+        compacting = self.path + '.compacting'
+        with _file_lock(self.path + '.lock'):
+            if os.path.exists(self.path + '.intent') and not os.path.exists(compacting):
+                # The fold finished; only its intent was left behind
+                os.remove(self.path + '.intent')
+            if os.path.exists(compacting):
+                self._fold(compacting)
+            with _file_lock(self.path + '.rotate'):
+                rotate = os.path.exists(self.path) and os.path.getsize(self.path)
+                if rotate:
+                    os.replace(self.path, compacting)
+            if rotate:
+                self._fold(compacting)
+
+    def _fold(self, compacting):
+        """Append a rotated log's rows to the store, guarded by an intent file
+
+        The intent records where each table ended before the append (a CSV's
+        size, a SQLite table's last rowid). It outlives the rotated log by one
+        step, so recovery can tell a half-done fold (both present: undo and
+        redo) from a finished one (intent only).
+        """
+        if not os.path.exists(compacting):
+            return
+        intent_path = self.path + '.intent'
+        intent = _read_json(intent_path)
+        if intent is not None:
+            # A fold cut short (a crash, or an error whose rollback failed
+            # too): undo its append so the rows are not written twice
+            self.store.undo_fold(intent)
+            os.remove(intent_path)
+
+        rows_by_table = {}
+        for table, row in _read_records(compacting):
+            rows_by_table.setdefault(table, []).append(row)
+
+        marker = self.store.fold_marker(list(rows_by_table))
+        _write_json(intent_path, marker)
+        try:
+            for table, rows in rows_by_table.items():
+                self.store.append_rows(table, rows)
+        except Exception:
+            # Roll back now, so readers of the store plus pending() do not
+            # see rows twice until the retry; if this fails the intent stays
+            self.store.undo_fold(marker)
+            os.remove(intent_path)
+            raise
+        os.remove(compacting)
+        os.remove(intent_path)
+
+    def close(self):
+        """Flush outstanding records, compact and stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._compactor.join()
+        self.compact()
+        self._file.close()
+
+
+def _read_records(path):
+    """Yield (table, row) from a log, skipping a torn last line"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            yield record['table'], record['row']
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, value):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(value, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class _file_lock:
+    """Exclusive lock on a file, so two processes never compact (or rotate and write) at once"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self._file = open(self.path, 'a')
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+
+
+_log = None
+_log_lock = threading.Lock()
+
+
+def get_write_log():
+    """Get the process-wide write-ahead log shared by every session"""
+    global _log
+    with _log_lock:
+        store = get_store()
+        if _log is not None and _log.store is not store:
+            # The backend was switched: flush everything into the old store first
+            _log.close()
+            _log = None
+        if _log is None:
+            _log = WriteAheadLog(store=store)
+        return _log